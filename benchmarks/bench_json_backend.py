@@ -0,0 +1,74 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+Compare the stdlib decoder/encoder against the active `json_backend` on extractor inputs.
+
+    python benchmarks/bench_json_backend.py [path_content] [repeat]
+"""
+
+import sys
+import json
+import gzip
+import time
+from os import path
+from pathlib import Path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+from contentai_metadata_flatten import json_backend
+
+PATH_TEST = path.join(path.dirname(path.dirname(path.abspath(__file__))), 'testing', 'data')
+
+
+def best_time(func, repeat):
+    """Return the best wall-clock time (seconds) of several calls"""
+    list_time = []
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        func()
+        list_time.append(time.perf_counter() - time_start)
+    return min(list_time)
+
+
+def main(path_content=PATH_TEST, repeat=5):
+    print(f"backend: {json_backend.BACKEND}, content: {path_content}")
+    print(f"{'file':<60} {'MB':>7} {'load-std':>9} {'load-new':>9} {'dump-std':>9} {'dump-new':>9}")
+    total = [0.0, 0.0, 0.0, 0.0]
+    for path_file in sorted(Path(path_content).rglob("*.json*")):
+        if path_file.suffix not in (".json", ".gz") or not path_file.is_file():
+            continue
+        try:
+            with (gzip.open(path_file, 'rb') if path_file.suffix == ".gz" else open(path_file, 'rb')) as infile:
+                data = infile.read()
+            obj = json.loads(data)
+        except (OSError, ValueError, UnicodeDecodeError):   # e.g. git-lfs pointers instead of real data
+            continue
+        list_time = [best_time(lambda: json.loads(data), repeat), best_time(lambda: json_backend.loads(data), repeat),
+                     best_time(lambda: json.dumps(obj), repeat), best_time(lambda: json_backend.dumps(obj), repeat)]
+        total = [a + b for a, b in zip(total, list_time)]
+        print(f"{str(path_file.relative_to(path_content)):<60} {len(data) / 1e6:7.2f} " +
+              " ".join(f"{x * 1000:8.1f}m" for x in list_time))
+    if total[0] > 0:
+        print(f"total load speedup: {total[0] / max(total[1], 1e-9):.2f}x, dump speedup: {total[2] / max(total[3], 1e-9):.2f}x")
+    else:
+        print("no decodable JSON found (are the test files fetched with git-lfs?)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else PATH_TEST, int(sys.argv[2]) if len(sys.argv) > 2 else 5)
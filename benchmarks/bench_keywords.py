@@ -0,0 +1,82 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+Time transcript keyword scanning (as in `dsai_metadata`) with `KeywordMatcher` against one substring test per keyword.
+
+    python benchmarks/bench_keywords.py [num_sentences] [repeat]
+"""
+
+import sys
+import time
+import random
+import string
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+from contentai_metadata_flatten.parsers import KeywordMatcher
+
+
+def best_time(func, repeat):
+    """Return the best wall-clock time (seconds) of several calls"""
+    list_time = []
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        func()
+        list_time.append(time.perf_counter() - time_start)
+    return min(list_time)
+
+
+def synthetic(num_keywords, num_sentences, seed=0):
+    """Random keywords (one or two words) and sentences of words drawn from a shared vocabulary"""
+    rnd = random.Random(seed)
+    list_vocab = ["".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(3, 9))) for _ in range(max(num_keywords, 1000))]
+    list_keywords = [" ".join(rnd.sample(list_vocab, rnd.randint(1, 2))).title() for _ in range(num_keywords)]
+    list_sentences = [" ".join(rnd.choices(list_vocab, k=rnd.randint(8, 30))).capitalize() + "." for _ in range(num_sentences)]
+    return list_keywords, list_sentences
+
+
+def scan_loop(list_keywords, list_sentences):
+    """Former scan: lowercase every keyword for every sentence and test it as a substring"""
+    list_found = []
+    for text in list_sentences:
+        lower_scan = text.lower()
+        list_found.append([idx for idx, keyword in enumerate(list_keywords) if keyword.lower() in lower_scan])
+    return list_found
+
+
+def scan_matcher(list_keywords, list_sentences):
+    """One compiled automaton, one pass per sentence"""
+    matcher = KeywordMatcher(list_keywords)
+    return [matcher.search(text) for text in list_sentences]
+
+
+def main(num_sentences=2000, repeat=3):
+    print(f"{'keywords':>9} {'sentences':>10} {'loop':>9} {'matcher':>9} {'speedup':>8}")
+    for num_keywords in [10, 100, 1000, 10000]:
+        list_keywords, list_sentences = synthetic(num_keywords, num_sentences)
+        if scan_loop(list_keywords, list_sentences) != scan_matcher(list_keywords, list_sentences):
+            raise ValueError(f"Keyword matches differ for {num_keywords} keywords")
+        time_loop = best_time(lambda: scan_loop(list_keywords, list_sentences), repeat)
+        time_matcher = best_time(lambda: scan_matcher(list_keywords, list_sentences), repeat)
+        print(f"{num_keywords:>9} {num_sentences:>10} {time_loop:8.3f}s {time_matcher:8.3f}s {time_loop / max(time_matcher, 1e-9):7.1f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:3]])
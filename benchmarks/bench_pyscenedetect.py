@@ -0,0 +1,98 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+Time the `pyscenedetect` parser on a synthetic frame stats file against the former per-scene loop.
+
+    python benchmarks/bench_pyscenedetect.py [num_frames] [num_scenes] [repeat]
+"""
+
+import sys
+import time
+import logging
+import random
+import shutil
+import tempfile
+from os import path
+from pathlib import Path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+from contentai_metadata_flatten.parsers.pyscenedetect import Parser
+
+
+def best_time(func, repeat):
+    """Return the best wall-clock time (seconds) of several calls"""
+    list_time = []
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        func()
+        list_time.append(time.perf_counter() - time_start)
+    return min(list_time)
+
+
+def write_synthetic(path_root, num_frames, num_scenes, fps=30, seed=0):
+    """Write `stats.csv` and `scenes.csv` for contiguous scenes of random length (as PySceneDetect emits them)"""
+    rnd = random.Random(seed)
+    path_dir = Path(path_root).joinpath("pyscenedetect")
+    path_dir.mkdir(parents=True, exist_ok=True)
+    list_stats = ["Video Path,synthetic.mp4", "Frame Number,Timecode,content_val,delta_hue,delta_lum,delta_sat"]
+    for idx in range(num_frames):
+        list_stats.append(f"{idx + 1},00:00:00.000,{rnd.random() * 10:.3f},{rnd.random():.3f},{rnd.random():.3f},{rnd.random():.3f}")
+    list_scenes = ["Timecode List:,00:00:00.000",
+                   "Scene Number,Start Frame,Start Timecode,Start Time (seconds),End Frame,End Timecode,End Time (seconds),"
+                   "Length (frames),Length (timecode),Length (seconds)"]
+    list_cut = [0] + sorted(rnd.sample(range(1, num_frames), num_scenes - 1)) + [num_frames]
+    for idx in range(num_scenes):
+        frame_begin, frame_end = list_cut[idx], list_cut[idx + 1]
+        list_scenes.append(f"{idx + 1},{frame_begin},00:00:00.000,{frame_begin / fps:.3f},{frame_end},00:00:00.000,"
+                           f"{frame_end / fps:.3f},{frame_end - frame_begin},00:00:00.000,{(frame_end - frame_begin) / fps:.3f}")
+    path_dir.joinpath("stats.csv").write_text("\n".join(list_stats) + "\n")
+    path_dir.joinpath("scenes.csv").write_text("\n".join(list_scenes) + "\n")
+
+
+def parse_loop(parser, run_options):
+    """Former aggregation: one mask over all frames and one `agg` for every scene"""
+    df_frames = parser.retrieve_output("stats.csv", run_options)
+    df_scenes = parser.retrieve_output("scenes.csv", run_options)
+    list_details = []
+    for row_idx, row_data in df_scenes.iterrows():
+        df_frame_sub = df_frames[(df_frames["Frame Number"] >= int(row_data["Start Frame"])) & \
+                                 (df_frames["Frame Number"] < int(row_data["End Frame"]))]
+        df_frame_agg = df_frame_sub[Parser.COLUMNS_STATS].agg(["mean", "min", "max"]).unstack()
+        df_frame_agg.index = ['_'.join(x) for x in list(df_frame_agg.index.to_flat_index())]
+        list_details.append(df_frame_agg.round(parser.ROUND_DIGITS).to_dict())
+    return list_details
+
+
+def main(num_frames=200000, num_scenes=1500, repeat=3):
+    path_root = tempfile.mkdtemp()
+    try:
+        write_synthetic(path_root, num_frames, num_scenes)
+        parser = Parser(path_root, logger=logging.getLogger(__name__))   # quiet default logger
+        run_options = dict(parser.default_config(), verbose=False)
+        time_new = best_time(lambda: parser.parse(run_options), repeat)
+        time_loop = best_time(lambda: parse_loop(parser, run_options), 1)
+        print(f"frames: {num_frames}, scenes: {num_scenes}")
+        print(f"per-scene loop: {time_loop:.3f}s, single pass: {time_new:.3f}s, speedup: {time_loop / max(time_new, 1e-9):.1f}x")
+    finally:
+        shutil.rmtree(path_root)
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:4]])
@@ -0,0 +1,190 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+Time and measure the peak memory of every parser and generator on synthetic extractor outputs (see `synthetic.py`) 
+at several scales of the sample data, and optionally save the results as a baseline or compare against one.
+
+    python benchmarks/bench_suite.py [--scales 1 10 100] [--extractor NAME] [--generator NAME] [--repeat 3]
+                                     [--save baseline.json] [--compare baseline.json] [--tolerance 0.25]
+
+Synthetic inputs are written once per scale and seed under `--path_data` and reused.  Each measurement is the best 
+of `--repeat` runs for time, plus one run tracing allocations for peak memory.  With `--compare`, runs slower than 
+the baseline by more than the tolerance (and `--min_seconds`) are listed and the exit status is 1.
+"""
+
+import sys
+import argparse
+import logging
+import shutil
+import tempfile
+from os import path
+from pathlib import Path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+from contentai_metadata_flatten import parsers, generators, metrics, json_backend
+import synthetic
+
+KEYS = ["kind", "name", "scale"]   # identify one measurement across runs
+
+
+def synthetic_data(path_data, scale, seed=0):
+    """Return the directory of synthetic inputs for a scale, generating them on first use"""
+    path_scale = Path(path_data).joinpath(f"scale_{scale:g}_seed_{seed}")
+    path_done = path_scale.joinpath(".complete")
+    if not path_done.exists():   # (re)generate partial or missing data
+        shutil.rmtree(path_scale, ignore_errors=True)
+        synthetic.generate(path_scale, scale=scale, seed=seed)
+        path_done.touch()
+    return str(path_scale)
+
+
+def measure(func, repeat):
+    """Best wall time (with its CPU time) of several calls and the traced peak memory of one more
+
+    :param func: (function): work to measure; called `repeat + 1` times
+    :param repeat: (int): number of timed calls
+    :return: tuple.  Measurements (dict) and the result of the last call
+    """
+    profiler = metrics.Profiler()
+    for _ in range(repeat):
+        with profiler.stage("timed"):
+            result = func()
+    profiler_memory = metrics.Profiler(trace_memory=True).start()
+    with profiler_memory.stage("memory"):
+        result = func()
+    profiler_memory.stop()
+    record_best = min(profiler.records, key=lambda record: record["wall_s"])
+    return {"wall_s": record_best["wall_s"], "cpu_s": record_best["cpu_s"], 
+            "mem_peak_bytes": profiler_memory.records[0]["mem_peak_bytes"]}, result
+
+
+def bench_parsers(path_source, scale, name_extractor=None, repeat=3, logger=None):
+    """Measure each parser on one directory of inputs
+
+    :return: tuple.  Records (list of dict) and the events of each parser (dict of DataFrame) for generators
+    """
+    parsers.DirectoryIndex.get(path_source, refresh=True)
+    list_records, dict_frames = [], {}
+    for parser_obj in parsers.get_by_name(name_extractor):
+        def parse():
+            return parser_obj['obj'](path_source, logger=logger).parse({"verbose": False})
+        record, df = measure(parse, repeat)
+        if df is None:
+            continue
+        parsers.categorize(df)
+        dict_frames[parser_obj['name']] = df
+        list_records.append({"kind": "parser", "name": parser_obj['name'], "scale": scale, "rows": len(df), **record})
+    return list_records, dict_frames
+
+
+def bench_generators(dict_frames, scale, name_generator=None, repeat=3, logger=None):
+    """Measure each generator writing the events of every parser, in order, to a new directory (as `main.flatten`)
+
+    :return: list.  Records (dict) of each generator
+    """
+    list_records = []
+    config = {"verbose": False, "compressed": True, "incremental": False}
+    for generator_obj in generators.get_by_name(name_generator):
+        def generate():
+            path_result = tempfile.mkdtemp()
+            try:
+                generator_instance = generator_obj['obj'](path_result, logger=logger)
+                num_items = 0
+                for name_parser, df in dict_frames.items():
+                    path_output = generator_instance.get_output_path(name_parser)
+                    if generator_instance.is_compressible:
+                        path_output += ".gz"
+                    num_items += generator_instance.generate(path_output, config, df) or 0
+                return num_items
+            finally:
+                shutil.rmtree(path_result)
+        record, num_items = measure(generate, repeat)
+        list_records.append({"kind": "generator", "name": generator_obj['name'], "scale": scale, "rows": num_items, **record})
+    return list_records
+
+
+def compare(list_records, list_baseline, tolerance=0.25, min_seconds=0.05):
+    """Match records to a baseline and find regressions in wall time
+
+    :param tolerance: (float): allowed slowdown as a fraction of the baseline time
+    :param min_seconds: (float): ignore slowdowns smaller than this many seconds (timer noise)
+    :return: tuple.  Rows (list of dict) of matched records with time ratios, and the regressed rows
+    """
+    dict_baseline = {tuple(record[key] for key in KEYS): record for record in list_baseline}
+    list_rows, list_regressed = [], []
+    for record in list_records:
+        record_base = dict_baseline.get(tuple(record[key] for key in KEYS))
+        if record_base is None:
+            continue
+        row = {**{key: record[key] for key in KEYS}, "base_s": record_base["wall_s"], "wall_s": record["wall_s"],
+               "ratio": record["wall_s"] / max(record_base["wall_s"], 1e-9)}
+        list_rows.append(row)
+        if record["wall_s"] > record_base["wall_s"] * (1 + tolerance) and record["wall_s"] - record_base["wall_s"] > min_seconds:
+            list_regressed.append(row)
+    return list_rows, list_regressed
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=float, nargs='+', default=[1, 10, 100], help='multiples of the sample data size')
+    parser.add_argument('--extractor', type=str, default=None, help='benchmark one parser (default=all)')
+    parser.add_argument('--generator', type=str, default=None, help='benchmark one generator (default=all, empty=none)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs of each measurement (best is kept)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed of the synthetic inputs')
+    parser.add_argument('--path_data', type=str, default=path.join(tempfile.gettempdir(), "metadata_flatten_bench"), 
+                        help='directory for synthetic inputs, reused between runs')
+    parser.add_argument('--save', type=str, default="", help='write results to this JSON file (e.g. a new baseline)')
+    parser.add_argument('--compare', type=str, default="", help='compare against results saved with `--save`')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown against the baseline (fraction)')
+    parser.add_argument('--min_seconds', type=float, default=0.05, help='ignore slowdowns shorter than this')
+    config = vars(parser.parse_args(args))
+    logger = logging.getLogger(__name__)   # keep library logging quiet
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    list_records = []
+    print(f"{'kind':>9} {'name':>41} {'scale':>6} {'rows':>9} {'wall':>9} {'cpu':>9} {'memory':>10}")
+    for scale in config['scales']:
+        path_source = synthetic_data(config['path_data'], scale, config['seed'])
+        list_scale, dict_frames = bench_parsers(path_source, scale, config['extractor'] or None, config['repeat'], logger)
+        if config['generator'] != "":
+            list_scale += bench_generators(dict_frames, scale, config['generator'], config['repeat'], logger)
+        for record in list_scale:
+            print(f"{record['kind']:>9} {record['name']:>41} {record['scale']:>6g} {record['rows']:>9} {record['wall_s']:8.3f}s "
+                  f"{record['cpu_s']:8.3f}s {record['mem_peak_bytes'] / 2**20:8.1f}MB")
+        list_records += list_scale
+
+    if config['save']:
+        json_backend.save_file(config['save'], list_records, pretty_print=True)
+        print(f"Saved {len(list_records)} results to '{config['save']}'")
+    if config['compare']:
+        list_rows, list_regressed = compare(list_records, json_backend.load_file(config['compare']), 
+                                            config['tolerance'], config['min_seconds'])
+        print(f"\n{'kind':>9} {'name':>41} {'scale':>6} {'baseline':>9} {'wall':>9} {'ratio':>7}")
+        for row in list_rows:
+            print(f"{row['kind']:>9} {row['name']:>41} {row['scale']:>6g} {row['base_s']:8.3f}s {row['wall_s']:8.3f}s "
+                  f"{row['ratio']:6.2f}x{'  REGRESSED' if row in list_regressed else ''}")
+        print(f"{len(list_regressed)} of {len(list_rows)} measurements regressed (tolerance {config['tolerance']:.0%})")
+        return 1 if list_regressed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+Synthetic extractor outputs (the input schema of every parser) with a fixed seed, at a scale relative to the 
+sample data, for benchmarks that need more events than `testing/data` holds.
+
+    python benchmarks/synthetic.py path/to/dir [scale] [seed]
+"""
+
+import sys
+import json
+import gzip
+import random
+from pathlib import Path
+
+# a small vocabulary so that tags repeat like they do in real extractor output
+WORDS = ["person", "car", "dog", "cat", "tree", "building", "sky", "road", "chair", "table",
+         "phone", "screen", "bottle", "glass", "hat", "shirt", "water", "fire", "smoke", "light",
+         "news", "sports", "music", "kitchen", "office", "street", "night", "beach", "city", "forest"]
+NAMES = ["Ada Lovelace", "Alan Turing", "Grace Hopper", "Claude Shannon", "Katherine Johnson",
+         "John von_Neumann", "Barbara Liskov", "Edsger Dijkstra"]
+# nominal per-extractor event counts at scale 1 (roughly the size of the sample data)
+BASE_COUNT = 200
+
+
+def _write_json(path_file, dict_data):
+    """Write a gzipped JSON file, creating its directory"""
+    path_file.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(str(path_file), 'wt') as f:
+        json.dump(dict_data, f)
+
+
+def _write_text(path_file, str_data):
+    """Write a plain text file, creating its directory"""
+    path_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(str(path_file), 'wt') as f:
+        f.write(str_data)
+
+
+def _box(rnd):
+    """Random AWS-style box inside the frame"""
+    l, t = rnd.random() * 0.8, rnd.random() * 0.8
+    return {"Width": rnd.random() * (1 - l), "Height": rnd.random() * (1 - t), "Left": l, "Top": t}
+
+
+def _box_lower(rnd):
+    """Random box with lowercase keys (yolo3, detectron2)"""
+    return {k.lower(): v for k, v in _box(rnd).items()}
+
+
+def _box_ltrb(rnd):
+    """Random GCP-style box by edges"""
+    box = _box(rnd)
+    return {"left": box["Left"], "top": box["Top"], "right": box["Left"] + box["Width"], "bottom": box["Top"] + box["Height"]}
+
+
+def _timecode(seconds):
+    """Azure-style H:MM:SS.fffffff timecode (whole seconds are emitted without a fraction)"""
+    hours, rem = divmod(seconds, 3600)
+    minutes, rem = divmod(rem, 60)
+    if rem == int(rem):
+        return f"{int(hours)}:{int(minutes):02d}:{int(rem):02d}"
+    return f"{int(hours)}:{int(minutes):02d}:{rem:010.7f}"
+
+
+def _sentence(rnd, num_words=8):
+    """Random sentence from the shared vocabulary"""
+    return " ".join(rnd.choice(WORDS) for _ in range(num_words))
+
+
+def _pages(path_root, extractor, key, list_items, per_page):
+    """Split items over numbered result pages (`result0.json.gz`, ...) as AWS Rekognition does"""
+    for idx_page, idx_start in enumerate(range(0, len(list_items), per_page)):
+        _write_json(path_root.joinpath(extractor, f"result{idx_page}.json.gz"),
+                    {key: list_items[idx_start:idx_start + per_page]})
+
+
+def aws_rekognition(path_root, rnd, num):
+    """Paged results of the AWS Rekognition video extractors"""
+    per_page = max(1, num // 4)   # always produce a handful of pages
+    _pages(path_root, "aws_rekognition_video_labels", "Labels", [
+        {"Timestamp": i * 200, "Label": {"Name": rnd.choice(WORDS), "Confidence": rnd.random() * 100,
+            "Instances": [{"BoundingBox": _box(rnd), "Confidence": rnd.random() * 100} for _ in range(rnd.randint(0, 2))],
+            "Parents": [{"Name": rnd.choice(WORDS)}] if rnd.random() > 0.5 else []}} for i in range(num)], per_page)
+    _pages(path_root, "aws_rekognition_video_faces", "Faces", [
+        {"Timestamp": i * 200, "Face": {"BoundingBox": _box(rnd), "Confidence": rnd.random() * 100,
+            "Pose": {"Roll": rnd.random(), "Yaw": rnd.random(), "Pitch": rnd.random()},
+            "AgeRange": {"Low": 20, "High": 30},
+            "Smile": {"Value": rnd.random() > 0.5, "Confidence": rnd.random() * 100},
+            "Eyeglasses": {"Value": rnd.random() > 0.5, "Confidence": rnd.random() * 100},
+            "Gender": {"Value": rnd.choice(["Male", "Female"]), "Confidence": rnd.random() * 100},
+            "Emotions": [{"Type": e, "Confidence": rnd.random() * 100} for e in ["HAPPY", "SAD", "CALM"]]}}
+        for i in range(num)], per_page)
+    _pages(path_root, "aws_rekognition_video_celebs", "Celebrities", [
+        {"Timestamp": i * 200, "Celebrity": {"Name": rnd.choice(NAMES), "Confidence": rnd.random() * 100,
+            "BoundingBox": _box(rnd), "Urls": ["www.imdb.com/name/nm0000001"] if rnd.random() > 0.5 else []}}
+        for i in range(num)], per_page)
+    _pages(path_root, "aws_rekognition_video_content_moderation", "ModerationLabels", [
+        {"Timestamp": i * 200, "ModerationLabel": {"Confidence": rnd.random() * 100, "Name": rnd.choice(["Suggestive", "Violence"]),
+            "ParentName": rnd.choice(["", "Explicit Nudity"])}} for i in range(num)], per_page)
+    _pages(path_root, "aws_rekognition_video_person_tracking", "Persons", [
+        {"Timestamp": i * 200, "Person": {"Index": rnd.randint(0, 5), "BoundingBox": _box(rnd),
+            "Face": {"BoundingBox": _box(rnd)} if rnd.random() > 0.5 else {}}} for i in range(num)], per_page)
+    _pages(path_root, "aws_rekognition_video_text_detect", "TextDetections", [
+        {"Timestamp": i * 200, "TextDetection": {"DetectedText": _sentence(rnd, 3), "Type": rnd.choice(["LINE", "WORD"]),
+            "Confidence": rnd.random() * 100, "Geometry": {"BoundingBox": _box(rnd)}}} for i in range(num)], per_page)
+    _pages(path_root, "aws_rekognition_face_collection", "Persons", [
+        {"Timestamp": i * 200, "FaceMatches": [{"Similarity": rnd.random() * 100, "Face": {"Confidence": rnd.random() * 100,
+            "BoundingBox": _box(rnd), "ExternalImageId": f"faces_{rnd.choice(NAMES).replace(' ', '_')}{rnd.randint(0, 40)}.jpg"}}
+            for _ in range(rnd.randint(1, 3))]} for i in range(num)], per_page)
+
+
+def aws_transcribe(path_root, rnd, num):
+    """AWS Transcribe items and speaker segments"""
+    list_items = []
+    for i in range(num):
+        list_items.append({"start_time": f"{i * 0.5:.2f}", "end_time": f"{i * 0.5 + 0.4:.2f}", "type": "pronunciation",
+                           "alternatives": [{"confidence": f"{rnd.random():.4f}", "content": rnd.choice(WORDS)}]})
+        if i % 7 == 6:
+            list_items.append({"type": "punctuation", "alternatives": [{"confidence": "0.0", "content": "."}]})
+    segments = [{"start_time": f"{i * 5:.2f}", "end_time": f"{i * 5 + 4.5:.2f}", "speaker_label": f"spk_{i % 3}"}
+                for i in range(max(1, num // 10))]
+    _write_json(path_root.joinpath("aws_transcribe", "data.json.gz"), {"results": {
+        "transcripts": [{"transcript": _sentence(rnd, 30)}], "items": list_items, "speaker_labels": {"segments": segments}}})
+
+
+def azure_videoindexer(path_root, rnd, num):
+    """Azure Video Indexer insights with timecoded instances"""
+    def instances(count, step=2.0, confidence=False):
+        list_inst = []
+        for i in range(count):
+            time_begin = rnd.randint(0, num) * step + rnd.choice([0, 0.5, 0.1234567])
+            inst = {"start": _timecode(time_begin), "end": _timecode(time_begin + step), "instanceSource": rnd.choice(["Ocr", "Transcript"])}
+            if confidence:
+                inst["confidence"] = rnd.random()
+            list_inst.append(inst)
+        return list_inst
+    count = max(1, num // 10)
+    insights = {
+        "faces": [{"name": n, "title": "title", "description": "desc", "imageUrl": "http://x/y.jpg", "confidence": rnd.random(),
+                   "instances": instances(count)} for n in NAMES + ["Unknown #1"]],
+        "keywords": [{"name": w, "instances": instances(2)} for w in WORDS[:5]],
+        "sentiments": [{"sentimentType": s, "averageScore": rnd.random(), "instances": instances(count)} for s in ["Positive", "Neutral"]],
+        "emotions": [{"type": e, "instances": instances(count, confidence=True)} for e in ["Joy", "Fear"]],
+        "audioEffects": [{"type": "Silence", "instances": instances(count)}],
+        "labels": [{"name": w, "referenceId": w, "instances": instances(count, confidence=True)} for w in WORDS[:10]],
+        "framePatterns": [{"patternType": "Black", "confidence": rnd.random(), "instances": instances(count)}],
+        "brands": [{"name": "Acme", "referenceUrl": "http://acme", "description": "acme corp", "confidence": rnd.random(),
+                    "instances": instances(count)}],
+        "namedLocations": [{"name": "Paris", "referenceUrl": "http://paris", "description": "city", "confidence": rnd.random(),
+                            "instances": instances(count)}],
+        "namedPeople": [{"name": NAMES[0], "referenceUrl": "http://ada", "description": "person", "confidence": rnd.random(),
+                         "instances": instances(count)}],
+        "visualContentModeration": [{"adultScore": rnd.random(), "racyScore": rnd.random() * 0.01, "instances": instances(1)}
+                                    for _ in range(count)],
+        "transcript": [{"text": _sentence(rnd), "confidence": rnd.random(), "instances": instances(1)} for _ in range(num)],
+        "speakers": [{"id": i, "instances": instances(count)} for i in range(3)],
+        "ocr": [{"text": _sentence(rnd, 2), "confidence": rnd.random(), "left": rnd.random(), "top": rnd.random(),
+                 "width": rnd.random(), "height": rnd.random(), "instances": instances(1)} for _ in range(count)],
+        "shots": [{"tags": ["Wide"], "keyFrames": [{"instances": instances(1)}] if i else [], "instances": instances(1)} for i in range(num)],
+        "scenes": [{"instances": instances(1, step=20.0)} for _ in range(count)],
+    }
+    _write_json(path_root.joinpath("azure_videoindexer", "data.json.gz"), {
+        "summarizedInsights": {"topics": [{"name": w, "confidence": rnd.random(), "iabName": "IAB1", "iptcName": None,
+            "referenceUrl": "http://t", "appearances": [{"startSeconds": i * 3.0, "endSeconds": i * 3.0 + 2}
+            for i in range(count)]} for w in WORDS[:5]]},
+        "videos": [{"insights": insights}]})
+
+
+def gcp_videointelligence(path_root, rnd, num):
+    """GCP Video Intelligence `annotationResults` of each feature"""
+    def offset(seconds):
+        return f"{seconds:.6f}s"
+    _write_json(path_root.joinpath("gcp_videointelligence_explicit_content", "data.json.gz"), {"annotationResults": [
+        {"explicitAnnotation": {"frames": [{"timeOffset": offset(i * 0.5), "pornographyLikelihood": rnd.choice(list(
+            ["VERY_UNLIKELY", "UNLIKELY", "POSSIBLE", "LIKELY"]))} for i in range(num)]}}]})
+    _write_json(path_root.joinpath("gcp_videointelligence_label", "data.json.gz"), {"annotationResults": [
+        {"segmentLabelAnnotations": [{"entity": {"entityId": f"/m/{w}", "description": w},
+            "categoryEntities": [{"entityId": "/m/cat", "description": "category"}],
+            "segments": [{"segment": {"startTimeOffset": offset(0), "endTimeOffset": offset(num)}, "confidence": rnd.random()}]}
+            for w in WORDS],
+         "shotLabelAnnotations": [{"entity": {"entityId": f"/m/{rnd.choice(WORDS)}", "description": rnd.choice(WORDS)},
+            "segments": [{"segment": {"startTimeOffset": offset(i), "endTimeOffset": offset(i + 1)}, "confidence": rnd.random()}]}
+            for i in range(num)]}]})
+    _write_json(path_root.joinpath("gcp_videointelligence_logo_recognition", "data.json.gz"), {"annotationResults": [
+        {"logoRecognitionAnnotations": [{"entity": {"entityId": "/m/logo", "description": rnd.choice(["Acme", "Initech"])},
+            "tracks": [{"segment": {"startTimeOffset": offset(i), "endTimeOffset": offset(i + 1.5)}, "confidence": rnd.random(),
+                "timestampedObjects": [{"normalizedBoundingBox": _box_ltrb(rnd), "timeOffset": offset(i + j * 0.25)} for j in range(5)]}]}
+            for i in range(max(1, num // 4))]}]})
+    _write_json(path_root.joinpath("gcp_videointelligence_object_tracking", "data.json.gz"), {"annotationResults": [
+        {"segment": {"startTimeOffset": offset(0), "endTimeOffset": offset(num)},
+         "objectAnnotations": [{"entity": {"entityId": "/m/obj", "description": rnd.choice(WORDS)},
+            "frames": [{"normalizedBoundingBox": _box_ltrb(rnd), "timeOffset": offset(i + j * 0.125)} for j in range(6)],
+            "segment": {"startTimeOffset": offset(i), "endTimeOffset": offset(i + 0.75)}, "confidence": rnd.random()}
+            for i in range(num)]}]})
+    _write_json(path_root.joinpath("gcp_videointelligence_people_detection", "data.json.gz"), {"annotationResults": [
+        {"segment": {"startTimeOffset": offset(0), "endTimeOffset": offset(num)},
+         "personDetectionAnnotations": [{"tracks": [{"segment": {"startTimeOffset": offset(i), "endTimeOffset": offset(i + 0.75)},
+            "timestampedObjects": [{"normalizedBoundingBox": _box_ltrb(rnd), "timeOffset": offset(i + j * 0.25),
+                "attributes": [{"name": "UpperCloth", "confidence": rnd.random(), "value": "Plain"}],
+                "landmarks": [{"name": n, "point": {"x": rnd.random(), "y": rnd.random()}, "confidence": rnd.random()}
+                              for n in ["left_ear", "nose"]]} for j in range(3)]}]} for i in range(max(1, num // 4))]}]})
+    _write_json(path_root.joinpath("gcp_videointelligence_shot_change", "data.json.gz"), {"annotationResults": [
+        {"shotAnnotations": [{"startTimeOffset": offset(i * 4), "endTimeOffset": offset(i * 4 + 3.9)} for i in range(num)]}]})
+    words = [{"startTime": offset(i * 0.5), "endTime": offset(i * 0.5 + 0.5), "word": rnd.choice(WORDS),
+              "confidence": rnd.random(), "speakerTag": (i // 5) % 3} for i in range(num)]
+    _write_json(path_root.joinpath("gcp_videointelligence_speech_transcription", "data.json.gz"), {"annotationResults": [
+        {"speechTranscriptions": [{"alternatives": [{"transcript": _sentence(rnd), "confidence": rnd.random(),
+            "words": words[i:i + 10]}]} for i in range(0, num, 10)]}]})
+    _write_json(path_root.joinpath("gcp_videointelligence_text_detection", "data.json.gz"), {"annotationResults": [
+        {"textAnnotations": [{"text": rnd.choice(WORDS), "segments": [{"segment": {"startTimeOffset": offset(i), "endTimeOffset": offset(i + 0.25)},
+            "confidence": rnd.random(), "frames": [{"rotatedBoundingBox": {"vertices": [{"x": rnd.random(), "y": rnd.random()}
+            for _ in range(4)]}, "timeOffset": offset(i)}]}]} for i in range(num)]}]})
+
+
+def dsai(path_root, rnd, num):
+    """dsai CSV and JSON results, IBM MAX audio and comskip"""
+    def csv_categories(column_first, num_categories=3):
+        list_lines = [f"{column_first},Time_begin,Time_end,Time_event," +
+                      ",".join(f"category{i},score{i}" for i in range(num_categories))]
+        for i in range(num):
+            list_lines.append(f"clip_{i:05d}.mp4,{i * 2.0:.2f},{i * 2.0 + 2:.2f},{i * 2.0:.2f}," +
+                              ",".join(f"{rnd.choice(WORDS)},{rnd.random()}" for _ in range(num_categories)))
+        return "\n".join(list_lines) + "\n"
+    _write_text(path_root.joinpath("dsai_activity_slowfast", "results.csv"), csv_categories("video_clip"))
+    _write_text(path_root.joinpath("dsai_yt8m", "results.csv"), csv_categories("video_clip", 5))
+    for extractor in ["dsai_activity_classifier", "dsai_activity_emotions"]:
+        _write_json(path_root.joinpath(extractor, "data.json.gz"), {"config": {}, "results": [
+            {"time_begin": i * 1.5, "time_end": i * 1.5 + 1.5, "type_audio": rnd.choice(["", "dsai_vggish"]),
+             "type_video": rnd.choice(["", "dsai_videocnn"]), "score": rnd.random(), "class": rnd.choice(WORDS)} for i in range(num)]})
+    _write_json(path_root.joinpath("dsai_moderation_image", "data.json.gz"), {"config": {}, "results": [
+        {"scores": {k: f"{rnd.random():.6f}" for k in ["sexy", "drawings", "hentai", "neutral", "porn"]},
+         "time_event": i * 0.96, "time_frame": i * 24} for i in range(num)]})
+    _write_json(path_root.joinpath("dsai_moderation_text", "data.json.gz"), {"config": {}, "results": [
+        {"begin": i * 4.0, "end": i * 4.0 + 3.5, "text": _sentence(rnd), "source": "speech", "extractor": "azure_videoindexer",
+         "scores": {k: rnd.random() for k in ["toxic", "obscene", "insult"]}} for i in range(num)]})
+    _write_json(path_root.joinpath("dsai_musicnn", "data.json.gz"), dict(
+        timing=[{"id": i, "start": i * 3.0, "duration": 3.0} for i in range(num)],
+        **{model: [dict(id=i, **{w: rnd.random() for w in WORDS[:5]}) for i in range(num)] for model in ["MTT_musicnn", "MSD_musicnn"]}))
+    _write_json(path_root.joinpath("dsai_places", "data.json.gz"), {"config": {}, "results": [
+        {"time_event": i * 0.96, "index_frame": i * 24, "scores": {w: rnd.random() for w in rnd.sample(WORDS, 5)}} for i in range(num)]})
+    shots = [{"id": i, "time_begin": i * 4.0, "time_end": i * 4.0 + 3.9} for i in range(num)]
+    _write_json(path_root.joinpath("dsai_sceneboundary", "data.json.gz"), {"shots": shots, "annotations": [
+        {"annotator": {"name": "sceneboundary", "timestamp": "2020-06-03"}, "classifier": {"threshold": 0.5, "frame_position": "middle"},
+         "segments": [{"id": i, "shots": list(range(i, min(i + 5, num))), "score": rnd.random()} for i in range(0, num, 5)]}]})
+    _write_json(path_root.joinpath("ibm_max_audio_classifier", "data.json.gz"), {
+        f"{i // 3600:02d}:{(i // 60) % 60:02d}:{i % 60:02d}": [{"label_id": f"/m/{w}", "label": w, "probability": rnd.random()}
+        for w in rnd.sample(WORDS, 5)] for i in range(num)})
+    _write_json(path_root.joinpath("comskip_json", "data.json.gz"), {"commercials": [
+        {"start": i * 300.0 + rnd.random(), "end": i * 300.0 + 120 + rnd.random()} for i in range(max(1, num // 20))]})
+
+
+def dsai_metadata(path_root, rnd, num):
+    """dsai_metadata document (transcript, images with faces/logos/objects, regions)"""
+    keywords = sorted(set(WORDS + [f"{a} {b}" for a, b in zip(WORDS, WORDS[1:])]))
+    sent = [{"number": i, "start": i * 4000, "duration": 3500, "text": _sentence(rnd, 12),
+             "ccstart": i * 4000, "ccduration": 3500} for i in range(num)]
+    images = []
+    for i in range(num):
+        images.append({"id": i, "start": i * 2000, "type": rnd.choice(["wide", "closeup"]),
+            "face": [{"x": rnd.randint(0, 600), "y": rnd.randint(0, 300), "w": 40, "h": 60,
+                      "rec": {"name": rnd.choice(NAMES).replace(" ", "_"), "confidence": rnd.random()},
+                      "cluster": {"id": rnd.randint(0, 9), "score": rnd.random()}}],
+            "logo": [{"name": "acme_corp", "score": rnd.random(), "x": 10, "y": 10, "w": 50, "h": 20}],
+            "object": [{"name": rnd.choice(WORDS), "score": rnd.random(), "x": 100, "y": 50, "w": 80, "h": 90}],
+            "concept": [{"name": rnd.choice(WORDS), "score": rnd.random()}],
+            "kfcluster": {"score": rnd.random() * 3, "id": 2} if i % 3 else {}})
+    regions = [{"start": i * 10000, "duration": 10000, "concepts": [{"name": rnd.choice(WORDS), "score": rnd.random()}]}
+               for i in range(max(1, num // 5))]
+    _write_json(path_root.joinpath("dsai_metadata", "metadata.json.gz"), {
+        "keywords": keywords, "duration": num * 2000,
+        "smartTags": {"programNE": [{"neType": "PERSON", "namedEntity": n, "neLabel": "person", "weight": 1.0,
+                                     "sentNumber": [str(rnd.randint(0, num - 1)) for _ in range(3)]} for n in NAMES]},
+        "sent": sent, "silence": [{"start": i * 8000, "duration": 500} for i in range(max(1, num // 10))],
+        "audio": {"regions": regions}, "tms": {"regions": regions}, "iab": {"regions": regions},
+        "commercial": [{"start": 0, "duration": 30000}],
+        "mmimg": {"width": 640, "height": 360, "images": images},
+        "mmpara": [{"start": i * 20000, "duration": 20000, "sentstart": i * 5, "sentend": i * 5 + 4} for i in range(max(1, num // 5))]})
+
+
+def frames_detect(path_root, rnd, num):
+    """Per-frame detections of detectron2 and yolo3"""
+    _write_json(path_root.joinpath("detectron2", "data.json.gz"), [
+        {"milliseconds": i * 41.7, "frameNumber": i, "results": {"boxes": [
+            {"name": rnd.choice(WORDS), "confidence": rnd.random(), "boundingBox": _box_lower(rnd)} for _ in range(3)]}}
+        for i in range(num)])
+    _write_json(path_root.joinpath("yolo3", "data.json.gz"), [
+        {"milliseconds": i * 41.7, "frameNumber": i, "results": [{"objects": [
+            {"name": rnd.choice(WORDS), "confidence": rnd.random(), "boundingBox": _box_lower(rnd)} for _ in range(3)]}]}
+        for i in range(num)])
+
+
+def pyscenedetect(path_root, rnd, num, frames_per_scene=120):
+    """pyscenedetect frame statistics and scene list CSVs"""
+    num_frames = num * frames_per_scene
+    list_stats = ["Video Path,synthetic.mp4", "Frame Number,Timecode,content_val,delta_hue,delta_lum,delta_sat"]
+    for i in range(num_frames):
+        list_stats.append(f"{i + 1},00:00:00.000,{rnd.random() * 10:.3f},{rnd.random():.3f},{rnd.random():.3f},{rnd.random():.3f}")
+    list_scenes = ["Timecode List:,00:00:00.000",
+                   "Scene Number,Start Frame,Start Timecode,Start Time (seconds),End Frame,End Timecode,End Time (seconds),"
+                   "Length (frames),Length (timecode),Length (seconds)"]
+    frame_begin = 0
+    for i in range(num):
+        frame_end = min(num_frames, frame_begin + rnd.randint(frames_per_scene // 2, frames_per_scene * 3 // 2))
+        list_scenes.append(f"{i + 1},{frame_begin},00:00:00.000,{frame_begin / 30:.3f},{frame_end},00:00:00.000,{frame_end / 30:.3f},"
+                           f"{frame_end - frame_begin},00:00:00.000,{(frame_end - frame_begin) / 30:.3f}")
+        frame_begin = frame_end
+    _write_text(path_root.joinpath("pyscenedetect", "stats.csv"), "\n".join(list_stats) + "\n")
+    _write_text(path_root.joinpath("pyscenedetect", "scenes.csv"), "\n".join(list_scenes) + "\n")
+
+
+GENERATORS = [aws_rekognition, aws_transcribe, azure_videoindexer, gcp_videointelligence, dsai,
+              dsai_metadata, frames_detect, pyscenedetect]
+
+
+def generate(path_root, scale=1, seed=0):
+    """Write synthetic outputs for every known extractor under `path_root`
+
+    :param path_root: (str): directory to populate (one sub-directory per extractor)
+    :param scale: (float): multiplier on the nominal number of events per extractor
+    :param seed: (int): random seed so that repeated runs produce identical data
+    :return: (Path): the populated root directory
+    """
+    path_root = Path(path_root)
+    rnd = random.Random(seed)
+    num = max(2, int(BASE_COUNT * scale))
+    for func_gen in GENERATORS:
+        func_gen(path_root, rnd, num)
+    return path_root
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(-1)
+    print(generate(sys.argv[1], *[float(x) if idx == 0 else int(x) for idx, x in enumerate(sys.argv[2:4])]))
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-__version__ = "1.4.0"
+__version__ = "1.8.0"
 __package__ = 'contentai_metadata_flatten'
 __description__ = "ContentAI Metadata Flattening Service"
 __copyright__ = "Copyright AT&T Services and Warner Media 2020"
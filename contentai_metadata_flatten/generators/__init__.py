@@ -18,9 +18,6 @@
 # ===============LICENSE_END=========================================================
 # -*- coding: utf-8 -*-
 
-import pkgutil
-import importlib
-
 from os import path
 import json
 import gzip
@@ -29,24 +26,36 @@ import logging
 import warnings
 from sys import stdout as STDOUT
 
+import numpy as np
 import pandas as pd
 
+from .. import json_backend
+from ..registry import Registry
+
+
 class Generate():
     PATH_DATA = path.join(path.dirname(path.dirname(__file__)), 'data')
     BASE_PREFIX = "flatten_"
+    # typed columns of `flat_events` for structured outputs (added v1.7.0)
+    COLUMNS_FLAT = ["time_begin", "time_end", "time_event", "source_event", "tag", "tag_type", "score", "details", "extractor", 
+                    "box_w", "box_h", "box_l", "box_t", "transcript", "uri"]
+    COLUMNS_FLAT_FLOAT = ["time_begin", "time_end", "time_event", "score", "box_w", "box_h", "box_l", "box_t"]
+    COLUMNS_FLAT_CATEGORY = ["source_event", "tag", "tag_type", "extractor"]
 
-    def __init__(self, path_destination, generator="unknown", format=".csv", universal=False, logger=None):
+    def __init__(self, path_destination, generator="unknown", format=".csv", universal=False, compressible=True, logger=None):
         """Construct new generator instance
 
         :param path_destination: (str): Path (directory) for output file
         :param generator: (str): Name of the generator (from derived class)
         :param format: (str): File extension for output
         :param universal: (bool): Flag for universal (True, single file) output or independent (False) files
+        :param compressible: (bool): Flag for output that may be gzipped (True, append `.gz`) or is compressed internally (False) (added v1.7.0)
         """
         super().__init__()
         self._format = format
         self._generator = generator
         self._universal = universal
+        self._compressible = compressible
         self._path_destination = path_destination
 
         if logger is None:
@@ -58,6 +67,10 @@ class Generate():
     def is_universal(self):
         return self._universal
 
+    @property
+    def is_compressible(self):
+        return self._compressible
+
     @staticmethod
     def known_types():
         """Return the output types for this generator
@@ -70,6 +83,32 @@ class Generate():
             return path.join(self._path_destination, self._generator + self._format)
         return path.join(self._path_destination, f"{self._generator}_{Generate.BASE_PREFIX}{name_parser}{self._format}")
 
+    def flat_events(self, df):
+        """Convert events to the typed columns `COLUMNS_FLAT` for structured (columnar or database) outputs
+
+        :param df: (DataFrame): events from a parser (structured or legacy details)
+        :return: DataFrame.  Events with every column, missing ones as nulls; floats, categoricals and strings (details as JSON)
+        """
+        num_rows = len(df)
+        df_flat = {}
+        for col_name in self.COLUMNS_FLAT:
+            if col_name in self.COLUMNS_FLAT_FLOAT:
+                df_flat[col_name] = df[col_name].to_numpy(dtype=float) if col_name in df else np.full(num_rows, np.nan)
+            elif col_name in self.COLUMNS_FLAT_CATEGORY:
+                df_flat[col_name] = df[col_name].astype("category") if col_name in df else pd.Categorical([None] * num_rows)
+            else:
+                df_flat[col_name] = [self.text_value(v) for v in df[col_name].tolist()] if col_name in df else [None] * num_rows
+        return pd.DataFrame(df_flat)
+
+    @staticmethod
+    def text_value(value):
+        """Render a value for a string column; dictionaries (residual details) and lists (urls) as JSON, empty as null"""
+        if value is None or value != value:
+            return None
+        if type(value) != str:
+            value = json_backend.dumps(value)
+        return value if value and value != "{}" else None
+
     def json_load(self, path_file):
         """Helper to read dict object from JSON
 
@@ -77,71 +116,33 @@ class Generate():
         :return: dict.  The loaded dict or an empty dict (`{}`) on error
         """
         if path.exists(path_file):
-            if path_file.endswith(".gz"):
-                infile = gzip.open(path_file, 'rt')
-            else:
-                infile = open(path_file, 'rt')
-            try:
-                return json.load(infile)
-            except json.decoder.JSONDecodeError as e:
-                return {}
-            except UnicodeDecodeError as e:
-                return {}
-            if infile:
-                infile.close()
+            return self._json_decode(path_file)
         return {}
 
+    @staticmethod
+    def _json_decode(path_file):
+        """Decode JSON from a plain or gzipped file, closing it afterwards"""
+        try:
+            return json_backend.load_file(path_file)
+        except (json_backend.DecodeError, UnicodeDecodeError, OSError, EOFError) as e:
+            return {}
+
     def json_save(self, path_file, dict_source=None, pretty_print=False):
         """Helper to write dict object to json
 
         :param path_file: (str): Path for destination file
-        :param dict_source: (dict): The dictionary to write to JSON
+        :param dict_source: (dict): The dictionary to write to JSON; iterator values are streamed in chunks as lists (added v1.6.0)
         :param pretty_print: (bool): Write out in more human-readable format
         :return: bool.  Sueccess of operation and non-empty dictionary.
         """
         if dict_source is not None:
-            outfile = gzip.open(path_file, 'wt') if path_file.endswith(".gz") else open(path_file, 'wt')
-            json.dump(dict_source, outfile, indent=4 if pretty_print else None)
-            if outfile:
-                outfile.close()
+            json_backend.save_file(path_file, dict_source, pretty_print)
             return True
         return False
 
 
-# import other moduels
-
-_modules = []
-for module_finder, extractor_name, _ in pkgutil.iter_modules(__path__):
-    generator_module = module_finder.find_module(extractor_name).load_module()
-    generator_obj = getattr(generator_module, "Generator")   # get class template
-    if generator_obj is not None:
-        _modules.append({'obj':generator_obj, 'types':generator_obj.known_types(), 'name':extractor_name})
-
-def get_by_type(type_list=None):
-    """Get parsers with a specific filter for type.
-
-    :param type_list: (list) list of tag type required in output (e.g. ['csv', 'json']) (default=None or all available)
-    :return list: list of raw "Parser()" classes that are instantiated with input file paths
-    """
-    local_list = []
-    if type_list is None:
-        local_list = [local_obj for local_obj in _modules]
-    else:
-        if type(type_list) != list:
-            type_list = [type_list]
-        type_list = set(type_list)  # convert to set
-        local_list = [local_obj for local_obj in _modules if local_obj['types'] is None or len(type_list.intersection(set(local_obj['types']))) > 0]
-    return local_list
-
-def get_by_name(name_limit=None):
-    """Get parsers with a specific filter for name.
-    
-    :param name_limit: (str) list of tag type required in output (e.g. 'flattened_csv') (default=None or all available)
-    :return list: list of raw "Parser()" classes that are instantiated with input file paths
-    """
-    local_list = []
-    if name_limit is None:
-        local_list = [local_obj for local_obj in _modules]
-    else:  # update from "in" to "==" for name compare in v 1.2.2 to avoid partial match (e.g. metadata -> dsai_metadata)
-        local_list = [local_obj for local_obj in _modules if name_limit == local_obj['name']] 
-    return local_list
+# modules are listed from a manifest and imported on request (changed v1.8.0, was imported eagerly)
+
+REGISTRY = Registry(__name__, __path__, "Generator")
+get_by_type = REGISTRY.get_by_type
+get_by_name = REGISTRY.get_by_name
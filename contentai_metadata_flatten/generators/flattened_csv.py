@@ -19,13 +19,22 @@
 # -*- coding: utf-8 -*-
 
 from os import path
+import os
+import io
+import gzip
 import json
 import re
+import numpy as np
 import pandas as pd
+from pandas.util import hash_pandas_object
 
 from contentai_metadata_flatten.generators import Generate
+from contentai_metadata_flatten import parsers
 
 class Generator(Generate):
+    INDEX_SUFFIX = ".index.npz"   # sidecar of row hashes and time range for incremental merges (added v1.6.0)
+    CHUNK_ROWS = 100000   # rows read at once when streaming a prior output
+
     def __init__(self, path_destination, logger=None):
         super().__init__(path_destination, "csv", ".csv", logger=logger)
 
@@ -45,14 +54,161 @@ class Generator(Generate):
         :returns: (int): count of items on successful decoding and export, zero otherwise
         """
 
+        df = parsers.details_legacy(df)   # JSON-encoded details only for the written file (added v1.6.0)
+        if run_options.get("incremental"):   # append or merge only new events (added v1.6.0)
+            num_items = self.generate_incremental(path_output, df)
+            if num_items is not None:
+                return num_items
+
         df_prior = None
         if path.exists(path_output):
             df_prior = pd.read_csv(path_output)
             self.logger.info(f"Loaded {len(df_prior)} existing events from {path_output}...")
-            df = pd.concat([df, df_prior])
+            df = parsers.concat_events([df, df_prior])   # keeps categorical columns (added v1.5.0)
             num_prior = len(df)
             df.drop_duplicates(inplace=True)
             self.logger.info(f"Duplicates removal shrunk from {num_prior} to {len(df)} surviving events...")
 
         df.sort_values("time_begin").to_csv(path_output, index=False)
         return len(df)
+
+    def generate_incremental(self, path_output, df):
+        """Add events to a CSV without loading a prior output, using its sidecar index of row hashes...
+        New events after the prior time range are appended, others are merged in a streaming pass by `time_begin`.
+
+        :param: path_output (str): path for output of the file 
+        :param: df (DataFrame): events to add (with JSON-encoded details)
+        :returns: (int): count of items in the output, None if the prior output can't be merged incrementally
+        """
+        df_text = pd.read_csv(io.StringIO(df.sort_values("time_begin").to_csv(index=False)), dtype=str, keep_default_na=False)
+        hash_new = hash_pandas_object(df_text, index=False).to_numpy()   # rows as they are written
+        mask_new = np.ones(len(df_text), dtype=bool)
+
+        index_prior = None
+        if path.exists(path_output):   # as with a full merge, duplicates are only removed against a prior output
+            index_prior = self.index_load(path_output)
+            if index_prior is None:
+                self.logger.info(f"Indexing existing events from {path_output}...")
+                index_prior = self.index_build(path_output)
+            if list(index_prior["columns"]) != list(df_text.columns) or not index_prior["sorted"]:
+                self.logger.info(f"Existing events in {path_output} are not sorted or use other columns, merging all events...")
+                return None
+            mask_new = ~(pd.Series(hash_new).duplicated().to_numpy() | np.isin(hash_new, index_prior["hashes"]))
+        df_text, hash_new = df_text[mask_new], hash_new[mask_new]
+        time_new = pd.to_numeric(df_text["time_begin"]).to_numpy()
+
+        if index_prior is None:
+            self.csv_write(path_output, [df_text])
+            index_prior = {"hashes": np.array([], dtype=np.uint64), "num_rows": 0, "time_min": np.inf, "time_max": -np.inf}
+        elif not len(df_text):
+            self.logger.info(f"No new events among {len(df)} for {path_output}...")
+        elif time_new[0] >= index_prior["time_max"]:   # all new events after prior ones
+            self.logger.info(f"Appending {len(df_text)} new events to {index_prior['num_rows']} in {path_output}...")
+            self.csv_write(path_output, [df_text], append=True)
+        else:
+            self.logger.info(f"Merging {len(df_text)} new events with {index_prior['num_rows']} in {path_output}...")
+            path_temp = path.join(path.dirname(path_output), "." + path.basename(path_output))   # same extension
+            self.csv_write(path_temp, self.merge_sorted(path_output, df_text, time_new))
+            os.replace(path_temp, path_output)
+
+        num_items = int(index_prior["num_rows"]) + len(df_text)
+        self.index_save(path_output, np.union1d(index_prior["hashes"], hash_new), df_text.columns, num_items, 
+                        min(index_prior["time_min"], time_new[0]) if len(time_new) else index_prior["time_min"], 
+                        max(index_prior["time_max"], time_new[-1]) if len(time_new) else index_prior["time_max"])
+        return num_items
+
+    def merge_sorted(self, path_output, df_text, time_new):
+        """Merge sorted new events into a sorted prior output one block (chunk of prior rows) at a time
+
+        :param: path_output (str): path of the prior output
+        :param: df_text (DataFrame): new events as written text, sorted by `time_begin`
+        :param: time_new (np.array): `time_begin` of new events
+        :returns: (generator): DataFrame blocks of events (as text) in `time_begin` order
+        """
+        idx_new = 0
+        for df_chunk in pd.read_csv(path_output, dtype=str, keep_default_na=False, chunksize=self.CHUNK_ROWS):
+            time_chunk = pd.to_numeric(df_chunk["time_begin"]).to_numpy()
+            idx_next = np.searchsorted(time_new, time_chunk[-1], side="right")   # new events up to the end of this chunk
+            if idx_next > idx_new:
+                df_chunk = pd.concat([df_chunk, df_text.iloc[idx_new:idx_next]], ignore_index=True)
+                time_chunk = np.concatenate([time_chunk, time_new[idx_new:idx_next]])
+                df_chunk = df_chunk.iloc[np.argsort(time_chunk, kind="stable")]   # prior events first for the same time
+                idx_new = idx_next
+            yield df_chunk
+        yield df_text.iloc[idx_new:]
+
+    @staticmethod
+    def csv_write(path_output, list_df, append=False):
+        """Write (or append) blocks of events to a single CSV (gzipped if the path ends in `.gz`)
+
+        :param: path_output (str): path for output of the file 
+        :param: list_df (iterable): DataFrame blocks to write in order
+        :param: append (bool): append rows without a header to an existing file (a new gzip member for compressed files)
+        """
+        mode = 'at' if append else 'wt'
+        with (gzip.open(path_output, mode, newline="") if path_output.endswith(".gz") else open(path_output, mode, newline="")) as f:
+            for df_block in list_df:
+                df_block.to_csv(f, index=False, header=not append)
+                append = True
+
+    def index_path(self, path_output):
+        """Path of the sidecar index for an output, hidden next to it (e.g. `.csv_flatten_x.csv.gz.index.npz`)"""
+        return path.join(path.dirname(path_output), "." + path.basename(path_output) + self.INDEX_SUFFIX)
+
+    def index_load(self, path_output):
+        """Load the sidecar index of an output, only if it still matches the output's size and modification time
+
+        :param: path_output (str): path of the output
+        :returns: (dict): index with `hashes`, `columns`, `num_rows`, `time_min`, `time_max`, `sorted`; None if missing or stale
+        """
+        path_index = self.index_path(path_output)
+        if not path.exists(path_index):
+            return None
+        stat_output = os.stat(path_output)
+        try:
+            with np.load(path_index) as npz_index:
+                index = {k: npz_index[k] for k in npz_index.files}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Failed to load index {path_index} ({e}), rebuilding...")
+            return None
+        if int(index["size"]) != stat_output.st_size or int(index["mtime_ns"]) != stat_output.st_mtime_ns:
+            return None
+        index["sorted"] = True   # only saved for sorted outputs
+        return index
+
+    def index_build(self, path_output):
+        """Build an index of an existing output in one streaming pass (e.g. if written without `incremental`)
+
+        :param: path_output (str): path of the output
+        :returns: (dict): index with `hashes`, `columns`, `num_rows`, `time_min`, `time_max`, `sorted`
+        """
+        list_hash = []
+        index = {"columns": [], "num_rows": 0, "time_min": np.inf, "time_max": -np.inf, "sorted": True}
+        for df_chunk in pd.read_csv(path_output, dtype=str, keep_default_na=False, chunksize=self.CHUNK_ROWS):
+            index["columns"] = list(df_chunk.columns)
+            if "time_begin" not in df_chunk.columns:
+                index["sorted"] = False
+                break
+            time_chunk = pd.to_numeric(df_chunk["time_begin"]).to_numpy()
+            if len(time_chunk):
+                index["sorted"] &= bool(time_chunk[0] >= index["time_max"] and np.all(np.diff(time_chunk) >= 0))
+                index["time_min"], index["time_max"] = min(index["time_min"], time_chunk[0]), max(index["time_max"], time_chunk[-1])
+            list_hash.append(hash_pandas_object(df_chunk, index=False).to_numpy())
+            index["num_rows"] += len(df_chunk)
+        index["hashes"] = np.unique(np.concatenate(list_hash)) if list_hash else np.array([], dtype=np.uint64)
+        return index
+
+    def index_save(self, path_output, hashes, columns, num_rows, time_min, time_max):
+        """Save the sidecar index of a sorted output, stamped with the output's size and modification time
+
+        :param: path_output (str): path of the output
+        :param: hashes (np.array): sorted unique row hashes
+        :param: columns (list): column names of the output
+        :param: num_rows (int): number of rows in the output
+        :param: time_min (float): first `time_begin` in the output
+        :param: time_max (float): last `time_begin` in the output
+        """
+        stat_output = os.stat(path_output)
+        with open(self.index_path(path_output), 'wb') as f:
+            np.savez(f, hashes=hashes, columns=np.array(list(columns), dtype=str), num_rows=num_rows, 
+                     time_min=time_min, time_max=time_max, size=stat_output.st_size, mtime_ns=stat_output.st_mtime_ns)
@@ -0,0 +1,109 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+
+from os import path
+import os
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:   # optional dependency, generator is skipped in discovery without it
+    pa = None
+    pq = None
+
+from contentai_metadata_flatten.generators import Generate
+from contentai_metadata_flatten import parsers
+
+class Generator(Generate):
+    ROW_GROUP_ROWS = 65536   # rows per row group, each with min/max statistics for time-window queries
+
+    def __init__(self, path_destination, logger=None, generator="parquet", universal=False):
+        super().__init__(path_destination, generator, ".parquet", universal=universal, compressible=False, logger=logger)
+
+    @staticmethod
+    def known_types():
+        """Return the output types for this generator
+        :return: list.  List of output types (file types) for this generator
+        """
+        return ["parquet"]
+
+    @classmethod
+    def schema(cls):
+        """Arrow schema of the output: typed times, scores and boxes, dictionary-encoded text, JSON-encoded details
+
+        :returns: (pa.Schema): shared schema for every extractor (so they can be combined in one file or dataset)
+        """
+        list_fields = []
+        for col_name in cls.COLUMNS_FLAT:
+            if col_name in cls.COLUMNS_FLAT_FLOAT:
+                list_fields.append(pa.field(col_name, pa.float64()))
+            elif col_name in cls.COLUMNS_FLAT_CATEGORY:
+                list_fields.append(pa.field(col_name, pa.dictionary(pa.int32(), pa.string())))
+            else:
+                list_fields.append(pa.field(col_name, pa.string()))
+        return pa.schema(list_fields)
+
+    def to_table(self, df_flat):
+        """Convert flat events (see `flat_events`) to an arrow table sorted by `time_begin`"""
+        df_flat = df_flat.sort_values("time_begin", kind="stable")
+        return pa.Table.from_pandas(df_flat, schema=self.schema(), preserve_index=False)
+
+    def merge_events(self, list_df):
+        """Combine flat events (e.g. prior output and a new part of an asset), dropping duplicates
+
+        :param: list_df (list): DataFrames of flat events
+        :returns: (DataFrame): unique events
+        """
+        df_flat = parsers.concat_events([df for df in list_df if len(df)])
+        num_prior = len(df_flat)
+        df_flat = df_flat.drop_duplicates()
+        self.logger.info(f"Duplicates removal shrunk from {num_prior} to {len(df_flat)} surviving events...")
+        return df_flat
+
+    def writer(self, path_output):
+        """Open a parquet writer for the output schema (with `time_begin` recorded as sort order where supported)"""
+        dict_options = {}
+        if hasattr(pq, "SortingColumn"):
+            dict_options["sorting_columns"] = [pq.SortingColumn(self.COLUMNS_FLAT.index("time_begin"))]
+        return pq.ParquetWriter(path_output, self.schema(), write_statistics=True, **dict_options)
+
+    def generate(self, path_output, run_options, df):
+        """Generate parquet from flattened results
+
+        :param: path_output (str): path for output of the file 
+        :param: run_options (dict): specific runtime information 
+        :param: df (DataFrame): dataframe of events to break down
+        :returns: (int): count of items on successful decoding and export, zero otherwise
+        """
+        df_flat = self.flat_events(df)
+        if path.exists(path_output):
+            df_prior = pq.read_table(path_output).to_pandas()
+            self.logger.info(f"Loaded {len(df_prior)} existing events from {path_output}...")
+            df_flat = self.merge_events([df_flat, df_prior])
+
+        with self.writer(path_output) as writer:
+            writer.write_table(self.to_table(df_flat), row_group_size=self.ROW_GROUP_ROWS)
+        return len(df_flat)
+
+
+GeneratorParquet = Generator   # base for the universal variant
+if pq is None:
+    Generator = None
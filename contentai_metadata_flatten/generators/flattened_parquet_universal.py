@@ -0,0 +1,68 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+
+from os import path
+import os
+import pandas as pd
+
+from contentai_metadata_flatten.generators.flattened_parquet import GeneratorParquet, pq
+
+class Generator(GeneratorParquet):
+    def __init__(self, path_destination, logger=None):
+        super().__init__(path_destination, logger=logger, generator="flatten", universal=True)
+
+    def generate(self, path_output, run_options, df):
+        """Generate one parquet dataset for all extractors: a directory with a part file per extractor whose
+        row groups are sorted by `time_begin`; only parts of extractors in `df` are rewritten, so each call
+        costs the size of its own events  *(changed v1.8.0, was one file rewritten on every call)*
+
+        :param: path_output (str): path for output of the dataset (directory)
+        :param: run_options (dict): specific runtime information 
+        :param: df (DataFrame): dataframe of events to break down
+        :returns: (int): count of items in the dataset on successful decoding and export, zero otherwise
+        """
+        df_flat = self.flat_events(df)
+        if path.isfile(path_output):   # single file of a prior version, split into parts
+            df_prior = pq.read_table(path_output).to_pandas()
+            self.logger.info(f"Converting {len(df_prior)} existing events in {path_output} to a dataset...")
+            df_flat = self.merge_events([df_flat, df_prior])
+            os.remove(path_output)
+        os.makedirs(path_output, exist_ok=True)
+
+        for name, df_name in df_flat.groupby("extractor", observed=True, sort=True):
+            path_part = self.part_path(path_output, name)
+            if path.exists(path_part):
+                df_prior = pq.read_table(path_part).to_pandas()
+                self.logger.info(f"Loaded {len(df_prior)} existing events from {path_part}...")
+                df_name = self.merge_events([df_name, df_prior])
+            path_temp = self.part_path(path_output, "." + name)   # hidden from dataset readers until complete
+            with self.writer(path_temp) as writer:
+                writer.write_table(self.to_table(df_name), row_group_size=self.ROW_GROUP_ROWS)
+            os.replace(path_temp, path_part)
+        return sum(pq.ParquetFile(path.join(path_output, name_file)).metadata.num_rows 
+                   for name_file in os.listdir(path_output) if name_file.endswith(self._format) and name_file[0] != ".")
+
+    def part_path(self, path_output, name):
+        """Return the path of the part file for one extractor within the dataset directory"""
+        return path.join(path_output, name + self._format)
+
+
+if pq is None:
+    Generator = None
@@ -0,0 +1,111 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+
+from os import path
+import sqlite3
+import hashlib   # for batch digests
+import numpy as np
+import pandas as pd
+from pandas.util import hash_pandas_object
+
+from contentai_metadata_flatten.generators import Generate
+
+class Generator(Generate):
+    # key of an event (with nulls as '' so the unique index can match them)
+    COLUMNS_KEY = ["extractor", "time_begin", "time_end", "time_event", "source_event", "tag", "tag_type", "score", "details",
+                   "box_w", "box_h", "box_l", "box_t"]
+
+    def __init__(self, path_destination, logger=None):
+        super().__init__(path_destination, "sqlite_events", ".db", universal=True, compressible=False, logger=logger)
+
+    @staticmethod
+    def known_types():
+        """Return the output types for this generator
+        :return: list.  List of output types (file types) for this generator
+        """
+        return ["sqlite"]
+
+    def create_schema(self, conn):
+        """Create the `events` table, its indexes, an R-tree of event intervals (if supported) and the `batches` digests
+
+        :param: conn (sqlite3.Connection): open database
+        :returns: (bool): True if the R-tree `events_time` is available
+        """
+        list_columns = [f"{col_name} {'REAL' if col_name in self.COLUMNS_FLAT_FLOAT else 'TEXT'}" for col_name in self.COLUMNS_FLAT]
+        conn.execute(f"CREATE TABLE IF NOT EXISTS events (id INTEGER PRIMARY KEY, {', '.join(list_columns)})")
+        conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS events_unique ON events "
+                     f"({', '.join([f'IFNULL({col_name}, {chr(39) * 2})' for col_name in self.COLUMNS_KEY])})")
+        conn.execute("CREATE INDEX IF NOT EXISTS events_extractor_time ON events (extractor, time_begin)")
+        conn.execute("CREATE INDEX IF NOT EXISTS events_tag ON events (tag_type, tag)")
+        conn.execute("CREATE TABLE IF NOT EXISTS batches (digest TEXT PRIMARY KEY, extractor TEXT, num_rows INTEGER)")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS events_time USING rtree(id, time_min, time_max)")
+        except sqlite3.OperationalError as e:   # sqlite built without R-tree module
+            self.logger.warning(f"R-tree interval index unavailable ({e}), skipping `events_time`...")
+            return False
+        return True
+
+    @staticmethod
+    def batch_digest(df_flat):
+        """Digest of a whole batch of flat events (one hash over all rows, not one per row)"""
+        hash_rows = hash_pandas_object(df_flat, index=False).to_numpy()
+        return hashlib.sha1(hash_rows.tobytes() + ",".join(df_flat.columns).encode()).hexdigest()
+
+    def generate(self, path_output, run_options, df):
+        """Generate (upsert) events in a SQLite database with time and tag indexes
+
+        :param: path_output (str): path for output of the file 
+        :param: run_options (dict): specific runtime information 
+        :param: df (DataFrame): dataframe of events to break down
+        :returns: (int): count of items on successful decoding and export, zero otherwise
+        """
+        df_flat = self.flat_events(df)
+        str_extractor = ",".join(sorted(df_flat["extractor"].dropna().unique().tolist()))
+        digest = self.batch_digest(df_flat)
+
+        conn = sqlite3.connect(path_output)
+        try:
+            has_rtree = self.create_schema(conn)
+            row_batch = conn.execute("SELECT num_rows FROM batches WHERE digest = ?", (digest,)).fetchone()
+            if row_batch is not None:   # identical batch already stored (e.g. a repeated run)
+                self.logger.info(f"Skipping {len(df_flat)} events of '{str_extractor}' already in {path_output}...")
+                return row_batch[0]
+
+            df_flat = df_flat.sort_values("time_begin", kind="stable")   # mostly appends to the time-leading indexes
+            list_values = []   # per column, NaN as NULL
+            for col_name in self.COLUMNS_FLAT:
+                if col_name in self.COLUMNS_FLAT_FLOAT:
+                    values = df_flat[col_name].to_numpy()
+                    list_values.append(np.where(np.isnan(values), None, values).tolist())
+                else:
+                    list_values.append(df_flat[col_name].astype(object).where(df_flat[col_name].notna(), None).tolist())
+            with conn:   # single transaction
+                id_last = conn.execute("SELECT IFNULL(MAX(id), 0) FROM events").fetchone()[0]
+                conn.executemany(f"INSERT OR IGNORE INTO events ({', '.join(self.COLUMNS_FLAT)}) "
+                                 f"VALUES ({', '.join(['?'] * len(self.COLUMNS_FLAT))})", zip(*list_values))
+                num_new = conn.execute("SELECT COUNT(*) FROM events WHERE id > ?", (id_last,)).fetchone()[0]
+                if has_rtree:
+                    conn.execute("INSERT INTO events_time SELECT id, MIN(time_begin, IFNULL(time_end, time_begin)), "
+                                 "MAX(time_begin, IFNULL(time_end, time_begin)) FROM events WHERE id > ?", (id_last,))
+                conn.execute("INSERT INTO batches (digest, extractor, num_rows) VALUES (?, ?, ?)", (digest, str_extractor, len(df_flat)))
+            self.logger.info(f"Inserted {num_new} new of {len(df_flat)} events for '{str_extractor}' in {path_output}...")
+        finally:
+            conn.close()
+        return len(df_flat)
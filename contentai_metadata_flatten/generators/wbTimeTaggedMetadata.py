@@ -19,10 +19,11 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-import json
-import re
-from pandas import DataFrame
-import hashlib   # for key hashing
+from itertools import chain
+from contentai_metadata_flatten.json_backend import loads as json_loads
+import numpy as np
+from pandas import DataFrame, CategoricalDtype
+from pandas.util import hash_pandas_object
 
 from contentai_metadata_flatten.generators import Generate
 
@@ -39,76 +40,152 @@ class Generator(Generate):
         """
         return ["json"]
 
-    def distill_type(self, output_obj, timed_row):
-        """Render input type to the right JSON/object format...
 
-        :param: output_obj (dict): input/target dict object to update with type and data
-        :param: timed_row (pd.Series): a single row for output with some expected column names
-        :returns: (bool): time coverage indicator True (concrete and lasting through whole event),  False (descriptive, not necessarily entire timespan), None (unknown type)
+    def distill_columns(self, df):
+        """Render all input rows to the typed fields of the JSON/object format at once...
+
+        :param: df (DataFrame): events for output with some expected column names
+        :returns: (dict): per-event arrays (and sparse dicts by event index for optional fields), None if required columns are missing
         """
-        full_coverage = False
-        col_row = list(timed_row.index)
-        if not ("tag" in col_row and "score" in col_row and "source_event" in col_row):
+        if not ("tag" in df and "score" in df and "source_event" in df):
             return None
-        output_obj["dataObject"] = {"name": timed_row["tag"], "source": timed_row["source_event"], "type":timed_row["tag_type"],
-                                    "score": timed_row["score"], "extractor": timed_row["extractor"] }
-        output_obj["dataTypeId"] = "timedEvent"  # generic audio, visual, or textual tag
-        
-        if "details" in timed_row:    # check for special object
-            details_obj = None
-            if len(timed_row["details"]):    # face identity
-                details_obj = json.loads(timed_row["details"])
-                if 'box' in details_obj:
-                    output_obj['box'] = details_obj['box']
-                    output_obj["dataTypeId"] = "timedObject"  # object with specific coordinates
-                    full_coverage = (timed_row["time_begin"] == timed_row["time_end"])   # only full coverage if singleton event
-                if "uri" in details_obj:
-                    output_obj["uri"] = details_obj["uri"]
-                elif "url" in details_obj:
-                    output_obj["uri"] = details_obj["url"]
-                elif "urls" in details_obj:
-                    output_obj["uri"] = details_obj["urls"]
-                if 'transcript' in details_obj:
-                    output_obj["transcript"] = details_obj["transcript"]
-                    output_obj["dataTypeId"] = "timedText"  # object with specific coordinates
-                    full_coverage = True
-
-                # TODO: detail JSON : AgeRange (aws face), Pose (aws face), face (bounding box for person, azure), kfcluster (cae), shot_type (shot tags, azure)
-
-        return full_coverage
-
-    def append_timed(self, output_set, timed_row):
-        """Append timed row as either timespan or frame to output object...
-
-        :param: output_set (dict): sets of timed objects ['descriptiveTimespans', 'concreteTimespans', 'frames']
-        :param: timed_row (pd.Series): a single row for output with some expected column names
-        :returns: (dict): modified output object
+        num_rows = len(df)
+        box_key = np.full((num_rows, 4), np.nan)
+        if "box_w" in df:   # structured box (added v1.6.0)
+            box_key = df[["box_w", "box_h", "box_l", "box_t"]].to_numpy(dtype=float)
+        box, box_raw = {}, {}   # other box formats, with a string for hashing
+        uri = self.sparse_column(df, "uri")
+        transcript = self.sparse_column(df, "transcript")
+        if "details" in df:   # not structured, check the details themselves
+            for idx, details_obj in enumerate(df["details"].to_numpy()):
+                if type(details_obj) == str and len(details_obj):   # legacy (JSON string) details
+                    details_obj = json_loads(details_obj)
+                if type(details_obj) != dict or not details_obj:
+                    continue
+                if details_obj.get('box') is not None and box_key[idx, 0] != box_key[idx, 0]:
+                    box[idx] = details_obj['box']
+                    box_key[idx], box_raw[idx] = self.box_key(box[idx])
+                if idx not in uri:
+                    value = next((details_obj[key] for key in ["uri", "url", "urls"] if key in details_obj), None)
+                    if value is not None:
+                        uri[idx] = value
+                if idx not in transcript and details_obj.get('transcript') is not None:
+                    transcript[idx] = details_obj['transcript']
+
+        has_box = ~np.isnan(box_key[:, 0])
+        has_box[list(box.keys())] = True
+        has_text = np.zeros(num_rows, dtype=bool)
+        has_text[list(transcript.keys())] = True
+        score = df["score"].to_numpy()
+
+        # TODO: detail JSON : AgeRange (aws face), Pose (aws face), face (bounding box for person, azure), kfcluster (cae), shot_type (shot tags, azure)
+
+        return {"name": self.object_values(df["tag"]), "source": self.object_values(df["source_event"]), 
+                "type": self.object_values(df["tag_type"]), "extractor": self.object_values(df["extractor"]), 
+                "score": score if score.dtype == float else score.astype(object), 
+                "box": box, "box_key": box_key, "box_raw": box_raw, "has_box": has_box, "uri": uri, "transcript": transcript, 
+                "concrete": has_text}   # time coverage is only concrete (lasting through whole event) for text
+
+    @staticmethod
+    def object_values(series):
+        """Read a column as an object array, sharing one string object per category instead of one per row
+
+        :param: series (Series): column of events
+        :returns: (np.array): object array of values
         """
-        if timed_row["time_begin"] == timed_row["time_end"]:   # detect this is a frame input
-            new_frame = {"wbtcd:frameLocation":  { "valueFSTC": float(timed_row["time_event"]), "timeUnits": "seconds", "frameAccuracy": 0.001 },
-                            "wbtcd:frameData": {  } }
-            new_frame["wbtcd:frameLocation"]["valueFSTC"] = float(timed_row["time_event"])
-            if self.distill_type(new_frame["wbtcd:frameData"], timed_row) is not None:
-                output_set["frames"].append(new_frame)
-
-        else:   # detect that this is a timespan
-            new_span = { "start": float(timed_row["time_begin"]), "end": float(timed_row["time_end"]), "units": "seconds", "accuracy": 0.001 }
-            type_update = self.distill_type(new_span, timed_row)
-            if type_update is not None:
-                type_update = output_set["concreteTimespans" if type_update else "descriptiveTimespans"].append(new_span)
-
-        return output_set
-
-    def hash_key(self, obj_new, col_check, raw_str=""):
-        """Hash input data into a specific hex key
-
-        :param: obj_new (dict): input data 
-        :param: col_check (list): list of strings (column names) to combine/bash
-        :param: raw_str (str): external data to include in hash
-        :returns: (int): count of items on successful decoding and export, zero otherwise
+        if isinstance(series.dtype, CategoricalDtype):   # code -1 (missing) maps to the appended NaN
+            return np.append(series.cat.categories.to_numpy(dtype=object), np.nan)[series.cat.codes.to_numpy()]
+        return series.to_numpy(dtype=object)
+
+    @staticmethod
+    def sparse_column(df, column):
+        """Read the set (not None or NaN) values of a structured column
+
+        :param: df (DataFrame): events for output
+        :param: column (str): structured column name
+        :returns: (dict): value by event index
         """
-        raw_str += "_".join([str(obj_new[col_name]) for col_name in col_check if col_name in obj_new])  # allow optional columns
-        return hashlib.md5(raw_str.encode()).hexdigest()
+        if column not in df:
+            return {}
+        mask = df[column].notna().to_numpy()
+        return dict(zip(np.flatnonzero(mask).tolist(), df[column][mask].tolist()))
+
+    @staticmethod
+    def box_key(box):
+        """Split a box into hashable parts, numeric for the standard layout and a string for anything else
+
+        :param: box (dict|list): box as found in an event or a prior output
+        :returns: (tuple): list of four floats (NaN if not standard), string (or None)
+        """
+        if type(box) == dict and list(box.keys()) == ['w', 'h', 'l', 't']:
+            return [float(box[key]) for key in ['w', 'h', 'l', 't']], None
+        return [np.nan] * 4, (None if box is None else str(box))
+
+    def unique_mask(self, time_prior, data_prior, columns, idx_new, time_new):
+        """Flag the first occurrence of each (time, name, source, extractor, box) across prior and new events
+
+        :param: time_prior (list): event time of each prior output object
+        :param: data_prior (list): data of each prior output object (holding `dataObject` and optional `box`)
+        :param: columns (dict): distilled columns of new events (see `distill_columns`)
+        :param: idx_new (np.array): indices of new events
+        :param: time_new (np.array): event time of each new event
+        :returns: (np.array): boolean mask of surviving events, prior followed by new
+        """
+        num_prior = len(data_prior)
+        box_prior = [self.box_key(obj.get('box')) for obj in data_prior]
+        box_raw = np.array([v[1] for v in box_prior] + [None] * len(idx_new), dtype=object)
+        box_key = np.array([v[0] for v in box_prior], dtype=float).reshape(num_prior, 4)
+        dict_key = {"time": np.concatenate([np.array(time_prior, dtype=float), time_new])}
+        for col_name in ["name", "source", "extractor"]:
+            dict_key[col_name] = np.array([obj["dataObject"].get(col_name) for obj in data_prior], dtype=object)
+        if len(idx_new):
+            for col_name in ["name", "source", "extractor"]:
+                dict_key[col_name] = np.concatenate([dict_key[col_name], columns[col_name][idx_new]])
+            box_key = np.concatenate([box_key, columns["box_key"][idx_new]])
+            idx_raw = np.flatnonzero(np.isin(idx_new, list(columns["box_raw"].keys())))
+            box_raw[num_prior + idx_raw] = [columns["box_raw"][idx] for idx in idx_new[idx_raw].tolist()]
+        for idx_col, col_name in enumerate(["box_w", "box_h", "box_l", "box_t"]):
+            dict_key[col_name] = box_key[:, idx_col]
+        dict_key["box_raw"] = box_raw
+        return ~hash_pandas_object(DataFrame(dict_key), index=False).duplicated().to_numpy()
+
+    @staticmethod
+    def data_object(columns, idx):
+        """Assemble the output data (object, type, and optional box, uri, transcript) of a single distilled event
+
+        :param: columns (dict): distilled columns of events (see `distill_columns`)
+        :param: idx (int): index of the event
+        :returns: (dict): data for a frame or timespan
+        """
+        output_obj = {"dataObject": {"name": columns["name"][idx], "source": columns["source"][idx], "type": columns["type"][idx],
+                                     "score": columns["score"][idx], "extractor": columns["extractor"][idx]},
+                      "dataTypeId": "timedText" if columns["concrete"][idx] else ("timedObject" if columns["has_box"][idx] else "timedEvent")}
+        if columns["has_box"][idx]:
+            box = columns["box"].get(idx)
+            output_obj["box"] = box if box is not None else dict(zip(['w', 'h', 'l', 't'], columns["box_key"][idx].tolist()))
+        if idx in columns["uri"]:
+            output_obj["uri"] = columns["uri"][idx]
+        if idx in columns["transcript"]:
+            output_obj["transcript"] = columns["transcript"][idx]
+        return output_obj
+
+    def timed_objects(self, set_name, columns, idx_set, time_begin, time_end, time_event):
+        """Lazily assemble output objects as either timespans or frames for selected events...
+
+        :param: set_name (str): output set ['descriptiveTimespans', 'concreteTimespans', 'frames']
+        :param: columns (dict): distilled columns of events (see `distill_columns`)
+        :param: idx_set (np.array): indices of events to output
+        :param: time_begin (np.array): begin time of all events
+        :param: time_end (np.array): end time of all events
+        :param: time_event (np.array): event time of all events
+        :returns: (generator): output objects in order of `idx_set`, built as they are written
+        """
+        if set_name == 'frames':
+            return ({"wbtcd:frameLocation": {"valueFSTC": time_frame, "timeUnits": "seconds", "frameAccuracy": 0.001},
+                     "wbtcd:frameData": self.data_object(columns, idx)} 
+                    for idx, time_frame in zip(idx_set, time_event[idx_set]))
+        return (dict({"start": time_start, "end": time_stop, "units": "seconds", "accuracy": 0.001}, **self.data_object(columns, idx))
+                for idx, time_start, time_stop in zip(idx_set, time_begin[idx_set], time_end[idx_set]))
 
     def generate(self, path_output, run_options, df):
         """Generate wbTimeTaggedMetadata from flattened results
@@ -143,62 +220,57 @@ class Generator(Generate):
             obj_out = self.json_load(self.template_path)
             # TODO: consider dynamically repopulating event groupins with items and objects from schema?
 
-        idx_write = 0
-        for idx_r, val_r in df.iterrows():   # walk through all rows to generate
-            self.append_timed(output_set, val_r)
-            if (idx_write % 20000) == 0:
-                self.logger.info(f"Processing item {idx_write}/{len(df)} ...")
-            idx_write += 1
+        # split new events into frames and timespans by mask instead of walking each row
+        self.logger.info(f"Processing {len(df)} items ...")
+        columns = self.distill_columns(df)
+        idx_new = {'descriptiveTimespans': np.array([], dtype=int), 'concreteTimespans': np.array([], dtype=int), 
+                   'frames': np.array([], dtype=int)}
+        time_begin = df["time_begin"].to_numpy(dtype=float)
+        time_end = df["time_end"].to_numpy(dtype=float)
+        time_event = df["time_event"].to_numpy(dtype=float)
+        if columns is not None:
+            is_frame = time_begin == time_end   # detect this is a frame input
+            idx_new['frames'] = np.flatnonzero(is_frame)
+            idx_new['concreteTimespans'] = np.flatnonzero(~is_frame & columns["concrete"])
+            idx_new['descriptiveTimespans'] = np.flatnonzero(~is_frame & ~columns["concrete"])
         num_prior = 0
 
-        column_unique = ["name", "source", "extractor"]   # define some collision columns
-        column_unique_data = ["box"]   # use sparingly, but extra hash aginst data (added 0.8.6)
-
-        # clean up any empty entries for schema compliance
-        if len(output_set["frames"]):
-            self.logger.info(f"Processing {len(output_set['frames'])} 'frame' events...")
-            obj_out["wbtcd:frames"] = []
-            hash_prior = {}
-            num_prior += len(output_set["frames"])   # compute raw count as well
-            for obj_new in output_set["frames"]:   # parse each frame, combine both object data and frame time
-                hash_key = self.hash_key(obj_new["wbtcd:frameData"]["dataObject"], column_unique, 
-                                         str(obj_new["wbtcd:frameLocation"]["valueFSTC"]))
-                hash_key = self.hash_key(obj_new["wbtcd:frameData"], column_unique_data, hash_key)
-                if hash_key not in hash_prior:
-                    hash_prior[hash_key] = 1
-                    obj_out["wbtcd:frames"].append(obj_new)
-            num_items += len(obj_out["wbtcd:frames"])
-
-        if len(output_set["descriptiveTimespans"]):
-            self.logger.info(f"Processing {len(output_set['descriptiveTimespans'])} 'descriptiveTimespans' events...")
-            if "wbtcd:timespans" not in obj_out:
-                obj_out["wbtcd:timespans"] = {}
-            obj_out["wbtcd:timespans"]["descriptiveTimespans"] = []
-            hash_prior = {}
-            num_prior += len(output_set["descriptiveTimespans"])   # compute raw count as well
-            for obj_new in output_set["descriptiveTimespans"]:   # parse each event, all data in event object itself
-                hash_key = self.hash_key(obj_new["dataObject"], column_unique, str(obj_new["start"]))
-                hash_key = self.hash_key(obj_new, column_unique_data, hash_key)
-                if hash_key not in hash_prior:
-                    hash_prior[hash_key] = 1
-                    obj_out["wbtcd:timespans"]["descriptiveTimespans"].append(obj_new)
-            num_items += len(obj_out["wbtcd:timespans"]["descriptiveTimespans"])
-
-        if len(output_set["concreteTimespans"]):
-            self.logger.info(f"Processing {len(output_set['concreteTimespans'])} 'concreteTimespans' events...")
-            if "wbtcd:timespans" not in obj_out:
-                obj_out["wbtcd:timespans"] = {}
-            obj_out["wbtcd:timespans"]["concreteTimespans"] = []
-            hash_prior = {}
-            num_prior += len(output_set["concreteTimespans"])   # compute raw count as well
-            for obj_new in output_set["concreteTimespans"]:
-                hash_key = self.hash_key(obj_new["dataObject"], column_unique, str(obj_new["start"]))
-                hash_key = self.hash_key(obj_new, column_unique_data, hash_key)
-                if hash_key not in hash_prior:
-                    hash_prior[hash_key] = 1
-                    obj_out["wbtcd:timespans"]["concreteTimespans"].append(obj_new)
-            num_items += len(obj_out["wbtcd:timespans"]["concreteTimespans"])
+        # dedupe on time, object name, source, extractor and box (added 0.8.6); then clean up any empty entries for schema compliance
+        for set_name in ['frames', 'descriptiveTimespans', 'concreteTimespans']:
+            list_prior = output_set[set_name]
+            idx_set = idx_new[set_name]
+            num_set = len(list_prior) + len(idx_set)
+            if not num_set:
+                continue
+            self.logger.info(f"Processing {num_set} '{'frame' if set_name == 'frames' else set_name}' events...")
+            num_prior += num_set   # compute raw count as well
+            if set_name == 'frames':
+                time_prior = [obj["wbtcd:frameLocation"]["valueFSTC"] for obj in list_prior]
+                data_prior = [obj["wbtcd:frameData"] for obj in list_prior]
+                time_set = time_event[idx_set]
+            else:
+                time_prior = [obj["start"] for obj in list_prior]
+                data_prior = list_prior
+                time_set = time_begin[idx_set]
+            mask_unique = self.unique_mask(time_prior, data_prior, columns, idx_set, time_set)
+            list_out = [obj for obj, keep in zip(list_prior, mask_unique[:len(list_prior)].tolist()) if keep]
+            idx_keep = idx_set[mask_unique[len(list_prior):]]
+            num_items += len(list_out) + len(idx_keep)
+            # new objects are only built while streaming them to the output file (added v1.6.0)
+            list_out = chain(list_out, self.timed_objects(set_name, columns, idx_keep, time_begin, time_end, time_event))
+            if set_name == "descriptiveTimespans" and list_prior is obj_out.get("wbtcd:timespans", {}).get("concreteTimespans"):
+                # prior concrete spans are loaded as descriptive (above) and that list still collects every new span; 
+                #   it is only written out when no new concrete spans replace it, kept as-is for identical output
+                obj_out["wbtcd:timespans"]["concreteTimespans"] = chain(list_prior, 
+                    self.timed_objects(set_name, columns, idx_set, time_begin, time_end, time_event))
+
+            if set_name == 'frames':
+                obj_out["wbtcd:frames"] = list_out
+            else:
+                if "wbtcd:timespans" not in obj_out:
+                    obj_out["wbtcd:timespans"] = {}
+                obj_out["wbtcd:timespans"][set_name] = list_out
 
         self.logger.info(f"Duplicates removal shrunk from {num_prior} to {num_items} surviving events...")
-        self.json_save(path_output, obj_out)      # write out json object
+        self.json_save(path_output, obj_out)      # write out json object, streaming the event lists
         return num_items
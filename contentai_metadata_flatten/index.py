@@ -0,0 +1,196 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+class TimeIndex():
+    """Static index of event intervals `[time_begin, time_end]` for overlap, containment and point queries.
+
+    Point (stabbing) queries walk a centered interval tree, where every node keeps the intervals that cross its 
+    center sorted by begin and by end; window queries add the events that begin inside the window from one 
+    begin-sorted array.  Point and overlap queries cost O(log n + matches); containment (`within`) costs 
+    O(log n + events beginning in the window), as those ending after the window are filtered out.  Every query 
+    method accepts scalars or arrays of windows, answered together node by node.  Results are positional row 
+    indices (for `df.iloc`).
+    """
+    LEAF_ROWS = 64   # subtrees this small are scanned directly instead of split further
+
+    def __init__(self, time_begin, time_end=None):
+        """Build the index from event times
+
+        :param time_begin: (array): begin time of each event; events with NaN never match
+        :param time_end: (array): end time of each event (default=None, instantaneous); NaN ends default to the begin
+        """
+        time_begin = np.asarray(time_begin, dtype=float)
+        time_end = time_begin if time_end is None else np.asarray(time_end, dtype=float)
+        time_end = np.where(np.isnan(time_end), time_begin, np.maximum(time_begin, time_end))
+        self.num_rows = len(time_begin)
+        self.time_begin = time_begin
+        self.time_end = time_end
+
+        idx_valid = np.flatnonzero(~np.isnan(time_begin))
+        self._order = idx_valid[np.argsort(time_begin[idx_valid], kind="stable")]   # rows by begin
+        self._begin_sorted = time_begin[self._order]
+
+        # centered tree in flat lists; children of -1 are empty
+        self._center, self._left, self._right = [], [], []
+        self._node_begin, self._node_begin_row, self._node_end, self._node_end_row = [], [], [], []
+        self._root = self._build(idx_valid)
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build the index from a DataFrame of events (e.g. parser output or `pd.DataFrame(result_dict['data'])`)
+
+        :param df: (DataFrame): events with `time_begin` and optional `time_end` columns
+        :return: TimeIndex.  Index over positional rows of `df`
+        """
+        return cls(df["time_begin"].to_numpy(dtype=float), df["time_end"].to_numpy(dtype=float) if "time_end" in df else None)
+
+    def __len__(self):
+        return self.num_rows
+
+    def _build(self, idx_rows):
+        """Recursively add a node for rows (all valid) and return its id"""
+        if not len(idx_rows):
+            return -1
+        begin, end = self.time_begin[idx_rows], self.time_end[idx_rows]
+        if len(idx_rows) <= self.LEAF_ROWS:   # leaf, all rows in the node with no center
+            center = np.nan
+            mask_left = mask_right = np.zeros(len(idx_rows), dtype=bool)
+        else:
+            center = float(np.median(np.concatenate([begin, end])))   # at most half of the intervals on either side
+            mask_left, mask_right = end < center, begin > center
+        idx_here = idx_rows[~(mask_left | mask_right)]
+
+        id_node = len(self._center)
+        self._center.append(center)
+        order_begin = np.argsort(self.time_begin[idx_here], kind="stable")
+        self._node_begin.append(self.time_begin[idx_here][order_begin])
+        self._node_begin_row.append(idx_here[order_begin])
+        order_end = np.argsort(self.time_end[idx_here], kind="stable")
+        self._node_end.append(self.time_end[idx_here][order_end])
+        self._node_end_row.append(idx_here[order_end])
+        self._left.append(-1)
+        self._right.append(-1)
+        self._left[id_node] = self._build(idx_rows[mask_left])
+        self._right[id_node] = self._build(idx_rows[mask_right])
+        return id_node
+
+    @staticmethod
+    def _ranges(starts, counts):
+        """Flat positions of the ranges `[start, start + count)`, in order"""
+        counts = np.asarray(counts, dtype=np.int64)
+        total = int(counts.sum())
+        if not total:
+            return np.array([], dtype=np.int64)
+        offsets = np.repeat(np.asarray(starts, dtype=np.int64) - np.concatenate([[0], np.cumsum(counts)[:-1]]), counts)
+        return offsets + np.arange(total, dtype=np.int64)
+
+    @staticmethod
+    def _queries(*args):
+        """Normalize query arguments to float arrays, flag a single (scalar) query and list the queries 
+        without NaN points or bounds (the only ones searched; a NaN query never matches)"""
+        is_scalar = np.ndim(args[0]) == 0
+        list_args = [np.atleast_1d(np.asarray(x, dtype=float)) for x in args]
+        idx_valid = np.flatnonzero(~np.logical_or.reduce([np.isnan(x) for x in list_args]))
+        return list_args, is_scalar, idx_valid
+
+    @staticmethod
+    def _result(idx_query, idx_row, is_scalar):
+        """Sort matches by query then row; rows only for a single query"""
+        order = np.lexsort((idx_row, idx_query))
+        idx_query, idx_row = idx_query[order], idx_row[order]
+        return idx_row if is_scalar else (idx_query, idx_row)
+
+    def _stab(self, points, idx_valid):
+        """Matches (query, row) of events containing each point (of those listed in `idx_valid`), walking the 
+        tree for all points together"""
+        list_query, list_row = [], []
+        stack = [(self._root, idx_valid)]
+        while stack:
+            id_node, idx_query = stack.pop()
+            if id_node < 0 or not len(idx_query):
+                continue
+            x, center = points[idx_query], self._center[id_node]
+            if np.isnan(center):   # leaf, test every row against every point
+                row_begin = self._node_begin[id_node]
+                idx_match, idx_local = np.nonzero((row_begin <= x[:, None])
+                                                  & (self.time_end[self._node_begin_row[id_node]] >= x[:, None]))
+                list_query.append(idx_query[idx_match])
+                list_row.append(self._node_begin_row[id_node][idx_local])
+                continue
+            mask_right = x > center
+            if not mask_right.all():   # left of (or at) center: node intervals reach it, so those beginning by `x`
+                query_left = idx_query[~mask_right]
+                counts = np.searchsorted(self._node_begin[id_node], points[query_left], side="right")
+                list_query.append(np.repeat(query_left, counts))
+                list_row.append(self._node_begin_row[id_node][self._ranges(np.zeros(len(counts)), counts)])
+                stack.append((self._left[id_node], idx_query[x < center]))
+            if mask_right.any():   # right of center: those ending at or after `x` (tail of the end-sorted rows)
+                query_right = idx_query[mask_right]
+                starts = np.searchsorted(self._node_end[id_node], points[query_right], side="left")
+                counts = len(self._node_end[id_node]) - starts
+                list_query.append(np.repeat(query_right, counts))
+                list_row.append(self._node_end_row[id_node][self._ranges(starts, counts)])
+                stack.append((self._right[id_node], query_right))
+        if not list_query:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        return np.concatenate(list_query).astype(np.int64), np.concatenate(list_row).astype(np.int64)
+
+    def stab(self, time_point):
+        """Find events containing a point in time (`time_begin <= time_point <= time_end`)
+
+        :param time_point: (float or array): query time(s) in seconds
+        :return: np.array or tuple.  Row indices for a scalar query, otherwise arrays `(idx_query, idx_row)` of matches
+        """
+        (points,), is_scalar, idx_valid = self._queries(time_point)
+        return self._result(*self._stab(points, idx_valid), is_scalar)
+
+    def overlap(self, time_begin, time_end):
+        """Find events overlapping a window (`time_begin <= window end` and `time_end >= window begin`)
+
+        :param time_begin: (float or array): window begin(s) in seconds
+        :param time_end: (float or array): window end(s) in seconds
+        :return: np.array or tuple.  Row indices for a scalar query, otherwise arrays `(idx_query, idx_row)` of matches
+        """
+        (begin, end), is_scalar, idx_valid = self._queries(time_begin, time_end)
+        idx_query, idx_row = self._stab(begin, idx_valid)   # events already running at the window begin
+        starts = np.searchsorted(self._begin_sorted, begin[idx_valid], side="right")   # ... and those beginning inside it
+        counts = np.maximum(np.searchsorted(self._begin_sorted, end[idx_valid], side="right") - starts, 0)
+        idx_query = np.concatenate([idx_query, np.repeat(idx_valid, counts)])
+        idx_row = np.concatenate([idx_row, self._order[self._ranges(starts, counts)]])
+        return self._result(idx_query, idx_row, is_scalar)
+
+    def within(self, time_begin, time_end):
+        """Find events contained in a window (`time_begin >= window begin` and `time_end <= window end`); scans 
+        every event beginning inside the window, so long events starting there add cost without matching
+
+        :param time_begin: (float or array): window begin(s) in seconds
+        :param time_end: (float or array): window end(s) in seconds
+        :return: np.array or tuple.  Row indices for a scalar query, otherwise arrays `(idx_query, idx_row)` of matches
+        """
+        (begin, end), is_scalar, idx_valid = self._queries(time_begin, time_end)
+        starts = np.searchsorted(self._begin_sorted, begin[idx_valid], side="left")
+        counts = np.maximum(np.searchsorted(self._begin_sorted, end[idx_valid], side="right") - starts, 0)
+        idx_query = np.repeat(idx_valid, counts)
+        idx_row = self._order[self._ranges(starts, counts)]
+        mask = self.time_end[idx_row] <= end[idx_query]
+        return self._result(idx_query[mask], idx_row[mask], is_scalar)
@@ -0,0 +1,112 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from contentai_metadata_flatten.index import TimeIndex
+
+JOIN_MODES = ["overlap", "within", "preceding"]
+SUMMARY_KEYS = ["extractor", "tag_type", "tag"]   # one summary row per segment and key (added v1.7.0)
+
+
+def join_indices(df_segments, df_events, how="overlap"):
+    """Match events to segments (e.g. shots or scenes) in time without a cross join
+
+        - `overlap`: event intersects the segment (closed intervals)
+        - `within`: event is contained in the segment
+        - `preceding`: the segment beginning last at or before the event begins (at most one per event)
+
+    :param df_segments: (DataFrame): segments with `time_begin` and `time_end` columns
+    :param df_events: (DataFrame): events with `time_begin` and optional `time_end` columns
+    :param how: (str): join mode, one of `JOIN_MODES` (default=overlap)
+    :return: tuple.  Positional arrays `(idx_segment, idx_event)` of matches, sorted by segment then event
+    """
+    if how not in JOIN_MODES:
+        raise ValueError(f"Unknown temporal join '{how}', expected one of {JOIN_MODES}")
+    segment_begin = df_segments["time_begin"].to_numpy(dtype=float)
+    segment_end = df_segments["time_end"].to_numpy(dtype=float) if "time_end" in df_segments else segment_begin
+    if how == "preceding":   # sorted sweep, one binary search per event
+        idx_valid = np.flatnonzero(~np.isnan(segment_begin))
+        order = idx_valid[np.argsort(segment_begin[idx_valid], kind="stable")]
+        event_begin = df_events["time_begin"].to_numpy(dtype=float)
+        idx_found = np.searchsorted(segment_begin[order], event_begin, side="right") - 1
+        idx_event = np.flatnonzero((idx_found >= 0) & ~np.isnan(event_begin))
+        idx_segment = order[idx_found[idx_event]]
+        order = np.lexsort((idx_event, idx_segment))
+        return idx_segment[order], idx_event[order]
+
+    index = TimeIndex.from_frame(df_events)
+    if how == "within":
+        return index.within(np.atleast_1d(segment_begin), np.atleast_1d(segment_end))
+    return index.overlap(np.atleast_1d(segment_begin), np.atleast_1d(segment_end))
+
+
+def temporal_join(df_segments, df_events, how="overlap", suffix="_segment"):
+    """Join events to the segments they fall in (see `join_indices`), like a merge on time
+
+    :param df_segments: (DataFrame): segments with `time_begin` and `time_end` columns
+    :param df_events: (DataFrame): events with `time_begin` and optional `time_end` columns
+    :param how: (str): join mode, one of `JOIN_MODES` (default=overlap)
+    :param suffix: (str): suffix added to every segment column (default=_segment)
+    :return: DataFrame.  One row per match with the segment position (`segment`), segment columns and event columns
+    """
+    idx_segment, idx_event = join_indices(df_segments, df_events, how=how)
+    df_left = df_segments.iloc[idx_segment].reset_index(drop=True).add_suffix(suffix)
+    df_left.insert(0, "segment", idx_segment)
+    return pd.concat([df_left, df_events.iloc[idx_event].reset_index(drop=True)], axis=1)
+
+
+def segment_events(df, segment_by="shot"):
+    """Pick the segments of an asset from its events, using the extractor with the most events of that tag type
+    (so segments from several extractors are not counted twice)
+
+    :param df: (DataFrame): events of one or more extractors
+    :param segment_by: (str): tag type of the segments (e.g. `shot` or `scene`)
+    :return: DataFrame.  Unique segments by `time_begin` with a fresh index
+    """
+    df_segments = df[df["tag_type"] == segment_by]
+    if not len(df_segments):
+        return df_segments.reset_index(drop=True)
+    counts = df_segments["extractor"].value_counts(sort=False)
+    extractor = counts.index[int(np.argmax(counts.to_numpy()))]
+    df_segments = df_segments[df_segments["extractor"] == extractor]
+    df_segments = df_segments.drop_duplicates(["time_begin", "time_end"]).sort_values("time_begin", kind="stable")
+    return df_segments.reset_index(drop=True)
+
+
+def segment_summary(df, segment_by="shot", how="overlap"):
+    """Summarize the events within every segment (e.g. tags per shot) for the `segment_by` output
+
+    :param df: (DataFrame): events of one or more extractors, including the segments
+    :param segment_by: (str): tag type of the segments (e.g. `shot` or `scene`)
+    :param how: (str): join mode, one of `JOIN_MODES` (default=overlap)
+    :return: DataFrame.  Rows of segment, segment times, `SUMMARY_KEYS`, count of events and mean/max score
+    """
+    df_segments = segment_events(df, segment_by)
+    df_events = df[df["tag_type"] != segment_by].reset_index(drop=True)
+    idx_segment, idx_event = join_indices(df_segments, df_events, how=how)
+    df_match = df_events.iloc[idx_event][SUMMARY_KEYS + ["score"]].reset_index(drop=True)
+    df_match.insert(0, "segment", idx_segment)
+    df_summary = df_match.groupby(["segment"] + SUMMARY_KEYS, observed=True, sort=True)["score"] \
+        .agg(count="size", score_mean="mean", score_max="max").reset_index()
+    df_summary.insert(1, "time_begin", df_segments["time_begin"].to_numpy()[df_summary["segment"].to_numpy()])
+    df_summary.insert(2, "time_end", df_segments["time_end"].to_numpy()[df_summary["segment"].to_numpy()])
+    return df_summary
@@ -0,0 +1,148 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+
+import json
+import gzip
+from collections.abc import Iterator
+from itertools import islice
+
+import numpy as np
+
+# pick the fastest available decoder; `orjson` first, then `simdjson`, then stdlib.  Encoding always uses stdlib 
+# (default separators) so that persisted text (`details`, saved JSON) is identical with every backend and release
+try:
+    import orjson
+    BACKEND = "orjson"
+except ImportError:
+    orjson = None
+    try:
+        import simdjson
+        BACKEND = "simdjson"
+    except ImportError:
+        simdjson = None
+        BACKEND = "json"
+
+CHUNK_ITEMS = 10000   # items encoded at once when streaming an iterator to a file
+
+DecodeError = json.decoder.JSONDecodeError   # base class for errors of every backend (`orjson` derives from it)
+
+
+def loads(data):
+    """Decode a JSON document from a string or bytes with the active backend
+
+    :param data: (str or bytes): serialized JSON document
+    :return: object.  Decoded python object (dict, list, ...)
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:   # e.g. `NaN` literals or huge integers, accepted by stdlib
+            pass
+    elif simdjson is not None:
+        try:
+            return simdjson.loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Encode an object as a JSON string with stdlib formatting (used for `details`)
+
+    :param obj: (object): python object to serialize; numpy scalars/arrays are allowed
+    :return: str.  Serialized JSON
+    """
+    return json.dumps(obj, default=_encode_default)
+
+
+def _encode_default(obj):
+    """Convert numpy scalars and arrays (not handled by stdlib) to python values"""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def load_file(path_file):
+    """Read and decode a JSON file (can be gzipped)
+
+    :param path_file: (str): Path for source file
+    :return: object.  Decoded python object; raises `DecodeError`, `UnicodeDecodeError` or `OSError` on failure
+    """
+    with (gzip.open(path_file, 'rb') if path_file.endswith(".gz") else open(path_file, 'rb')) as infile:
+        return loads(infile.read())
+
+
+def save_file(path_file, obj, pretty_print=False):
+    """Encode and write a JSON file (gzipped if the path ends in `.gz`)
+
+    Iterators (e.g. generators) found as dictionary values are written as lists, encoded in chunks of `CHUNK_ITEMS`
+    straight into the file, so large outputs never need to be fully built in memory.
+
+    :param path_file: (str): Path for destination file
+    :param obj: (object): python object to serialize
+    :param pretty_print: (bool): Write out in more human-readable (indented) format
+    """
+    stream = None
+    if pretty_print:   # keep stdlib formatting for indented (human-readable) output
+        data = json.dumps(_materialize(obj), indent=4).encode('utf-8')
+    elif _has_iterator(obj):
+        stream = _encode_stream(obj)
+    else:
+        data = dumps(obj).encode('utf-8')
+    with (gzip.open(path_file, 'wb') if path_file.endswith(".gz") else open(path_file, 'wb')) as outfile:
+        if stream is None:
+            outfile.write(data)
+        else:
+            for part in stream:
+                outfile.write(part.encode('utf-8'))
+
+
+def _has_iterator(obj):
+    """Check for iterators as values of a (nested) dictionary"""
+    if isinstance(obj, dict):
+        return any(_has_iterator(x) for x in obj.values())
+    return isinstance(obj, Iterator)
+
+
+def _materialize(obj):
+    """Replace iterators within a (nested) dictionary by lists"""
+    if isinstance(obj, dict):
+        return {k: _materialize(v) for k, v in obj.items()}
+    return list(obj) if isinstance(obj, Iterator) else obj
+
+
+def _encode_stream(obj):
+    """Yield the JSON text of an object piece by piece, with the same separators as `save_file` (string keys only)"""
+    encode, sep_item, sep_key = dumps, ", ", ": "
+    if isinstance(obj, dict) and _has_iterator(obj):
+        yield "{"
+        for idx, (key, value) in enumerate(obj.items()):
+            yield (sep_item if idx else "") + encode(str(key)) + sep_key
+            yield from _encode_stream(value)
+        yield "}"
+    elif isinstance(obj, Iterator):
+        yield "["
+        sep_chunk = ""
+        for chunk in iter(lambda: list(islice(obj, CHUNK_ITEMS)), []):
+            yield sep_chunk + encode(chunk)[1:-1]   # items without the list brackets
+            sep_chunk = sep_item
+        yield "]"
+    else:
+        yield encode(obj)
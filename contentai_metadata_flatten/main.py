@@ -19,9 +19,11 @@
 # -*- coding: utf-8 -*-
 
 import sys
+import os
 import argparse
 from pathlib import Path
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 import contentaiextractor as contentai
@@ -32,7 +34,34 @@ if __name__ == '__main__':
     if pathRoot not in sys.path:
         sys.path.append(pathRoot)
 
-from contentai_metadata_flatten import parsers, generators
+from contentai_metadata_flatten import parsers, generators, join, metrics
+
+
+def _parse_extractor(parser_name, path_source, config, logger=None, profile=False):
+    """Helper to instantiate and run a single parser by name; may be executed in a worker process
+
+    :param parser_name: (str): name of the parser (e.g. `dsai_metadata`)
+    :param path_source: (str): path of the content/result directory for input
+    :param config: (dict): runtime configuration passed to the parser
+    :param profile: (bool): measure the parse and its input reads (added v1.8.0)
+    :return: (tuple): result of parsing (DataFrame) or None on failure, and list of metrics records
+    """
+    if logger is None:
+        logger = logging.getLogger()
+    list_parser = parsers.get_by_name(parser_name)
+    if not list_parser:
+        return None, []
+    profiler = metrics.Profiler(enabled=profile, trace_memory=config.get('metrics_memory', False)).start()   # traced in a worker process
+    try:
+        with profiler.stage("parse", extractor=parser_name) as record:
+            parser_instance = list_parser[0]['obj'](path_source, logger=logger)   # create instance
+            df = parser_instance.parse(config)  # attempt to process
+            record["bytes_in"] = parser_instance.load_stats["bytes_in"]
+            record["rows_out"] = 0 if df is None else len(df)
+        profiler.add("load", extractor=parser_name, **{key: parser_instance.load_stats[key] for key in ["wall_s", "cpu_s", "bytes_in"]})
+    finally:
+        profiler.stop()
+    return df, profiler.records
 
 
 def flatten(input_params=None, args=None, logger=None):
@@ -65,6 +94,10 @@ def flatten(input_params=None, args=None, logger=None):
                             help='check for this one-line file path with number of seconds offset according to `time_offset` rules; *(added v1.4.0)*')
     submain.add_argument('--all_frames', dest='all_frames', default=False, action='store_true', 
                             help='for video-based events, log all instances in box or just the center')
+    submain.add_argument('--workers', dest='workers', type=int, default=1, 
+                            help='number of worker processes for parsing extractors in parallel (*default=1*, 0=all cores) *(added v1.5.0)*')
+    submain.add_argument('--streaming', dest='streaming', default=False, action='store_true', 
+                            help='incrementally parse huge JSON inputs for supported extractors (requires `ijson`) instead of loading whole documents *(added v1.5.0)*')
     submain = parser.add_argument_group('output modulation')
     submain.add_argument('--generator', dest='generator', type=str, default="*", 
                             help='specify one generator for output (*=all, empty/''=none, e.g. `flattened_csv`)')
@@ -72,6 +105,16 @@ def flatten(input_params=None, args=None, logger=None):
                             help="compress output CSVs instead of raw write (*default=True*, e.g. append ‘.gz’)")
     submain.add_argument('--force_overwrite', dest='force_overwrite', default=False, action='store_true', 
                             help="compforce existing files to be overwritten (*default=False*)")
+    submain.add_argument('--incremental', dest='incremental', default=False, action='store_true', 
+                            help="append or merge only new events into existing CSVs with a sidecar index instead of rewriting them (*default=False*) *(added v1.6.0)*")
+    submain.add_argument('--segment_by', dest='segment_by', type=str, default="", 
+                            help="also write a summary of events overlapping each segment of this tag type (*default=''*, e.g. `shot` or `scene`) *(added v1.7.0)*")
+    submain.add_argument('--metrics', dest='metrics', default=False, action='store_true', 
+                            help="measure time, memory and sizes of each stage, returned as `metrics` (*default=False*) *(added v1.8.0)*")
+    submain.add_argument('--metrics_path', dest='metrics_path', type=str, default="", 
+                            help="also write stage metrics to this JSON (or `.csv`) file, implies `metrics` (*default=''*) *(added v1.8.0)*")
+    submain.add_argument('--metrics_memory', dest='metrics_memory', default=False, action='store_true', 
+                            help="with `metrics`, also trace allocations for peak memory of each stage (about 3x slower) (*default=False*) *(added v1.8.0)*")
 
     if args is not None:
         config = vars(parser.parse_args(args))
@@ -103,6 +146,8 @@ def flatten(input_params=None, args=None, logger=None):
     path_result = Path(config['path_result'])
     if not path_result.exists():
         path_result.mkdir(parents=True)
+    profile = bool(config.get('metrics') or config.get('metrics_path'))
+    profiler = metrics.Profiler(enabled=profile, trace_memory=config.get('metrics_memory', False)).start()   # per-stage measurements (added v1.8.0)
 
     list_parser_modules = parsers.get_by_name(config['extractor'] if len(config['extractor']) else None)
     list_generator_modules = []
@@ -112,58 +157,114 @@ def flatten(input_params=None, args=None, logger=None):
     if not path_source.is_dir():
         path_source = path_source.parent
     path_source = str(path_source.resolve())
+    with profiler.stage("discover"):
+        parsers.DirectoryIndex.get(path_source, refresh=True)   # walk input directories once per run
 
     need_generation = False if list_generator_modules else True  # allow empty generator list
-    map_outputs = {}
-    set_results = set()
-
+    list_jobs = []
     result_files = {}
-    result_data = []
+    list_frames = []
+    list_frame_names = []
 
     for parser_obj in list_parser_modules:  # iterate through auto-discovered packages
+        map_outputs = {}
         for generator_obj in list_generator_modules:  # iterate through auto-discovered packages
             generator_instance = generator_obj['obj'](str(path_result), logger=logger)   # create instance
             generator_name = generator_obj['name']
             map_outputs[generator_name] = {'module': generator_instance, 'path': generator_instance.get_output_path(parser_obj['name'])}
-            if "compressed" in config and config["compressed"]:  # allow compressed version
+            if "compressed" in config and config["compressed"] and generator_instance.is_compressible:  # allow compressed version
                 map_outputs[generator_name]["path"] += ".gz"
             need_generation |= (generator_instance.is_universal or not Path(map_outputs[generator_name]["path"]).exists())
+        list_jobs.append({"parser": parser_obj, "outputs": map_outputs, "need_generation": need_generation,
+                          "parse": need_generation or config['force_overwrite']})
 
-        df = None
-        if not need_generation and not config['force_overwrite']:
-            logger.info(f"Skipping re-process of {config['path_result']}...")
-        else:
-            parser_instance = parser_obj['obj'](path_source, logger=logger)   # create instance
-        
-            if config["verbose"]:
-                logger.info(f"ContentAI arguments: {config}")
-            df = parser_instance.parse(config)  # attempt to process
+    # parse in a pool of processes if requested (added v1.5.0); generators are still fed in discovery order
+    num_workers = config['workers'] if config['workers'] > 0 else os.cpu_count()
+    num_parse = len([job for job in list_jobs if job['parse']])
+    executor = None
+    if num_workers > 1 and num_parse > 1:
+        logger.info(f"Parsing {num_parse} extractors with {min(num_workers, num_parse)} worker processes...")
+        executor = ProcessPoolExecutor(max_workers=min(num_workers, num_parse))
+        for job in list_jobs:
+            if job['parse']:
+                job['future'] = executor.submit(_parse_extractor, job['parser']['name'], path_source, config, profile=profile)
+
+    try:
+        for job in list_jobs:
+            parser_obj = job['parser']
+            map_outputs = job['outputs']
+            need_generation = job['need_generation']
 
-            if df is None:  # skip bad results
-                if len(config['extractor']):
-                    logger.warning(f"Specified extractor `{config['extractor']}` failed to find data. " \
-                        f"Verify that input directory {path_source} points directly to file...")
-
-        if df is not None:
-            if config['time_offset'] != 0:  # need offset?
-                logger.info(f"Applying time offset of {config['time_offset']} seconds to {len(df)} events ('{parser_obj['name']}')...")
-                for col_name in ['time_begin', 'time_end', 'time_event']:
-                    df[col_name] += config['time_offset']
-            df.drop(df[df["time_begin"] < 0].index, inplace=True)  # drop rows if trimmed from front
-            result_data += df.to_dict(orient='records')
-
-            for generator_name in map_outputs:  # iterate through auto-discovered packages
-                if need_generation or not Path(map_outputs[generator_name]["path"]).exists():
-                    num_items = map_outputs[generator_name]['module'].generate(map_outputs[generator_name]["path"], config, df)  # attempt to process
-                    logger.info(f"Wrote {num_items} items as '{generator_name}' to result file '{map_outputs[generator_name]['path']}'")
+            df = None
+            if not job['parse']:
+                logger.info(f"Skipping re-process of {config['path_result']}...")
+            else:
+                if config["verbose"]:
+                    logger.info(f"ContentAI arguments: {config}")
+                if 'future' in job:   # wait for the worker process to finish
+                    df, list_records = job['future'].result()
                 else:
-                    logger.info(f"Skipping re-generate of {generator_name} to file '{map_outputs[generator_name]['path']}''...")
-                result_files[map_outputs[generator_name]["path"]] = {"generator": generator_name, "path": map_outputs[generator_name]["path"]}
+                    df, list_records = _parse_extractor(parser_obj['name'], path_source, config, logger=logger, profile=profile)
+                profiler.extend(list_records)
+
+                if df is None:  # skip bad results
+                    if len(config['extractor']):
+                        logger.warning(f"Specified extractor `{config['extractor']}` failed to find data. " \
+                            f"Verify that input directory {path_source} points directly to file...")
+
+            if df is not None:
+                with profiler.stage("time_offset", extractor=parser_obj['name']) as record:
+                    parsers.categorize(df)   # low-cardinality text as categoricals (added v1.5.0)
+                    if config['time_offset'] != 0:  # need offset?
+                        logger.info(f"Applying time offset of {config['time_offset']} seconds to {len(df)} events ('{parser_obj['name']}')...")
+                        for col_name in ['time_begin', 'time_end', 'time_event']:
+                            df[col_name] += config['time_offset']
+                    df.drop(df[df["time_begin"] < 0].index, inplace=True)  # drop rows if trimmed from front
+                    record["rows_out"] = len(df)
+                if len(df):
+                    list_frames.append(df)
+                    list_frame_names.append(parser_obj['name'])
+
+                for generator_name in map_outputs:  # iterate through auto-discovered packages
+                    if need_generation or not Path(map_outputs[generator_name]["path"]).exists():
+                        with profiler.stage("generate", extractor=parser_obj['name'], generator=generator_name) as record:
+                            num_items = map_outputs[generator_name]['module'].generate(map_outputs[generator_name]["path"], config, df)  # attempt to process
+                            record["rows_out"] = num_items
+                        logger.info(f"Wrote {num_items} items as '{generator_name}' to result file '{map_outputs[generator_name]['path']}'")
+                    else:
+                        logger.info(f"Skipping re-generate of {generator_name} to file '{map_outputs[generator_name]['path']}''...")
+                    result_files[map_outputs[generator_name]["path"]] = {"generator": generator_name, "path": map_outputs[generator_name]["path"]}
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
+    if config.get('segment_by') and list_frames:   # per-segment summary of all parsed events (added v1.7.0)
+        with profiler.stage("generate", generator="segment_by") as record:
+            df_summary = join.segment_summary(parsers.concat_events(list_frames), config['segment_by'])
+            path_summary = str(path_result.joinpath(f"segments_{config['segment_by']}.csv"))
+            if "compressed" in config and config["compressed"]:
+                path_summary += ".gz"
+            df_summary.to_csv(path_summary, index=False)
+            record["rows_out"] = len(df_summary)
+        logger.info(f"Wrote {len(df_summary)} summaries of '{config['segment_by']}' segments to result file '{path_summary}'")
+        result_files[path_summary] = {"generator": "segment_by", "path": path_summary}
+
+    if list_frames:  # if valid data, add them here...
+        result_dict['data'] = []
+        for parser_name, df in zip(list_frame_names, list_frames):
+            with profiler.stage("to_dict", extractor=parser_name) as record:
+                list_records = parsers.to_records(parsers.details_legacy(df))
+                record["rows_out"] = len(list_records)
+            result_dict['data'] += list_records
+    profiler.stop()
+    if profile:
+        result_dict['metrics'] = profiler.records
+        if config.get('metrics_path'):
+            profiler.save(config['metrics_path'])
+            logger.info(f"Wrote {len(profiler.records)} stage metrics to '{config['metrics_path']}'")
+            result_files[config['metrics_path']] = {"generator": "metrics", "path": config['metrics_path']}
     if result_files:  # if valid output files, add them here...
         result_dict['generated'] = list(result_files.values())
-    if result_data:  # if valid data, add them here...
-        result_dict['data'] = result_data
 
     # resolve and return fully qualified path
     return result_dict
@@ -0,0 +1,130 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+
+try:
+    import resource   # peak resident memory, not on Windows
+except ImportError:
+    resource = None
+
+from contentai_metadata_flatten import json_backend
+
+
+FIELDS = ["stage", "extractor", "generator", "wall_s", "cpu_s", "mem_peak_bytes", "rss_peak_bytes", "bytes_in", "rows_out"]
+
+
+def rss_peak():
+    """Peak resident memory of this process so far in bytes (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024   # kilobytes except on macOS
+
+
+class Profiler():
+    """Collects one record of wall time, CPU time, memory and sizes for each stage of a run (e.g. the parse of 
+    one extractor or one generator writing it), for finding which extractor and generator pair is slow.
+
+    Memory is the peak resident size of the process at the end of the stage and, only while allocations are 
+    traced (see `start`, which slows a run about threefold), the peak of `tracemalloc` above the start of the 
+    stage; stages may not nest, as each resets the traced peak.  Records from worker processes are added with 
+    `extend`.  *(added v1.8.0)*
+    """
+    def __init__(self, enabled=True, trace_memory=False):
+        """Construct a profiler
+
+        :param enabled: (bool): collect records; when False, `stage` only yields a record that is thrown away
+        :param trace_memory: (bool): trace allocations with `tracemalloc` from `start` to `stop`
+        """
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.records = []
+        self._started = False
+
+    def start(self):
+        """Begin tracing allocations if requested (and not already traced), to measure `mem_peak_bytes`"""
+        if self.enabled and self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        return self
+
+    def stop(self):
+        """Stop tracing allocations if started by `start`"""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    @contextmanager
+    def stage(self, stage, extractor=None, generator=None):
+        """Measure a stage, e.g. `with profiler.stage("parse", extractor=name) as record: record["rows_out"] = len(df)`
+
+        :param stage: (str): name of the stage (e.g. `discover`, `parse`, `generate`)
+        :param extractor: (str): extractor being processed, if any
+        :param generator: (str): generator being run, if any
+        :return: dict.  The record, where the stage may set `bytes_in` and `rows_out`
+        """
+        record = {"stage": stage, "extractor": extractor, "generator": generator, "bytes_in": None, "rows_out": None}
+        if not self.enabled:
+            yield record
+            return
+        is_tracing = tracemalloc.is_tracing()
+        if is_tracing:
+            tracemalloc.reset_peak()
+            mem_start = tracemalloc.get_traced_memory()[0]
+        time_wall, time_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_s"] = time.perf_counter() - time_wall
+            record["cpu_s"] = time.process_time() - time_cpu
+            record["mem_peak_bytes"] = tracemalloc.get_traced_memory()[1] - mem_start if is_tracing else None
+            record["rss_peak_bytes"] = rss_peak()
+            self.records.append({key: record.get(key) for key in FIELDS})
+
+    def add(self, stage, extractor=None, generator=None, **values):
+        """Add a record measured elsewhere (e.g. input loading accumulated by a parser)
+
+        :param stage: (str): name of the stage
+        :param values: (dict): measured fields, e.g. `wall_s`, `cpu_s` or `bytes_in`
+        """
+        if self.enabled:
+            record = {"stage": stage, "extractor": extractor, "generator": generator, **values}
+            self.records.append({key: record.get(key) for key in FIELDS})
+
+    def extend(self, list_records):
+        """Add records collected by another profiler (e.g. in a worker process)"""
+        if self.enabled and list_records:
+            self.records.extend(list_records)
+
+    def save(self, path_file):
+        """Write the records as CSV (if the path ends in `.csv` or `.csv.gz`) or JSON
+
+        :param path_file: (str): destination path
+        """
+        if ".csv" in path_file:
+            pd.DataFrame(self.records, columns=FIELDS).to_csv(path_file, index=False)
+        else:
+            json_backend.save_file(path_file, self.records, pretty_print=True)
@@ -18,14 +18,18 @@
 # ===============LICENSE_END=========================================================
 # -*- coding: utf-8 -*-
 
-import pkgutil
-import importlib
-
 import json
 import re
 import math
 import gzip
+import os
 from os import path
+import threading
+import time
+from contextlib import contextmanager
+from collections import deque, OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
 from pathlib import Path
 
@@ -33,9 +37,332 @@ import logging
 import warnings
 from sys import stdout as STDOUT
 
+import numpy as np
 import pandas as pd
 
 import contentaiextractor as contentai
+from pytimeparse import parse as pt_parse
+
+try:
+    import ijson   # optional, for streaming of huge JSON inputs (added v1.5.0)
+except ImportError:
+    ijson = None
+
+from .. import json_backend
+from ..registry import Registry
+
+
+class DirectoryIndex():
+    """One-pass index of directories (and the files within them) beneath a content path.
+
+    Replaces repeated `rglob` walks for each extractor and result page with dictionary lookups; 
+    instances are shared by path via `DirectoryIndex.get` *(added v1.5.0)*, keeping the `MAX_ROOTS` 
+    most recently used paths *(bounded v1.8.0)*
+    """
+    MAX_ROOTS = 16
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, path_root):
+        self.path_root = path.abspath(str(path_root))
+        self.mtime_root = self.root_mtime(self.path_root)
+        self.map_dirs = {}    # directory name -> list of matching directories (in `rglob` order)
+        self.map_files = {}   # directory path -> set of file names within it
+        # same traversal as `Path.rglob` (pre-order, no recursion into symlinks), but only once
+        for dir_root, list_dirs, list_files in os.walk(self.path_root):
+            self.map_files[dir_root] = set(list_files)
+            for dir_name in list_dirs:
+                self.map_dirs.setdefault(dir_name, []).append(Path(dir_root).joinpath(dir_name))
+
+    @staticmethod
+    def root_mtime(path_root):
+        """Return the modification time of a root path (None if missing)"""
+        try:
+            return os.stat(path_root).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def get(cls, path_root, refresh=False):
+        """Get the shared index for a content path, building it on first use
+
+        An index is rebuilt automatically when the root itself changes (e.g. an extractor directory is added 
+        or removed); changes deeper in the tree (e.g. new files within an existing extractor directory) are only 
+        seen after a walk forced with `refresh`, which `main.flatten` does once per run.
+
+        :param path_root: (str): root path for content (e.g. a job's result directory)
+        :param refresh: (bool): force a new directory walk
+        :return: DirectoryIndex.  The shared index instance for this path
+        """
+        key_root = path.abspath(str(path_root))
+        with cls._lock:
+            index = cls._cache.get(key_root)
+            if refresh or index is None or index.mtime_root != cls.root_mtime(key_root):
+                index = cls(key_root)
+                cls._cache[key_root] = index
+            cls._cache.move_to_end(key_root)
+            while len(cls._cache) > cls.MAX_ROOTS:   # drop least recently used roots
+                cls._cache.popitem(last=False)
+            return index
+
+    def find_dirs(self, extractor_name):
+        """Return list of directories named `extractor_name` anywhere beneath the root"""
+        return list(self.map_dirs.get(extractor_name, []))
+
+    def find_files(self, dir_search, name_file):
+        """Return list of existing file paths for a name (and its `.gz` variant) in one directory
+
+        :param dir_search: (Path): a directory previously returned by `find_dirs`
+        :param name_file: (str): file name to search for (e.g. `data.json`)
+        :return: list.  Existing paths, plain file first and compressed second
+        """
+        list_names = [name_file, name_file + ".gz"]
+        set_files = self.map_files.get(str(dir_search))
+        if set_files is None or os.sep in name_file:   # not walked (e.g. symlink) or nested name, check disk
+            return [str(dir_search.joinpath(x)) for x in list_names if dir_search.joinpath(x).is_file()]
+        return [str(dir_search.joinpath(x)) for x in list_names if x in set_files]
+
+
+class EventBuilder():
+    """Columnar accumulator for parsed events, replacing lists of per-row dictionaries.
+
+    Each standard column is kept in a typed array (float for times and score, object otherwise) that 
+    grows in doubling chunks; `build` wraps the filled portion of each array in a DataFrame without 
+    copying the numeric columns.  Text columns never given a value (e.g. `tag` for shots) are omitted, 
+    as they were when rows were dictionaries.  *(added v1.5.0)*
+
+    Details are kept structured instead of JSON-encoded on every row *(added v1.6.0)*: a single box 
+    (`{'w','h','l','t'}`, or a raw tuple `(left, top, width, height)` that `build` rounds with the other boxes 
+    in one pass, added v1.7.1) moves to the float columns `box_w`, `box_h`, `box_l`, `box_t`; `transcript` and 
+    `uri` (from a `uri`, `url` or `urls` key) move to their own columns, with the original key order kept in 
+    `details_keys` (moved since v1.8.0, were copies); and `details` holds the remaining dictionary.  Use 
+    `details_legacy` to get the JSON string column back.
+    """
+    COLUMNS_FLOAT = ["time_begin", "time_end", "time_event", "score", "box_w", "box_h", "box_l", "box_t"]
+    COLUMNS_OBJECT = ["source_event", "tag", "tag_type", "details", "extractor", "transcript", "uri", "details_keys"]
+    COLUMNS = ["time_begin", "time_end", "time_event", "source_event", "tag", "tag_type", "score", "details", "extractor"]
+    COLUMNS_DETAILS = ["box_w", "box_h", "box_l", "box_t", "transcript", "uri", "details_keys"]
+    KEYS_BOX = {"w", "h", "l", "t"}
+    KEYS_URI = ["uri", "url", "urls"]
+
+    def __init__(self, extractor=None, capacity=1024):
+        """Construct a new builder
+
+        :param extractor: (str): default value for the `extractor` column
+        :param capacity: (int): initial number of rows to allocate
+        """
+        self.extractor = extractor
+        self._size = 0
+        self._capacity = max(int(capacity), 1)
+        self._columns = {col: np.full(self._capacity, np.nan) for col in self.COLUMNS_FLOAT}
+        self._columns.update({col: np.empty(self._capacity, dtype=object) for col in self.COLUMNS_OBJECT})
+        self._box_rows, self._box_raw = [], []   # raw boxes, written to the box columns by `build`
+        self._int_rows = 0   # rows given integer times by `extend`, kept as integers when that is every row
+        self._key_orders = {}   # one shared tuple for each distinct key order of details
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, column):
+        """Return a (writable) view of the filled portion of one column, e.g. `events["time_end"][-1]`"""
+        return self._columns[column][:self._size]
+
+    def _grow(self):
+        """Double the capacity of every column"""
+        self._capacity *= 2
+        for col in self._columns:
+            arr_new = np.full(self._capacity, np.nan) if col in self.COLUMNS_FLOAT else np.empty(self._capacity, dtype=object)
+            arr_new[:self._size] = self._columns[col][:self._size]
+            self._columns[col] = arr_new
+
+    def append(self, time_begin, time_end=None, time_event=None, source_event=None, tag=None, tag_type=None, 
+               score=None, details=None, extractor=None):
+        """Append a single event; `time_end` and `time_event` default to `time_begin` (an instantaneous event)
+
+        :param details: (dict): long-form details for the event (a JSON string is decoded, an empty string kept)
+        :return: int.  Row index of the new event
+        """
+        if self._size == self._capacity:
+            self._grow()
+        idx = self._size
+        cols = self._columns
+        cols["time_begin"][idx] = time_begin
+        cols["time_end"][idx] = time_begin if time_end is None else time_end
+        cols["time_event"][idx] = time_begin if time_event is None else time_event
+        cols["score"][idx] = score   # None is stored as NaN
+        cols["source_event"][idx] = source_event
+        cols["tag"][idx] = tag
+        cols["tag_type"][idx] = tag_type
+        cols["extractor"][idx] = self.extractor if extractor is None else extractor
+        self._set_details(idx, details)
+        self._size += 1
+        return idx
+
+    def extend(self, time_begin, time_end=None, time_event=None, source_event=None, tag=None, tag_type=None, 
+               score=None, details=None, extractor=None):
+        """Append many events at once, as `append` for each row; every argument is an array (one value per event) 
+        or a single value for all of them  *(added v1.7.1)*
+
+        :param time_begin: (array): begin time of each event; integer arrays (with integer or default `time_end` 
+            and `time_event`) stay integers in `build` if all events have them, as rows of python ints did
+        :param details: (list): long-form details of each event (dict, JSON string or empty), or None
+        :return: range.  Row indices of the new events
+        """
+        time_begin = np.asarray(time_begin)
+        if all(x is None or np.asarray(x).dtype.kind in "iu" for x in [time_begin, time_end, time_event]):
+            self._int_rows += len(time_begin)
+        while self._size + len(time_begin) > self._capacity:
+            self._grow()
+        rows = slice(self._size, self._size + len(time_begin))
+        cols = self._columns
+        cols["time_begin"][rows] = time_begin
+        cols["time_end"][rows] = time_begin if time_end is None else time_end
+        cols["time_event"][rows] = time_begin if time_event is None else time_event
+        cols["score"][rows] = np.nan if score is None else score
+        cols["source_event"][rows] = source_event
+        cols["tag"][rows] = tag
+        cols["tag_type"][rows] = tag_type
+        cols["extractor"][rows] = self.extractor if extractor is None else extractor
+        if details is not None:
+            for idx, details_row in zip(range(rows.start, rows.stop), details):
+                self._set_details(idx, details_row)
+        self._size = rows.stop
+        return range(rows.start, rows.stop)
+
+    def _set_details(self, idx, details):
+        """Store details of one event, moving a box, transcript and uri to their own columns"""
+        cols = self._columns
+        if details and isinstance(details, str):   # legacy callers with pre-encoded details
+            details = json_backend.loads(details)
+        if isinstance(details, dict):
+            key_order = tuple(details)
+            details = dict(details)   # callers often reuse and extend one dict between events
+            box = details.get("box")
+            if type(box) == tuple and len(box) == 4:   # raw (left, top, width, height), rounded by `build`
+                del details["box"]
+                self._box_rows.append(idx)
+                self._box_raw.append(box)
+            elif type(box) == dict and box.keys() == self.KEYS_BOX:
+                del details["box"]
+                cols["box_w"][idx], cols["box_h"][idx] = box["w"], box["h"]
+                cols["box_l"][idx], cols["box_t"][idx] = box["l"], box["t"]
+            is_moved = False
+            if "transcript" in details:
+                cols["transcript"][idx] = details.pop("transcript")
+                is_moved = True
+            for key in self.KEYS_URI:
+                if key in details:
+                    cols["uri"][idx] = details.pop(key)
+                    is_moved = True
+                    break
+            if is_moved:   # restored in this order by `details_legacy`
+                cols["details_keys"][idx] = self._key_orders.setdefault(key_order, key_order)
+        cols["details"][idx] = details
+
+    def build(self):
+        """Produce a DataFrame (standard column order) of the events, or None if there are none
+
+        :return: DataFrame.  All events appended so far
+        """
+        if not self._size:
+            return None
+        dict_columns = {}
+        if self._box_rows:
+            arr_raw = np.array(self._box_raw, dtype=float)
+            for idx_col, col in enumerate(["box_l", "box_t", "box_w", "box_h"]):
+                self._columns[col][self._box_rows] = arr_raw[:, idx_col]
+            self._box_rows, self._box_raw = [], []
+        dict_boxes = {}
+        if not np.isnan(self._columns["box_w"][:self._size]).all():   # normalize all boxes at once
+            dict_boxes = Flatten.box_columns(*[self._columns[col][:self._size] for col in ["box_l", "box_t", "box_w", "box_h"]])
+        for col in self.COLUMNS + self.COLUMNS_DETAILS:
+            arr_col = dict_boxes.get(col, self._columns[col][:self._size])
+            if self._int_rows == self._size and col in ["time_begin", "time_end", "time_event"]:
+                arr_col = arr_col.astype(np.int64)
+            if col in self.COLUMNS_DETAILS and col in self.COLUMNS_FLOAT:
+                if not np.isnan(arr_col).all():
+                    dict_columns[col] = arr_col
+            elif col in self.COLUMNS_FLOAT or any(x is not None for x in arr_col):
+                dict_columns[col] = arr_col
+        return categorize(pd.DataFrame(dict_columns, copy=False))
+
+
+def parse_timecode(timecode):
+    """Parse a clock timecode `H:MM:SS` or `H:MM:SS.fffffff` (e.g. from Azure) to seconds without regular expressions;
+    other strings fall back to `pytimeparse`, with the same results (int without a fraction, float with)
+    (added v1.7.1)
+
+    :param timecode: (str): time expression
+    :return: int, float or None.  Seconds, None if the string is not a time expression
+    """
+    list_parts = timecode.split(":")
+    if len(list_parts) == 3 and timecode.isascii():
+        str_hours, str_mins, str_secs = list_parts
+        str_whole, _, str_frac = str_secs.partition(".")
+        if str_hours.isdigit() and len(str_mins) == 2 and str_mins.isdigit() and len(str_whole) == 2 and str_whole.isdigit():
+            if str_secs == str_whole:
+                return int(str_hours) * 3600 + int(str_mins) * 60 + int(str_whole)
+            if str_frac.isdigit():
+                return float(str_hours) * 3600 + float(str_mins) * 60 + float(str_secs)
+    return pt_parse(timecode)
+
+
+class KeywordMatcher():
+    """Multi-pattern substring matcher (Aho-Corasick automaton) for scanning text against many keywords at once.
+
+    Built once for a keyword list, `search` walks each text a single time and reports every keyword that 
+    appears anywhere in it (overlapping or nested), the same as testing `keyword.lower() in text.lower()` 
+    for each keyword, but in time linear in the text instead of the number of keywords.  *(added v1.7.1)*
+    """
+    def __init__(self, list_keywords, ignore_case=True):
+        """Compile the automaton
+
+        :param list_keywords: (list): keywords (str) to find; duplicates are reported once per position in the list
+        :param ignore_case: (bool): compare lowercased keywords and text (default=True)
+        """
+        self.ignore_case = ignore_case
+        self._goto = [{}]   # transitions of each state by character
+        self._output = [[]]   # keyword positions ending at each state (including by suffix)
+        for idx_keyword, keyword in enumerate(list_keywords):
+            state = 0
+            for char in (keyword.lower() if ignore_case else keyword):
+                if char not in self._goto[state]:
+                    self._goto[state][char] = len(self._goto)
+                    self._goto.append({})
+                    self._output.append([])
+                state = self._goto[state][char]
+            self._output[state].append(idx_keyword)
+
+        # breadth-first, link each state to its longest proper suffix that is also a state
+        self._fail = [0] * len(self._goto)
+        list_queue = list(self._goto[0].values())
+        for state in list_queue:
+            for char, state_next in self._goto[state].items():
+                list_queue.append(state_next)
+                state_fail = self._fail[state]
+                while state_fail and char not in self._goto[state_fail]:
+                    state_fail = self._fail[state_fail]
+                self._fail[state_next] = self._goto[state_fail].get(char, 0)
+                if self._output[self._fail[state_next]]:
+                    self._output[state_next] = self._output[state_next] + self._output[self._fail[state_next]]
+
+    def search(self, text):
+        """Find the keywords contained in a text
+
+        :param text: (str): text to scan
+        :return: list.  Sorted positions (in the keyword list) of keywords found
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        set_found = set(output[0])   # empty keywords are always found
+        state = 0
+        for char in (text.lower() if self.ignore_case else text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                set_found.update(output[state])
+        return sorted(set_found)
+
 
 class Flatten():
     # https://cloud.google.com/video-intelligence/docs/reference/reast/Shared.Types/Likelihood
@@ -44,6 +371,7 @@ class Flatten():
     TAG_TRANSCRIPT = "_transcript_"
     ROUND_DIGITS = 5
     SCORE_DEFAULT = 0.5
+    PAGE_WORKERS = 4   # threads decoding result pages ahead of flattening (added v1.7.1)
 
 
     def __init__(self, path_content, logger=None):
@@ -59,6 +387,8 @@ class Flatten():
             handler.setLevel(logging.DEBUG)
             logger.addHandler(handler)
         self.logger = logger
+        self.load_stats = {"files": 0, "bytes_in": 0, "wall_s": 0.0, "cpu_s": 0.0}   # input reads (added v1.8.0)
+        self._load_lock = threading.Lock()
 
     @staticmethod
     def known_types():
@@ -79,18 +409,32 @@ class Flatten():
         :return: dict.  The loaded dict or an empty dict (`{}`) on error
         """
         if path.exists(path_file):
-            if path_file.endswith(".gz"):
-                infile = gzip.open(path_file, 'rt')
-            else:
-                infile = open(path_file, 'rt')
-            try:
-                return json.load(infile)
-            except json.decoder.JSONDecodeError as e:
-                return {}
-            except UnicodeDecodeError as e:
-                return {}
+            with self._load_measure(path_file):
+                return self._json_decode(path_file)
         return {}
 
+    @contextmanager
+    def _load_measure(self, path_file, timed=True):
+        """Add the size of an input file and the time spent reading it (in this thread) to `load_stats`"""
+        time_wall, time_cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            with self._load_lock:
+                self.load_stats["files"] += 1
+                self.load_stats["bytes_in"] += path.getsize(path_file) if path.exists(path_file) else 0
+                if timed:
+                    self.load_stats["wall_s"] += time.perf_counter() - time_wall
+                    self.load_stats["cpu_s"] += time.thread_time() - time_cpu
+
+    @staticmethod
+    def _json_decode(path_file):
+        """Decode JSON from a plain or gzipped file, closing it afterwards"""
+        try:
+            return json_backend.load_file(path_file)
+        except (json_backend.DecodeError, UnicodeDecodeError, OSError, EOFError) as e:
+            return {}
+
     def text_load(self, path_file):
         """Helper to read text object
 
@@ -103,23 +447,20 @@ class Flatten():
             else:
                 infile = open(path_file, 'rt')
             try:
-                return infile.read()
+                with self._load_measure(path_file):
+                    return infile.read()
             except UnicodeDecodeError as e:
                 return ""
         return ""
 
     def get_extractor_results(self, extractor_name, path, force_retrieve=False, is_json=True):
         """Get results from remote or local location.  Return a dictionary or string (depending on is_json), empty if not found"""
+        self.refresh_extractor_keys(extractor_name, force_retrieve)
+        return self._load_result(extractor_name, path, is_json)
+
+    def _load_result(self, extractor_name, path, is_json=True):
+        """Load one result (remote if listed in the known keys, else local) without refreshing keys; thread-safe"""
         result_data = {} if is_json else ""
-        if force_retrieve or (len(self.extractor_keys) < 1 or self.extractor_name != extractor_name):   # safe way to request without 404/500 error
-            self.extractor_name = extractor_name
-            try:
-                self.extractor_keys = self.get_extractor_keys(extractor_name)
-                self.logger.info(f"Retrieved available keys {self.extractor_keys} for extractor {self.extractor_name} ")
-                if self.extractor_keys is None:
-                    self.extractor_keys = []
-            except Exception as e:
-                self.logger.info(f"Failed to get extractor keys for extractor {self.extractor_name} (error: '{e}')")
         if self.extractor_keys is not None and path in self.extractor_keys:   # have the keys, check for presence
             try:
                 if is_json:
@@ -131,67 +472,315 @@ class Flatten():
                 self.logger.warning(f"Failed to get key data '{path}' for extractor '{extractor_name}'")
 
         if not result_data:  # do we need to load it locally?
-            for dir_search in self.recursive_search(self.path_content, extractor_name):
-                path_file = dir_search.joinpath(path)
-                if is_json:
-                    result_data = self.json_load(str(path_file))
-                    if not result_data:
-                        result_data = self.json_load(str(path_file)+".gz")
-                else:  # not JSON, just return string?
-                    result_data = self.text_load(str(path_file))
-                    if not result_data:
-                        result_data = self.text_load(str(path_file)+".gz")
+            index = DirectoryIndex.get(self.path_content)
+            for dir_search in index.find_dirs(extractor_name):
+                result_data = {} if is_json else ""
+                for path_file in index.find_files(dir_search, path):   # plain file, then gzipped
+                    result_data = self.json_load(path_file) if is_json else self.text_load(path_file)
+                    if result_data:
+                        break
         return result_data
 
 
+    def refresh_extractor_keys(self, extractor_name, force_retrieve=False):
+        """Retrieve (remote) result keys for an extractor unless already known"""
+        if force_retrieve or (len(self.extractor_keys) < 1 or self.extractor_name != extractor_name):   # safe way to request without 404/500 error
+            self.extractor_name = extractor_name
+            try:
+                self.extractor_keys = self.get_extractor_keys(extractor_name)
+                self.logger.info(f"Retrieved available keys {self.extractor_keys} for extractor {self.extractor_name} ")
+                if self.extractor_keys is None:
+                    self.extractor_keys = []
+            except Exception as e:
+                self.logger.info(f"Failed to get extractor keys for extractor {self.extractor_name} (error: '{e}')")
+
     def get_extractor_keys(self, extractor_name):
         return contentai.keys(extractor_name)
 
+    def get_extractor_items(self, extractor_name, path, prefix, run_options=None):
+        """Get the items beneath a (dotted) `prefix` of an extractor's JSON result, e.g. `Faces.item` or 
+        `annotationResults.item.objectAnnotations.item` (`item` steps into each list element).
+
+        With `streaming` enabled in `run_options` (and `ijson` installed), local files are parsed incrementally 
+        so that peak memory does not depend on the size of the whole document; otherwise the document is 
+        loaded with `get_extractor_results` and walked in memory.  *(added v1.5.0)*
+
+        :param extractor_name: (str): name of extractor (directory) to search
+        :param path: (str): file name within the extractor's results (e.g. `data.json`)
+        :param prefix: (str): dotted path of items to return (in `ijson` prefix syntax)
+        :param run_options: (dict): specific runtime information ('streaming'=True/False)
+        :return: iterable.  Items beneath the prefix or None if the document could not be found
+        """
+        if run_options is not None and run_options.get("streaming", False):
+            if ijson is None:
+                self.logger.warning(f"Streaming requested but `ijson` is not installed, loading '{path}' in memory...")
+            else:
+                self.refresh_extractor_keys(extractor_name)
+                if self.extractor_keys is None or path not in self.extractor_keys:   # remote results are loaded in memory
+                    index = DirectoryIndex.get(self.path_content)
+                    list_dirs = index.find_dirs(extractor_name)
+                    list_files = index.find_files(list_dirs[-1], path) if list_dirs else []   # last match, as in `get_extractor_results`
+                    return self._json_stream(list_files[0], prefix) if list_files else None
+
+        dict_data = self.get_extractor_results(extractor_name, path)
+        if not dict_data:
+            return None
+        return self._items_beneath(dict_data, prefix)
+
+    @staticmethod
+    def _items_beneath(dict_data, prefix):
+        """Walk a decoded document to the items beneath a dotted prefix (see `get_extractor_items`)"""
+        list_items = [dict_data]
+        for key in prefix.split(".") if prefix else []:
+            if key == "item":
+                list_items = [x for obj in list_items if isinstance(obj, list) for x in obj]
+            else:
+                list_items = [obj[key] for obj in list_items if isinstance(obj, dict) and key in obj]
+        return list_items
+
+    def find_extractor_pages(self, extractor_name, name_page="result{}.json"):
+        """List the numbered result pages of an extractor (e.g. `result0.json`, `result1.json`, ...), remote 
+        or local, from the first one up to the first missing
+
+        :param extractor_name: (str): name of extractor (directory) to search
+        :param name_page: (str): file name pattern with the page number as `{}`
+        :return: list.  Page file names in order
+        """
+        self.refresh_extractor_keys(extractor_name)
+        set_keys = set(self.extractor_keys or [])
+        index = DirectoryIndex.get(self.path_content)
+        list_dirs = index.find_dirs(extractor_name)
+        list_pages = []
+        while True:
+            name_file = name_page.format(len(list_pages))
+            if name_file not in set_keys and not any(index.find_files(dir_search, name_file) for dir_search in list_dirs):
+                return list_pages
+            list_pages.append(name_file)
+
+    def get_extractor_pages(self, extractor_name, run_options=None, prefix=None, name_page="result{}.json"):
+        """Iterate over the numbered result pages of an extractor in page order, decoding up to `PAGE_WORKERS` 
+        pages ahead in a thread pool while earlier pages are flattened; stops at the first page that is empty 
+        or fails to load  *(added v1.7.1)*
+
+        :param extractor_name: (str): name of extractor (directory) to search
+        :param run_options: (dict): specific runtime information ('streaming'=True/False, see `get_extractor_items`)
+        :param prefix: (str): dotted path of items to return for each page instead of the whole document
+        :param name_page: (str): file name pattern with the page number as `{}`
+        :return: iterable.  Tuples of page file name and decoded page (or its items beneath `prefix`)
+        """
+        list_pages = self.find_extractor_pages(extractor_name, name_page)
+        if prefix is not None and run_options is not None and run_options.get("streaming", False):
+            for name_file in list_pages:   # streamed items are parsed lazily, one page at a time
+                list_items = self.get_extractor_items(extractor_name, name_file, prefix, run_options)
+                if list_items is None:
+                    return
+                yield name_file, list_items
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.PAGE_WORKERS, len(list_pages)))) as executor:
+            iter_pages = iter(list_pages)
+            queue_pages = deque((name_file, executor.submit(self._load_result, extractor_name, name_file)) 
+                                for name_file in islice(iter_pages, self.PAGE_WORKERS))
+            try:
+                while queue_pages:
+                    name_file, future = queue_pages.popleft()
+                    dict_data = future.result()
+                    if not dict_data:
+                        break
+                    for name_next in islice(iter_pages, 1):   # keep a bounded number of pages decoding ahead
+                        queue_pages.append((name_next, executor.submit(self._load_result, extractor_name, name_next)))
+                    yield name_file, dict_data if prefix is None else self._items_beneath(dict_data, prefix)
+            finally:   # stopped at an empty page (or by the caller)
+                for name_file, future in queue_pages:
+                    future.cancel()
+
+    def _json_stream(self, path_file, prefix):
+        """Generator of items beneath a prefix, incrementally parsed from a plain or gzipped JSON file"""
+        with self._load_measure(path_file, timed=False), \
+                (gzip.open(path_file, 'rb') if path_file.endswith(".gz") else open(path_file, 'rb')) as infile:   # parsed along with the items
+            try:
+                for item in ijson.items(infile, prefix, use_float=True):
+                    yield item
+            except (ijson.JSONError, UnicodeDecodeError, OSError, EOFError) as e:
+                self.logger.warning(f"Stopped streaming '{path_file}' early (error: '{e}')")
+
     def recursive_search(self, path_root, extractor_name):
         """Attempt to find a specific extractor directory under the desired path"""
-        list_dirs = []
-        for path_search in Path(path_root).rglob(extractor_name):
-            if path_search.is_dir():
-                list_dirs.append(path_search)
-        return list_dirs
-
-# import other modules
-
-_modules = []
-for module_finder, extractor_name, _ in pkgutil.iter_modules(__path__):
-    parser_module = module_finder.find_module(extractor_name).load_module()
-    parser_obj = getattr(parser_module, "Parser")   # get class template
-    if parser_obj is not None:
-        _modules.append({'obj':parser_obj, 'types':parser_obj.known_types(), 'name':extractor_name})
-
-def get_by_type(type_list=None):
-    """Get parsers with a specific filter for type.
-
-    :param local_list: (list) list of tag type required in output (e.g. ['shot', 'tag']) (default=None or all available)
-    :return list: list of raw "Parser()" classes that are instantiated with input file paths
+        return DirectoryIndex.get(path_root).find_dirs(extractor_name)
+
+    @staticmethod
+    def wide_to_long(df, prefix_label, prefix_score, columns_keep):
+        """Reshape numbered label and score column pairs (e.g. `category0`, `score0`, `category1`, `score1`, ...) 
+        of a wide table into one row per label, without walking the rows  *(added v1.7.1)*
+
+        :param df: (DataFrame): wide table, one row per clip or frame
+        :param prefix_label: (str): prefix of the label columns (e.g. `category`)
+        :param prefix_score: (str): prefix of the score columns (e.g. `score`)
+        :param columns_keep: (list): columns repeated for each label (e.g. timing)
+        :return: DataFrame.  Kept columns, `tag` and `score` by row then number, without empty labels
+        """
+        num_pairs = 0   # pairs are numbered from zero, stop at the first one missing
+        while f"{prefix_label}{num_pairs}" in df.columns and f"{prefix_score}{num_pairs}" in df.columns:
+            num_pairs += 1
+        arr_label = df[[f"{prefix_label}{idx}" for idx in range(num_pairs)]].to_numpy(dtype=object).ravel()
+        arr_score = df[[f"{prefix_score}{idx}" for idx in range(num_pairs)]].to_numpy(dtype=float).ravel()
+        mask_valid = pd.notna(arr_label) & (arr_label != "")
+        df_long = pd.DataFrame({col: np.repeat(df[col].to_numpy(), num_pairs)[mask_valid] for col in columns_keep})
+        df_long["tag"] = pd.Series(arr_label[mask_valid], dtype=object)   # as parsed (no string inference)
+        df_long["score"] = arr_score[mask_valid]
+        return df_long
+
+    @classmethod
+    def round_array(cls, values, digits=None):
+        """Round an array of floats to decimal digits exactly as the builtin `round` does for each value; the 
+        product with the decimal scale is split into its rounded value and error (Dekker) so that values just 
+        above or below a half are not mistaken for exact halves  *(added v1.7.1)*
+
+        :param values: (array): floats to round (NaN stays NaN)
+        :param digits: (int): decimal digits to keep (default=None, `ROUND_DIGITS`)
+        :return: np.array.  Rounded floats
+        """
+        x = np.asarray(values, dtype=float)
+        scale = 10.0 ** (cls.ROUND_DIGITS if digits is None else digits)
+        scaled = x * scale
+        split = 134217729.0 * x   # 2^27 + 1, halves of the mantissas multiply exactly
+        x_hi = split - (split - x)
+        x_lo = x - x_hi
+        split = 134217729.0 * scale
+        scale_hi = split - (split - scale)
+        scale_lo = scale - scale_hi
+        error = ((x_hi * scale_hi - scaled) + x_hi * scale_lo + x_lo * scale_hi) + x_lo * scale_lo
+        rounded = np.rint(scaled)   # exact halves go to even, as the builtin
+        is_half = np.abs(scaled - rounded) == 0.5
+        rounded = np.where(is_half & (error > 0), np.ceil(scaled), np.where(is_half & (error < 0), np.floor(scaled), rounded))
+        return rounded / scale
+
+    @classmethod
+    def box_columns(cls, left, top, width=None, height=None, right=None, bottom=None):
+        """Normalize arrays of boxes, given by size (`width`, `height`) or by far edges (`right`, `bottom`), to 
+        rounded box columns as stored by `EventBuilder`  *(added v1.7.1)*
+
+        :param left: (array): left edge of each box
+        :param top: (array): top edge of each box
+        :param width: (array): width of each box (or give `right`)
+        :param height: (array): height of each box (or give `bottom`)
+        :return: dict.  Arrays `box_w`, `box_h`, `box_l`, `box_t`
+        """
+        left, top = np.asarray(left, dtype=float), np.asarray(top, dtype=float)
+        width = np.asarray(right, dtype=float) - left if width is None else np.asarray(width, dtype=float)
+        height = np.asarray(bottom, dtype=float) - top if height is None else np.asarray(height, dtype=float)
+        return {"box_w": cls.round_array(width), "box_h": cls.round_array(height), 
+                "box_l": cls.round_array(left), "box_t": cls.round_array(top)}
+
+
+# low-cardinality columns stored as pandas categoricals (added v1.5.0)
+CATEGORY_COLUMNS = ["extractor", "source_event", "tag_type", "tag"]
+
+def categorize(df):
+    """Convert low-cardinality text columns of an event DataFrame to categoricals (in place)
+
+    :param df: (DataFrame): events from a parser
+    :return DataFrame: the same DataFrame, for chaining
+    """
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def concat_events(list_df):
+    """Concatenate event DataFrames, keeping categorical columns categorical (with the union of categories)
+
+    :param list_df: (list) list of DataFrames from parsers
+    :return DataFrame: single DataFrame of all events
     """
-    local_list = []
-    if type_list is None:
-        local_list = [local_obj for local_obj in _modules]
-    else:
-        if type(type_list) != list:
-            type_list = [type_list]
-        type_list = set(type_list)  # convert to set
-        local_list = [local_obj for local_obj in _modules if local_obj['types'] is None or len(type_list.intersection(set(local_obj['types']))) > 0]
-    return local_list
-
-
-def get_by_name(name_limit=None):
-    """Get parsers with a specific filter for name.
-    :param name_limit: (str) list of tag type required in output (e.g. 'dsai_metadata', 'azure') (default=None or all available)
-    :return list: list of raw "Parser()" classes that are instantiated with input file paths
+    list_df = [categorize(df) for df in list_df]
+    for col in CATEGORY_COLUMNS:
+        list_cat = [df[col].cat.categories for df in list_df if col in df.columns]
+        if list_cat:
+            cat_union = list_cat[0].append(list_cat[1:]).unique() if len(list_cat) > 1 else list_cat[0]
+            for df in list_df:
+                if col in df.columns and not df[col].cat.categories.equals(cat_union):
+                    df[col] = df[col].cat.set_categories(cat_union)
+    return pd.concat(list_df, ignore_index=True)
+
+
+def to_records(df):
+    """Convert an event DataFrame to a list of dicts (as `to_dict(orient='records')`), sharing one string 
+    object per category instead of repeating it on every row
+
+    :param df: (DataFrame): events, as from `concat_events`
+    :return list: list of dicts, one per event
+    """
+    list_values = []
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            list_cat = df[col].cat.categories.tolist() + [np.nan]   # code -1 (missing) maps to the last entry
+            list_values.append([list_cat[x] for x in df[col].cat.codes.tolist()])
+        else:
+            list_values.append(df[col].tolist())
+    list_columns = list(df.columns)
+    return [dict(zip(list_columns, row)) for row in zip(*list_values)]
+
+
+def details_legacy(df):
+    """Return events with `details` as JSON strings (the format before v1.6.0) and without the structured 
+    detail columns, e.g. for CSV output or the records returned by `main.flatten`
+
+    :param df: (DataFrame): events from a parser (structured or already legacy)
+    :return DataFrame: a new DataFrame with the standard columns only
     """
-    local_list = []
-    if name_limit is None:
-        local_list = [local_obj for local_obj in _modules]
-    else:  # update from "in" to "==" for name compare in v 1.2.2 to avoid partial match (e.g. metadata -> dsai_metadata)
-        local_list = [local_obj for local_obj in _modules if name_limit == local_obj['name']] 
-    return local_list
+    list_struct = [col for col in EventBuilder.COLUMNS_DETAILS if col in df.columns]
+    if "details" not in df.columns or not (list_struct or df["details"].map(type).eq(dict).any()):
+        return df.drop(columns=list_struct)
+    arr_details = df["details"].to_numpy(dtype=object)
+    arr_box = None
+    if "box_w" in df.columns:
+        arr_box = np.column_stack([df[col].to_numpy(dtype=float) for col in ["box_w", "box_h", "box_l", "box_t"]])
+    dict_moved = {col: df[col].to_numpy(dtype=object) for col in ["transcript", "uri", "details_keys"] if col in df.columns}
+    arr_keys = dict_moved.get("details_keys")
+    list_legacy = []
+    for idx, details in enumerate(arr_details):
+        box_obj = None
+        if arr_box is not None and not np.isnan(arr_box[idx, 0]):
+            box = arr_box[idx]
+            box_obj = {"w": float(box[0]), "h": float(box[1]), "l": float(box[2]), "t": float(box[3])}
+        key_order = arr_keys[idx] if arr_keys is not None else None
+        if isinstance(key_order, tuple):   # moved transcript or uri, restore every key in its original position
+            details_prior, details = details or {}, {}
+            for key in key_order:
+                if key in details_prior:
+                    details[key] = details_prior[key]
+                elif key == "box":
+                    details[key] = box_obj
+                else:
+                    value = dict_moved.get("transcript" if key == "transcript" else "uri")
+                    value = None if value is None else value[idx]
+                    details[key] = None if value is not None and value != value else value   # NaN from concatenated frames
+        elif box_obj is not None:
+            details = {"box": box_obj, **(details or {})}
+        if isinstance(details, dict):
+            details = json_backend.dumps(details)
+        list_legacy.append(details)
+    df_legacy = df.drop(columns=list_struct)
+    df_legacy["details"] = np.array(list_legacy, dtype=object) if list_legacy else []
+    return df_legacy
+
+
+def drop_duplicate_events(df):
+    """Drop duplicate events (as `DataFrame.drop_duplicates`), comparing structured details by content
+
+    :param df: (DataFrame): events from a parser
+    :return DataFrame: events without duplicate rows
+    """
+    return df[~details_legacy(df).duplicated()]
+
+
+# modules are listed from a manifest and imported on request (changed v1.8.0, was imported eagerly)
+
+REGISTRY = Registry(__name__, __path__, "Parser")
+get_by_type = REGISTRY.get_by_type
+get_by_name = REGISTRY.get_by_name
 
 def empty_dataframe():
     return pd.DataFrame([], columns=["time_begin", "time_end", "source_event", "tag_type", 
@@ -19,11 +19,9 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-import json
 import re
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -44,23 +42,13 @@ class Parser(Flatten):
         :param: run_options (dict): specific runtime information 
         :returns: (DataFrame): DataFrame on successful decoding and export, None (or exception) otherwise
         """
-        list_items = []
+        events = EventBuilder()
         re_clean = re.compile(r"((faces*|result|data)|([0-9]+$))+")
         re_split = re.compile(r"_+")
 
-        last_load_idx = 0
         suppressed_matches = 0
-        while last_load_idx >= 0:
-            file_search = f"result{last_load_idx}.json"
-            dict_data = self.get_extractor_results(self.EXTRACTOR, file_search)
-            if not dict_data:  # couldn't load anything else...
-                if list_items:
-                    self.logger.info(f"... suppressed {suppressed_matches} duplicate identities on a timestamp...")
-                    return DataFrame(list_items)
-                else:
-                    last_load_idx = -1
-                    break
-
+        # pages (result0.json, result1.json, ...) are decoded ahead in a thread pool (added v1.7.1)
+        for file_search, dict_data in self.get_extractor_pages(self.EXTRACTOR, run_options):
             if run_options["verbose"]:
                 self.logger.info(f"... parsing rekognition_face_collection/{file_search} ")
 
@@ -74,10 +62,8 @@ class Parser(Flatten):
                         score_frame = round(float(local_obj["Similarity"])/100 * float(match_obj["Confidence"])/100, self.ROUND_DIGITS)
                         details_obj = {}
                         if "BoundingBox" in match_obj:
-                            details_obj['box'] = {'w': round(match_obj['BoundingBox']['Width'], self.ROUND_DIGITS), 
-                                'h': round(match_obj['BoundingBox']['Height'], self.ROUND_DIGITS),
-                                'l': round(match_obj['BoundingBox']['Left'], self.ROUND_DIGITS),
-                                't': round(match_obj['BoundingBox']['Top'], self.ROUND_DIGITS) }
+                            box_obj = match_obj['BoundingBox']
+                            details_obj['box'] = (box_obj['Left'], box_obj['Top'], box_obj['Width'], box_obj['Height'])
 
                         # this is a user-specified field, so we have to be creative... (see some examples)
                         #   "faces_Tech_N9Ne_Tech_N9Ne29.jpg",
@@ -93,15 +79,19 @@ class Parser(Flatten):
                                 suppressed_matches += 1
                             seen_faces[face_name] = {"time_begin": time_frame, "source_event": "image", 
                                 "time_end": time_frame, "time_event": time_frame, "tag_type": "identity",
-                                "tag": face_name, "score": score_frame, "details": json.dumps(details_obj),
+                                "tag": face_name, "score": score_frame, "details": details_obj,
                                 "extractor": self.EXTRACTOR}
                         else:
                             suppressed_matches += 1
 
                     # finally, append those highest scoring faces
-                    list_items += list(seen_faces.values())
-            last_load_idx += 1
+                    for seen_obj in seen_faces.values():
+                        events.append(**seen_obj)
+
+        if len(events) > 0:   # return the whole thing as dataframe
+            self.logger.info(f"... suppressed {suppressed_matches} duplicate identities on a timestamp...")
+            return events.build()
 
         if run_options["verbose"]:
-            self.logger.critical(f"No faces found in source 'rekognition_face_collection' ({file_search})")
+            self.logger.critical(f"No faces found in source 'rekognition_face_collection'")
         return None
@@ -18,11 +18,9 @@
 # ===============LICENSE_END=========================================================
 # -*- coding: utf-8 -*-
 
-from pandas import DataFrame
 from os import path
-import json
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -43,18 +41,9 @@ class Parser(Flatten):
         :param: run_options (dict): specific runtime information
         :returns: (DataFrame): DataFrame on successful decoding and export, None (or exception) otherwise
         """
-        list_items = []
-        last_load_idx = 0
-        while last_load_idx >= 0:
-            file_search = f"result{last_load_idx}.json"
-            dict_data = self.get_extractor_results(self.EXTRACTOR, file_search)
-            if not dict_data:  # couldn't load anything else...
-                if list_items:
-                    return DataFrame(list_items)
-                else:
-                    last_load_idx = -1
-                    break
-
+        events = EventBuilder()
+        # pages (result0.json, result1.json, ...) are decoded ahead in a thread pool (added v1.7.1)
+        for file_search, dict_data in self.get_extractor_pages(self.EXTRACTOR, run_options):
             if run_options["verbose"]:
                 self.logger.info(f"... parsing aws_rekognition_video_celebs/{file_search} ")
 
@@ -68,21 +57,21 @@ class Parser(Flatten):
                     time_frame = float(celebrity_obj["Timestamp"])/1000
                     details_obj = {}
                     if "BoundingBox" in local_obj:
-                        details_obj['box'] = {'w': round(local_obj['BoundingBox']['Width'], self.ROUND_DIGITS), 
-                            'h': round(local_obj['BoundingBox']['Height'], self.ROUND_DIGITS),
-                            'l': round(local_obj['BoundingBox']['Left'], self.ROUND_DIGITS), 
-                            't': round(local_obj['BoundingBox']['Top'], self.ROUND_DIGITS) }
+                        box_obj = local_obj['BoundingBox']
+                        details_obj['box'] = (box_obj['Left'], box_obj['Top'], box_obj['Width'], box_obj['Height'])
                     if "Urls" in local_obj and local_obj["Urls"]:
                         details_obj['urls'] = ",".join(local_obj["Urls"])
                     score_frame = round(float(local_obj["Confidence"])/100, self.ROUND_DIGITS                                                                                  )
 
-                    list_items.append({"time_begin": time_frame, "source_event": "face", "tag_type": "identity",
-                        "time_end": time_frame, "time_event": time_frame, "tag": local_obj["Name"],
-                        "score": score_frame, "details": json.dumps(details_obj),
-                        "extractor": self.EXTRACTOR})
-            last_load_idx += 1
+                    events.append(time_begin=time_frame, source_event="face", tag_type="identity",
+                        time_end=time_frame, time_event=time_frame, tag=local_obj["Name"],
+                        score=score_frame, details=details_obj,
+                        extractor=self.EXTRACTOR)
+
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
-            self.logger.critical(f"No celebrity enties found in source 'aws_rekognition_video_celebs' ({file_search})")
+            self.logger.critical(f"No celebrity enties found in source 'aws_rekognition_video_celebs'")
         return None
         
@@ -19,10 +19,8 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-import json
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -43,46 +41,35 @@ class Parser(Flatten):
         :param: run_options (dict): specific runtime information 
         :returns: (DataFrame): DataFrame on successful decoding and export, None (or exception) otherwise
         """
-        list_items = []
+        events = EventBuilder()
         face_feats = {'Smile':'NoSmile', 'Eyeglasses':'NoGlasses', 'Sunglasses':'NoGlasses', 
                       'Gender':None, 'Beard':'NoBeard', 'Mustache':'NoMustache', 
                       'EyesOpen':'EyesClosed', 'MouthOpen':'MouthClosed'} # 'Pose', 'Landmarks', 'Quality']  -- propose we skip these (emz 1/30
         
-        last_load_idx = 0
-        while last_load_idx >= 0:
-            file_search = f"result{last_load_idx}.json"
-            dict_data = self.get_extractor_results(self.EXTRACTOR, file_search)
-            if not dict_data:  # couldn't load anything else...
-                if list_items:
-                    return DataFrame(list_items)
-                else:
-                    last_load_idx = -1
-                    break
-
+        # pages (result0.json, result1.json, ...) are decoded ahead in a thread pool (added v1.7.1)
+        for file_search, list_faces in self.get_extractor_pages(self.EXTRACTOR, run_options, prefix="Faces.item"):
             if run_options["verbose"]:
                 self.logger.info(f"... parsing aws_rekognition_video_faces/{file_search} ")
 
-            for face_obj in dict_data["Faces"]:  # traverse items
+            for face_obj in list_faces:  # traverse items (streamed with 'streaming'=True, added v1.5.0)
                 if "Face" in face_obj:  # validate object
                     local_obj = face_obj["Face"]
                     time_frame = float(face_obj["Timestamp"])/1000
                     score_frame = round(float(local_obj["Confidence"])/100, self.ROUND_DIGITS)
                     if "BoundingBox" in local_obj:
                         details_obj = {}
-                        details_obj['box'] = {'w': round(local_obj['BoundingBox']['Width'], self.ROUND_DIGITS), 
-                            'h': round(local_obj['BoundingBox']['Height'], self.ROUND_DIGITS),
-                            'l': round(local_obj['BoundingBox']['Left'], self.ROUND_DIGITS), 
-                            't': round(local_obj['BoundingBox']['Top'], self.ROUND_DIGITS) }
-                        list_items.append({"time_begin": time_frame, "source_event": "face", 
-                            "time_end": time_frame, "time_event": time_frame, "tag_type": "face",
-                            "tag": "Face", "score": score_frame, "details": json.dumps(details_obj),
-                            "extractor": self.EXTRACTOR})
+                        box_obj = local_obj['BoundingBox']
+                        details_obj['box'] = (box_obj['Left'], box_obj['Top'], box_obj['Width'], box_obj['Height'])
+                        events.append(time_begin=time_frame, source_event="face", 
+                            time_end=time_frame, time_event=time_frame, tag_type="face",
+                            tag="Face", score=score_frame, details=details_obj,
+                            extractor=self.EXTRACTOR)
                     if "Pose" in local_obj:
                         details_obj['pose'] = local_obj["Pose"]
-                        list_items.append({"time_begin": time_frame, "source_event": "face", 
-                            "time_end": time_frame, "time_event": time_frame, "tag_type": "face",
-                            "tag": "Face", "score": score_frame, "details": json.dumps(details_obj),
-                            "extractor": self.EXTRACTOR})
+                        events.append(time_begin=time_frame, source_event="face", 
+                            time_end=time_frame, time_event=time_frame, tag_type="face",
+                            tag="Face", score=score_frame, details=details_obj,
+                            extractor=self.EXTRACTOR)
 
                     # go through all face features (modified 0.5.4, split face attributes)
                     for f in local_obj:
@@ -101,23 +88,24 @@ class Parser(Flatten):
                             score_feat = self.SCORE_DEFAULT
                             f = "Age"
                         if score_feat is not None:
-                            list_items.append({"time_begin": time_frame, "source_event": "face", 
-                                "time_end": time_frame, "time_event": time_frame, "tag_type": "face",
-                                "tag": f, "score": score_feat, "details": json.dumps(details_obj),
-                                "extractor": self.EXTRACTOR})
+                            events.append(time_begin=time_frame, source_event="face", 
+                                time_end=time_frame, time_event=time_frame, tag_type="face",
+                                tag=f, score=score_feat, details=details_obj,
+                                extractor=self.EXTRACTOR)
 
                     # update 0.5.2 - break out emotion to other tag type
                     if "Emotions" in local_obj and local_obj["Emotions"]:
                         for emo_obj in local_obj["Emotions"]:
                             # if score_emo > 0.05   # consider a threshold?
                             score_emo = round(float(emo_obj["Confidence"])/100, self.ROUND_DIGITS)
-                            list_items.append({"time_begin": time_frame, "source_event": "face", 
-                                "time_end": time_frame, "time_event": time_frame, "tag_type": "emotion",
-                                "tag": emo_obj["Type"].capitalize(), "score": score_emo, 
-                                "details": json.dumps(details_obj), "extractor": self.EXTRACTOR})
+                            events.append(time_begin=time_frame, source_event="face", 
+                                time_end=time_frame, time_event=time_frame, tag_type="emotion",
+                                tag=emo_obj["Type"].capitalize(), score=score_emo, 
+                                details=details_obj, extractor=self.EXTRACTOR)
 
-            last_load_idx += 1
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
-            self.logger.critical(f"No faces found in source 'aws_rekognition_video_faces' ({file_search})")
+            self.logger.critical(f"No faces found in source 'aws_rekognition_video_faces'")
         return None
@@ -19,10 +19,8 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-import json
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -43,19 +41,10 @@ class Parser(Flatten):
         :param: run_options (dict): specific runtime information
         :returns: (DataFrame): DataFrame on successful decoding and export, None (or exception) otherwise
         """
-        list_items = []
+        events = EventBuilder()
         
-        last_load_idx = 0
-        while last_load_idx >= 0:
-            file_search = f"result{last_load_idx}.json"
-            dict_data = self.get_extractor_results(self.EXTRACTOR, file_search)
-            if not dict_data:  # couldn't load anything else...
-                if list_items:
-                    return DataFrame(list_items)
-                else:
-                    last_load_idx = -1
-                    break
-
+        # pages (result0.json, result1.json, ...) are decoded ahead in a thread pool (added v1.7.1)
+        for file_search, dict_data in self.get_extractor_pages(self.EXTRACTOR, run_options):
             if run_options["verbose"]:
                 self.logger.info(f"... parsing aws_rekognition_video_person_tracking/{file_search} ")
 
@@ -65,10 +54,8 @@ class Parser(Flatten):
                     time_frame = float(face_obj["Timestamp"])/1000
                     details_obj = {}
                     if "BoundingBox" in local_obj:
-                        details_obj['box'] = {'w': round(local_obj['BoundingBox']['Width'], self.ROUND_DIGITS), 
-                            'h': round(local_obj['BoundingBox']['Height'], self.ROUND_DIGITS),
-                            'l': round(local_obj['BoundingBox']['Left'], self.ROUND_DIGITS), 
-                            't': round(local_obj['BoundingBox']['Top'], self.ROUND_DIGITS) }
+                        box_obj = local_obj['BoundingBox']
+                        details_obj['box'] = (box_obj['Left'], box_obj['Top'], box_obj['Width'], box_obj['Height'])
                     person_idx = "person_" + str(local_obj["Index"])
 
                     if "Face" in local_obj and local_obj["Face"]:
@@ -79,13 +66,14 @@ class Parser(Flatten):
                                 'l': round(face_obj['BoundingBox']['Left'], self.ROUND_DIGITS), 
                                 't': round(face_obj['BoundingBox']['Top'], self.ROUND_DIGITS) }
 
-                    list_items.append({"time_begin": time_frame, "source_event": "image",
-                        "time_end": time_frame, "time_event": time_frame,  "tag_type": "person",
-                        "tag": person_idx, "score": self.SCORE_DEFAULT, "details": json.dumps(details_obj),
-                        "extractor": self.EXTRACTOR})
+                    events.append(time_begin=time_frame, source_event="image",
+                        time_end=time_frame, time_event=time_frame,  tag_type="person",
+                        tag=person_idx, score=self.SCORE_DEFAULT, details=details_obj,
+                        extractor=self.EXTRACTOR)
 
-            last_load_idx += 1
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
-            self.logger.critical(f"No people found in source 'aws_rekognition_video_person_tracking' ({file_search})")
+            self.logger.critical(f"No people found in source 'aws_rekognition_video_person_tracking'")
         return None
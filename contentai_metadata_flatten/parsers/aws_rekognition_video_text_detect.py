@@ -19,11 +19,9 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame
-import json
 import re
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 
 class Parser(Flatten):
@@ -46,18 +44,9 @@ class Parser(Flatten):
         :returns: (DataFrame): DataFrame on successful decoding and export, None (or exception) otherwise
         """
 
-        list_items = []
-        last_load_idx = 0
-        while last_load_idx >= 0:
-            file_search = f"result{last_load_idx}.json"
-            dict_data = self.get_extractor_results(self.EXTRACTOR, file_search)
-            if not dict_data:  # couldn't load anything else...
-                if list_items:
-                    return DataFrame(list_items)
-                else:
-                    last_load_idx = -1
-                    break
-
+        events = EventBuilder()
+        # pages (result0.json, result1.json, ...) are decoded ahead in a thread pool (added v1.7.1)
+        for file_search, dict_data in self.get_extractor_pages(self.EXTRACTOR, run_options):
             if run_options["verbose"]:
                 self.logger.info(f"... parsing {self.EXTRACTOR}/{file_search} ")
 
@@ -72,25 +61,21 @@ class Parser(Flatten):
                     score_detect = round(float(instance_obj["Confidence"]) / 100, self.ROUND_DIGITS)
                     details_obj = { }
                     if "Geometry" in instance_obj and instance_obj["Geometry"]["BoundingBox"]:   # make sure geometry is valid
-                        details_obj['box'] = {'w': round(instance_obj["Geometry"]['BoundingBox']['Width'], self.ROUND_DIGITS), 
-                            'h': round(instance_obj["Geometry"]['BoundingBox']['Height'], self.ROUND_DIGITS),
-                            'l': round(instance_obj["Geometry"]['BoundingBox']['Left'], self.ROUND_DIGITS), 
-                            't': round(instance_obj["Geometry"]['BoundingBox']['Top'], self.ROUND_DIGITS) }
+                        box_obj = instance_obj["Geometry"]['BoundingBox']
+                        details_obj['box'] = (box_obj['Left'], box_obj['Top'], box_obj['Width'], box_obj['Height'])
                     text_type = instance_obj['Type'].lower()
                     if text_type == "line":   # either line (transcript)
                         details_obj['transcript'] = instance_obj['DetectedText']
-                        list_items.append( {"time_begin": time_begin, "source_event": "ocr", "tag_type": "transcript",
-                            "time_end": time_begin, "time_event": time_begin, "tag": Flatten.TAG_TRANSCRIPT,
-                            "score": score_detect, "details": json.dumps(details_obj), "extractor": self.EXTRACTOR})
+                        events.append(time_begin=time_begin, source_event="ocr", tag_type="transcript",
+                            time_end=time_begin, time_event=time_begin, tag=Flatten.TAG_TRANSCRIPT,
+                            score=score_detect, details=details_obj, extractor=self.EXTRACTOR)
                     elif text_type == "word":   # or word
-                        list_items.append( {"time_begin": time_begin, "source_event": "ocr", "tag_type": "word", 
-                            "time_end": time_begin, "time_event": time_begin, "tag": instance_obj['DetectedText'],
-                            "score": score_detect, "details": json.dumps(details_obj), "extractor": self.EXTRACTOR})
-
-            last_load_idx += 1
+                        events.append(time_begin=time_begin, source_event="ocr", tag_type="word", 
+                            time_end=time_begin, time_event=time_begin, tag=instance_obj['DetectedText'],
+                            score=score_detect, details=details_obj, extractor=self.EXTRACTOR)
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'TextDetections' or 'videos' from source '{self.EXTRACTOR}'")
@@ -19,11 +19,9 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-import json
 import re
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder, drop_duplicate_events
 
 
 class Parser(Flatten):
@@ -57,30 +55,30 @@ class Parser(Flatten):
         #           { "confidence": "1.0", "content": "Hello" } ], "type": "pronunciation" }, ... ]
         #       "items },
 
-        list_items = []
+        events = EventBuilder()
 
         for local_obj in dict_data["results"]["items"]:  # traverse items
             if local_obj["type"] == "pronunciation" and "start_time" in local_obj:
                 time_begin = float(local_obj["start_time"])
                 time_end = float(local_obj["end_time"])
                 for trans_obj in local_obj["alternatives"]:   # add new item for this word
-                    list_items.append( {"time_begin": time_begin, "source_event": "speech", "tag_type": "word",
-                        "time_end": time_end, "time_event": time_begin, "tag": trans_obj["content"],
-                        "score": float(trans_obj["confidence"]), "details": "",
-                        "extractor": self.EXTRACTOR})
+                    events.append(time_begin=time_begin, source_event="speech", tag_type="word",
+                        time_end=time_end, time_event=time_begin, tag=trans_obj["content"],
+                        score=float(trans_obj["confidence"]), details="",
+                        extractor=self.EXTRACTOR)
 
-        if len(list_items) > 0:
-            time_begin = list_items[0]['time_begin']
-            time_end = list_items[-1]['time_end']
+        if len(events) > 0:
+            time_begin = events['time_begin'][0]
+            time_end = events['time_end'][-1]
 
             if "transcripts" in dict_data["results"]:
                 for trans_obj in dict_data["results"]["transcripts"]:
                     str_trans = trans_obj["transcript"]
                     num_words = len(re.split(r"\s+", str_trans))
-                    list_items.append( {"time_begin": time_begin, "source_event": "speech", "tag_type": "transcript",
-                        "time_end": time_end, "time_event": time_begin, "tag": Flatten.TAG_TRANSCRIPT,
-                        "score": self.SCORE_DEFAULT, "details": json.dumps({"words": num_words, "transcript": str_trans}),
-                        "extractor": self.EXTRACTOR})
+                    events.append(time_begin=time_begin, source_event="speech", tag_type="transcript",
+                        time_end=time_end, time_event=time_begin, tag=Flatten.TAG_TRANSCRIPT,
+                        score=self.SCORE_DEFAULT, details={"words": num_words, "transcript": str_trans},
+                        extractor=self.EXTRACTOR)
 
         # add speakers as identity?
         if "speaker_labels" in dict_data["results"] and len(dict_data["results"]["speaker_labels"]["segments"]) > 0:
@@ -89,13 +87,13 @@ class Parser(Flatten):
                 time_end = float(local_obj["end_time"])
                 speaker_label = local_obj["speaker_label"].split('_')[-1]
                 # TODO: should we use recognition probability in this interval instead of just 1.0?
-                list_items.append( {"time_begin": time_begin, "source_event": "speech", "tag_type": "identity",
-                    "time_end": time_end, "time_event": time_begin, "tag": f"speaker_{speaker_label}",
-                    "score": self.SCORE_DEFAULT, "details": "",
-                    "extractor": self.EXTRACTOR})
+                events.append(time_begin=time_begin, source_event="speech", tag_type="identity",
+                    time_end=time_end, time_event=time_begin, tag=f"speaker_{speaker_label}",
+                    score=self.SCORE_DEFAULT, details="",
+                    extractor=self.EXTRACTOR)
 
-        if len(list_items) > 0:
-            return DataFrame(list_items).drop_duplicates()
+        if len(events) > 0:
+            return drop_duplicate_events(events.build())
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'results' from source '{self.EXTRACTOR}'")
         return None
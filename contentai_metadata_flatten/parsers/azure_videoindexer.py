@@ -19,13 +19,10 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame
-import json
 import re
+from functools import lru_cache
 
-from pytimeparse import parse as pt_parse
-
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder, parse_timecode
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -48,7 +45,8 @@ class Parser(Flatten):
         """
         dict_data = self.get_extractor_results(self.EXTRACTOR, "data.json")
         re_time_clean = re.compile(r"s$")
-        list_items = []
+        time_parse = lru_cache(maxsize=None)(parse_timecode)   # timecodes repeat across insights, parse each once
+        events = EventBuilder()
 
         if "summarizedInsights" in dict_data:  # overall validation
             insight_obj = dict_data["summarizedInsights"]
@@ -62,10 +60,10 @@ class Parser(Flatten):
                             if detail_name in local_obj and local_obj[detail_name] is not None:  # only if valid
                                 details_obj[detail_map[detail_name]] = local_obj[detail_name]
                         for time_obj in local_obj["appearances"]:  # walk through all appearances
-                            list_items.append({"time_begin": time_obj['startSeconds'], "source_event": "video", "tag_type": "topic",
-                                "time_end": time_obj['endSeconds'], "time_event": time_obj['startSeconds'], "tag": local_obj["name"],
-                                "score":  local_obj['confidence'], "details": json.dumps(details_obj),
-                                "extractor": self.EXTRACTOR})
+                            events.append(time_begin=time_obj['startSeconds'], source_event="video", tag_type="topic",
+                                time_end=time_obj['endSeconds'], time_event=time_obj['startSeconds'], tag=local_obj["name"],
+                                score=local_obj['confidence'], details=details_obj,
+                                extractor=self.EXTRACTOR)
             # end of processing 'summarized insights'
 
         if "videos" in dict_data:  # overall validation
@@ -77,12 +75,12 @@ class Parser(Flatten):
                             if not local_obj["name"].startswith("Unknown"):   # full-fledged celebrity
                                 details_obj = {"title": local_obj["title"], "description": local_obj['description'], 'url': local_obj['imageUrl']}
                                 for time_obj in local_obj["instances"]:  # walk through all appearances
-                                    time_begin = pt_parse(time_obj['start'])
-                                    time_end = pt_parse(time_obj['end'])
-                                    list_items.append({"time_begin": time_begin, "source_event": "face", "tag_type": "identity",
-                                        "time_end": time_end, "time_event": time_begin, "tag": local_obj["name"],
-                                        "score": local_obj['confidence'], "details": json.dumps(details_obj),
-                                        "extractor": self.EXTRACTOR})
+                                    time_begin = time_parse(time_obj['start'])
+                                    time_end = time_parse(time_obj['end'])
+                                    events.append(time_begin=time_begin, source_event="face", tag_type="identity",
+                                        time_end=time_end, time_event=time_begin, tag=local_obj["name"],
+                                        score=local_obj['confidence'], details=details_obj,
+                                        extractor=self.EXTRACTOR)
                             # TODO: handle others that ar emarked as 'unknown'?  (maybe not because no boundign rect)
 
                 if "keywords" in insight_obj:  # loop over keywords
@@ -90,46 +88,46 @@ class Parser(Flatten):
                         # TODO: enable raw keywords?  (note this is not transcript/ASR)
                         if False and "name" in local_obj and "instances" in local_obj:  # validate object
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
-                                list_items.append({"time_begin": time_begin, "source_event": "speech", "tag_type": "keyword",
-                                    "time_end": time_end, "time_event": time_begin, "tag": local_obj["name"],
-                                    "score": self.SCORE_DEFAULT, "details": "",
-                                    "extractor": self.EXTRACTOR})
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
+                                events.append(time_begin=time_begin, source_event="speech", tag_type="keyword",
+                                    time_end=time_end, time_event=time_begin, tag=local_obj["name"],
+                                    score=self.SCORE_DEFAULT, details="",
+                                    extractor=self.EXTRACTOR)
 
                 if "sentiments" in insight_obj:  # loop over sentiment
                     for local_obj in insight_obj['sentiments']:
                         if "sentimentType" in local_obj and "instances" in local_obj:  # validate object
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
-                                list_items.append({"time_begin": time_begin, "source_event": "video", "tag_type": "sentiment",
-                                    "time_end": time_end, "time_event": time_begin, "tag": local_obj["sentimentType"],
-                                    "score": local_obj["averageScore"], "details": "",
-                                    "extractor": self.EXTRACTOR})
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
+                                events.append(time_begin=time_begin, source_event="video", tag_type="sentiment",
+                                    time_end=time_end, time_event=time_begin, tag=local_obj["sentimentType"],
+                                    score=local_obj["averageScore"], details="",
+                                    extractor=self.EXTRACTOR)
 
                 if "emotions" in insight_obj:  # loop over emotions
                     for local_obj in insight_obj['emotions']:
                         if "type" in local_obj and "instances" in local_obj:  # validate object
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
                                 # update to audio-only indicator for azure emotion
-                                list_items.append({"time_begin": time_begin, "source_event": "audio", "tag_type": "emotion",
-                                    "time_end": time_end, "time_event": time_begin, "tag": local_obj["type"],
-                                    "score": time_obj["confidence"], "details": "",
-                                    "extractor": self.EXTRACTOR})
+                                events.append(time_begin=time_begin, source_event="audio", tag_type="emotion",
+                                    time_end=time_end, time_event=time_begin, tag=local_obj["type"],
+                                    score=time_obj["confidence"], details="",
+                                    extractor=self.EXTRACTOR)
 
                 if "audioEffects" in insight_obj:  # loop over audio
                     for local_obj in insight_obj['audioEffects']:
                         if "type" in local_obj and "instances" in local_obj:  # validate object
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
-                                list_items.append({"time_begin": time_begin, "source_event": "audio", "tag_type": "tag",
-                                    "time_end": time_end, "time_event": time_begin, "tag": local_obj["type"],
-                                    "score": self.SCORE_DEFAULT, "details": "",
-                                    "extractor": self.EXTRACTOR})
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
+                                events.append(time_begin=time_begin, source_event="audio", tag_type="tag",
+                                    time_end=time_end, time_event=time_begin, tag=local_obj["type"],
+                                    score=self.SCORE_DEFAULT, details="",
+                                    extractor=self.EXTRACTOR)
 
                 if "labels" in insight_obj:  # loop over labels
                     for local_obj in insight_obj['labels']:
@@ -138,61 +136,61 @@ class Parser(Flatten):
                             if "referenceId" in local_obj:
                                 details_obj["category"] = local_obj["referenceId"]
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
-                                list_items.append({"time_begin": time_begin, "source_event": "video", "tag_type": "tag",
-                                    "time_end": time_end, "time_event": time_begin, "tag": local_obj["name"],
-                                    "score": time_obj["confidence"], "details": json.dumps(details_obj),
-                                    "extractor": self.EXTRACTOR})
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
+                                events.append(time_begin=time_begin, source_event="video", tag_type="tag",
+                                    time_end=time_end, time_event=time_begin, tag=local_obj["name"],
+                                    score=time_obj["confidence"], details=details_obj,
+                                    extractor=self.EXTRACTOR)
 
                 if "framePatterns" in insight_obj:  # loop over frame; update 0.7.0, move to scene type
                     for local_obj in insight_obj['framePatterns']:
                         if "patternType" in local_obj and "instances" in local_obj:  # validate object
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
-                                list_items.append({"time_begin": time_begin, "source_event": "video", "tag_type": "scene",
-                                    "time_end": time_end, "time_event": time_begin, "tag": local_obj["patternType"],
-                                    "score": local_obj['confidence'], "details": "",
-                                    "extractor": self.EXTRACTOR})
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
+                                events.append(time_begin=time_begin, source_event="video", tag_type="scene",
+                                    time_end=time_end, time_event=time_begin, tag=local_obj["patternType"],
+                                    score=local_obj['confidence'], details="",
+                                    extractor=self.EXTRACTOR)
 
                 if "brands" in insight_obj:  # loop over frame
                     for local_obj in insight_obj['brands']:
                         if "name" in local_obj and "instances" in local_obj:  # validate object
                             details_obj = {"url": local_obj["referenceUrl"], "description": local_obj['description']}
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
-                                list_items.append({"time_begin": time_begin, "source_event": "video", "tag_type": "brand",
-                                    "time_end": time_end, "time_event": time_begin, "tag": local_obj["name"],
-                                    "score":  local_obj['confidence'], "details": json.dumps(details_obj),
-                                    "extractor": self.EXTRACTOR})
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
+                                events.append(time_begin=time_begin, source_event="video", tag_type="brand",
+                                    time_end=time_end, time_event=time_begin, tag=local_obj["name"],
+                                    score=local_obj['confidence'], details=details_obj,
+                                    extractor=self.EXTRACTOR)
 
                 if "namedLocations" in insight_obj:  # loop over named entities
                     for local_obj in insight_obj['namedLocations']:
                         if "name" in local_obj and "instances" in local_obj:  # validate object
                             details_obj = {"url": local_obj["referenceUrl"], "description": local_obj['description']}
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
                                 source_type = "image" if time_obj['instanceSource'] == "Ocr" else "speech"
-                                list_items.append({"time_begin": time_begin, "source_event": source_type, "tag_type": "entity",
-                                    "time_end": time_end, "time_event": time_begin, "tag": local_obj["name"],
-                                    "score":  local_obj['confidence'], "details": json.dumps(details_obj),
-                                    "extractor": self.EXTRACTOR})
+                                events.append(time_begin=time_begin, source_event=source_type, tag_type="entity",
+                                    time_end=time_end, time_event=time_begin, tag=local_obj["name"],
+                                    score=local_obj['confidence'], details=details_obj,
+                                    extractor=self.EXTRACTOR)
 
                 if "namedPeople" in insight_obj:  # loop over named entities
                     for local_obj in insight_obj['namedPeople']:
                         if "instances" in local_obj:  # validate object
                             details_obj = {"url": local_obj["referenceUrl"], "description": local_obj['description']}
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
                                 source_type = "image" if time_obj['instanceSource'] == "Ocr" else "speech"
-                                list_items.append({"time_begin": time_begin, "source_event": source_type, "tag_type": "entity",
-                                    "time_end": time_end, "time_event": time_begin, "tag": local_obj["name"],
-                                    "score":  local_obj['confidence'], "details": json.dumps(details_obj),
-                                    "extractor": self.EXTRACTOR})
+                                events.append(time_begin=time_begin, source_event=source_type, tag_type="entity",
+                                    time_end=time_end, time_event=time_begin, tag=local_obj["name"],
+                                    score=local_obj['confidence'], details=details_obj,
+                                    extractor=self.EXTRACTOR)
 
                 # TODO: consider adding 'textualContentModeration'
 
@@ -201,54 +199,53 @@ class Parser(Flatten):
                     for local_obj in insight_obj['visualContentModeration']:
                         if "instances" in local_obj:  # validate object
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
                                 for type_moderation in score_map:
                                     if local_obj[type_moderation] > 0.01:
-                                        list_items.append({"time_begin": time_begin, "source_event": "image",  "tag_type": "moderation",
-                                            "time_end": time_end, "time_event": time_begin, "tag": score_map[type_moderation],
-                                            "score": local_obj[type_moderation], "details": "",
-                                            "extractor": self.EXTRACTOR})
+                                        events.append(time_begin=time_begin, source_event="image",  tag_type="moderation",
+                                            time_end=time_end, time_event=time_begin, tag=score_map[type_moderation],
+                                            score=local_obj[type_moderation], details="",
+                                            extractor=self.EXTRACTOR)
 
                 if "transcript" in insight_obj:  # loop over transcripts
                     for local_obj in insight_obj['transcript']:
                         if "text" in local_obj and "instances" in local_obj and len(local_obj["text"]) > 0:  # validate object
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
-                                list_items.append( {"time_begin": time_begin, "source_event": "speech", "tag_type": "transcript",
-                                    "time_end": time_end, "time_event": time_begin, "tag": Flatten.TAG_TRANSCRIPT,
-                                    "score": float(local_obj["confidence"]), 
-                                    "details": json.dumps({ "transcript": local_obj["text"]}),
-                                    "extractor": self.EXTRACTOR})
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
+                                events.append(time_begin=time_begin, source_event="speech", tag_type="transcript",
+                                    time_end=time_end, time_event=time_begin, tag=Flatten.TAG_TRANSCRIPT,
+                                    score=float(local_obj["confidence"]), 
+                                    details={ "transcript": local_obj["text"]},
+                                    extractor=self.EXTRACTOR)
 
                 if "speakers" in insight_obj:  # loop over speakers (added 0.9.1)
                     for local_obj in insight_obj['speakers']:
                         if "id" in local_obj and "instances" in local_obj and len(local_obj["instances"]) > 0:  # validate object
                             for speaker_obj in local_obj['instances']:
-                                time_begin = pt_parse(speaker_obj['start'])
-                                time_end = pt_parse(speaker_obj['end'])
+                                time_begin = time_parse(speaker_obj['start'])
+                                time_end = time_parse(speaker_obj['end'])
                                 speaker_label = f"speaker_{local_obj['id']}"
                                 # TODO: should we use recognition probability in this interval instead of just 1.0?
-                                list_items.append( {"time_begin": time_begin, "source_event": "speech", "tag_type": "identity",
-                                    "time_end": time_end, "time_event": time_begin, "tag": f"speaker_{speaker_label}",
-                                    "score": self.SCORE_DEFAULT, "details": "",
-                                    "extractor": self.EXTRACTOR})
+                                events.append(time_begin=time_begin, source_event="speech", tag_type="identity",
+                                    time_end=time_end, time_event=time_begin, tag=f"speaker_{speaker_label}",
+                                    score=self.SCORE_DEFAULT, details="",
+                                    extractor=self.EXTRACTOR)
 
                 if "ocr" in insight_obj:  # loop over ocr
                     for local_obj in insight_obj['ocr']:
                         if "text" in local_obj and "instances" in local_obj and len(local_obj["text"]) > 0:  # validate object
-                            local_box = {'box': {'w': round(local_obj['width'], self.ROUND_DIGITS), 'h': round(local_obj['height'], self.ROUND_DIGITS),
-                                                'l': round(local_obj['left'], self.ROUND_DIGITS), 't': round(local_obj['top'], self.ROUND_DIGITS)},
+                            local_box = {'box': (local_obj['left'], local_obj['top'], local_obj['width'], local_obj['height']),
                                         'transcript': local_obj['text'] }
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
-                                list_items.append( {"time_begin": time_begin, "source_event": "ocr", "tag_type": "transcript",
-                                    "time_end": time_end, "time_event": time_begin, "tag": Flatten.TAG_TRANSCRIPT,
-                                    "score": float(local_obj["confidence"]), 
-                                    "details": json.dumps(local_box),
-                                    "extractor": self.EXTRACTOR})
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
+                                events.append(time_begin=time_begin, source_event="ocr", tag_type="transcript",
+                                    time_end=time_end, time_event=time_begin, tag=Flatten.TAG_TRANSCRIPT,
+                                    score=float(local_obj["confidence"]), 
+                                    details=local_box,
+                                    extractor=self.EXTRACTOR)
 
                 if "shots" in insight_obj:  # loop over shot
                     for local_obj in insight_obj['shots']:
@@ -261,31 +258,31 @@ class Parser(Flatten):
                             if 'keyFrames' in local_obj and local_obj['keyFrames']:   # try to get a specific keyframe
                                 key_frame_obj = local_obj['keyFrames'][0]   # grab first frame
                                 if "instances" in key_frame_obj:
-                                    time_event = pt_parse(key_frame_obj['instances'][0]['start'])                            
+                                    time_event = time_parse(key_frame_obj['instances'][0]['start'])                            
 
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
                                 if time_event is None:
                                     time_event = time_begin
-                                list_items.append( {"time_begin": time_begin, "source_event": "video", "tag_type": "shot",
-                                    "time_end": time_end, "time_event": time_event, "tag": "shot",
-                                    "score": self.SCORE_DEFAULT, "details": json.dumps(details_obj),
-                                    "extractor": self.EXTRACTOR})
+                                events.append(time_begin=time_begin, source_event="video", tag_type="shot",
+                                    time_end=time_end, time_event=time_event, tag="shot",
+                                    score=self.SCORE_DEFAULT, details=details_obj,
+                                    extractor=self.EXTRACTOR)
 
                 if "scenes" in insight_obj:  # loop over scenes
                     for local_obj in insight_obj['scenes']:
                         if "instances" in local_obj:  # validate object
                             for time_obj in local_obj["instances"]:  # walk through all appearances
-                                time_begin = pt_parse(time_obj['start'])
-                                time_end = pt_parse(time_obj['end'])
-                                list_items.append( {"time_begin": time_begin, "source_event": "video", "tag_type": "scene",
-                                    "time_end": time_end, "time_event": time_begin, "tag": "scene",
-                                    "score": self.SCORE_DEFAULT, "details": "",
-                                    "extractor": self.EXTRACTOR})
+                                time_begin = time_parse(time_obj['start'])
+                                time_end = time_parse(time_obj['end'])
+                                events.append(time_begin=time_begin, source_event="video", tag_type="scene",
+                                    time_end=time_end, time_event=time_begin, tag="scene",
+                                    score=self.SCORE_DEFAULT, details="",
+                                    extractor=self.EXTRACTOR)
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'summarizedInsights' or 'videos' from source 'azure_videoindexer'")
@@ -19,13 +19,13 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame, read_csv
+from pandas import read_csv
 from io import StringIO
 import json
 
 from pytimeparse import parse as pt_parse
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 
 class Parser(Flatten):
@@ -60,17 +60,17 @@ class Parser(Flatten):
         base_obj = {"source_event": "video", "tag_type": "scene", "tag": "commercial",
                     "extractor": self.EXTRACTOR, "score": self.SCORE_DEFAULT}
 
-        list_items = []
+        events = EventBuilder()
         for annotation_obj in dict_data["commercials"]:  # traverse items
             if "start" in annotation_obj and "end" in annotation_obj:  # validate object
                 item_new = {"time_begin": round(annotation_obj["start"], self.ROUND_DIGITS),
                             "time_end": round(annotation_obj["end"], self.ROUND_DIGITS),
                             "time_event": round(annotation_obj["start"], self.ROUND_DIGITS), "details": ""}
                 item_new.update(base_obj)
-                list_items.append(item_new)
+                events.append(**item_new)
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"No valid events detected for '{self.EXTRACTOR}'")
@@ -19,13 +19,13 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame, read_csv
+from pandas import read_csv
 from io import StringIO
 import json
 
 from pytimeparse import parse as pt_parse
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -77,27 +77,15 @@ class Parser(Flatten):
                 return None
         df_raw[column_timing] = df_raw[column_timing].astype(float)   # convert to better time format
         
-        list_items = []
-        for row_idx, row_data in df_raw.iterrows():
-            base_obj = {"source_event": source_type["type"], "tag_type": "tag", "extractor": self.EXTRACTOR}
-            for col_name in column_timing:  # copy basic timing
-                base_obj[col_name] = row_data[col_name]
-        
-            # iterate through other prefixes
-            idx_prefix = 0
-            while True:
-                label_name = f"{source_type['column_prefix'][0]}{idx_prefix}"
-                score_name = f"{source_type['column_prefix'][1]}{idx_prefix}"
-                if not (label_name in column_clean and score_name in column_clean):  # stop looping
-                    break
-                else:
-                    new_obj = {"score": row_data[score_name], "tag": row_data[label_name]}
-                    new_obj.update(base_obj)
-                    list_items.append(new_obj)
-                idx_prefix += 1
+        # one row per label from numbered column pairs (e.g. category0, score0, ...)
+        df_long = self.wide_to_long(df_raw, source_type['column_prefix'][0], source_type['column_prefix'][1], column_timing)
+        events = EventBuilder(capacity=len(df_long))
+        events.extend(time_begin=df_long["time_begin"].to_numpy(), time_end=df_long["time_end"].to_numpy(), 
+                      time_event=df_long["time_event"].to_numpy(), source_event=source_type["type"], tag_type="tag", 
+                      tag=df_long["tag"].to_numpy(), score=df_long["score"].to_numpy(), extractor=self.EXTRACTOR)
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"No valid events detected for '{self.EXTRACTOR}'")
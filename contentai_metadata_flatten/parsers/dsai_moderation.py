@@ -19,12 +19,11 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame
 import json
 
 from pytimeparse import parse as pt_parse
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -77,7 +76,7 @@ class Parser(Flatten):
 
         score_mapping = {"sexy": "racy", "drawings": "drawing", "hentai": "explicit drawing", 
                          "neutral": "neutral", "porn": "pornography"}
-        list_items = []
+        events = EventBuilder()
 
         if dict_data is None or 'results' not in dict_data or 'config' not in dict_data:
             self.logger.critical(f"Missing nested 'results' from source '{self.EXTRACTOR}'")
@@ -93,12 +92,12 @@ class Parser(Flatten):
                     if score_original in score_obj:
                         local_score = float(score_obj[score_original])
                     if local_score > self.SCORE_THRESHOLD:
-                        list_items.append({"time_begin": time_event, "source_event": "image", "tag_type": "moderation",
-                            "time_end": time_event, "time_event": time_event, "tag": score_mapping[score_original],
-                            "score": local_score, "details": "", "extractor": self.EXTRACTOR})
+                        events.append(time_begin=time_event, source_event="image", tag_type="moderation",
+                            time_end=time_event, time_event=time_event, tag=score_mapping[score_original],
+                            score=local_score, details="", extractor=self.EXTRACTOR)
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"No valid events detected for '{self.EXTRACTOR}'")
@@ -19,10 +19,8 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame
-import json
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -73,7 +71,7 @@ class Parser(Flatten):
         #             "extractor": "azure_videoindexer"
         #         },
 
-        list_items = []
+        events = EventBuilder()
 
         if dict_data is None or 'results' not in dict_data or 'config' not in dict_data:
             self.logger.critical(f"Missing nested 'results' from source '{self.EXTRACTOR}'")
@@ -85,12 +83,12 @@ class Parser(Flatten):
                 for score_name in local_obj['scores']:
                     local_score = local_obj['scores'][score_name]
                     if local_score > self.SCORE_THRESHOLD:
-                        list_items.append({"time_begin": time_begin, "source_event": local_obj["source"], "tag_type": "moderation",
-                            "time_end": time_end, "time_event": time_begin, "tag": score_name, "score": local_score, 
-                            "details": json.dumps({"extractor_source": local_obj["extractor"]}), "extractor": self.EXTRACTOR})
+                        events.append(time_begin=time_begin, source_event=local_obj["source"], tag_type="moderation",
+                            time_end=time_end, time_event=time_begin, tag=score_name, score=local_score, 
+                            details={"extractor_source": local_obj["extractor"]}, extractor=self.EXTRACTOR)
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"No valid events detected for '{self.EXTRACTOR}'")
@@ -19,12 +19,10 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame
-import json
 
 from pytimeparse import parse as pt_parse
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -56,7 +54,7 @@ class Parser(Flatten):
                 self.logger.critical(f"Missing timing array for extractor '{self.EXTRACTOR}', aborting")
             return None
 
-        list_items = []
+        events = EventBuilder()
         for type_classifier in dict_data:
             if type_classifier != "timing" and type(dict_data[type_classifier]) == list:   # not timing, is list
                 for local_obj in dict_data[type_classifier]:   # iterate through all objects
@@ -65,13 +63,13 @@ class Parser(Flatten):
                         for tag_name in local_obj:
                             if tag_name != 'id':
                                 new_obj = {"source_event": "audio", "tag_type": "tag", "tag": tag_name,
-                                            "score": local_obj[tag_name], "details": json.dumps({"model": type_classifier}), 
+                                            "score": local_obj[tag_name], "details": {"model": type_classifier}, 
                                             "extractor": self.EXTRACTOR}
                                 new_obj.update(timing_obj)
-                                list_items.append(new_obj)     
+                                events.append(**new_obj)     
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested sections from source '{self.EXTRACTOR}'")
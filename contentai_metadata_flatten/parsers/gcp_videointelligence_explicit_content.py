@@ -19,10 +19,9 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame
 import re
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -62,17 +61,17 @@ class Parser(Flatten):
                 if "frames" not in annotation_obj["explicitAnnotation"]:  # validate object
                     self.logger.critical(f"Missing nested 'frames' in shot chunk '{annotation_obj['explicitAnnotation']}'")
                     return None
-                list_items = []
+                events = EventBuilder()
                 for frame_item in annotation_obj["explicitAnnotation"]["frames"]:
                     if "timeOffset" in frame_item:
                         time_clean = float(re_time_clean.sub('', frame_item["timeOffset"]))
                         dict_scores = {n:n.split("Likelihood")[0] for n in frame_item.keys() if not n.startswith("time") }
                         for n in dict_scores:  # a little bit of a dance, but flexiblity for future explicit types
-                            list_items.append( {"time_begin": time_clean, "source_event": "image",  "tag_type": "moderation",
-                                "time_end": time_clean, "time_event": time_clean, "tag": dict_scores[n],                   
-                                "score": Flatten.GCP_LIKELIHOOD_MAP[frame_item[n]], "details": "",
-                                "extractor": self.EXTRACTOR})
-                return DataFrame(list_items)
+                            events.append(time_begin=time_clean, source_event="image",  tag_type="moderation",
+                                time_end=time_clean, time_event=time_clean, tag=dict_scores[n],                   
+                                score=Flatten.GCP_LIKELIHOOD_MAP[frame_item[n]], details="",
+                                extractor=self.EXTRACTOR)
+                return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'explicitAnnotation' from source 'gcp_videointelligence_explicit_content'")
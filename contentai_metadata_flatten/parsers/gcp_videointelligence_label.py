@@ -19,11 +19,9 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-import json
 import re
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -53,7 +51,7 @@ class Parser(Flatten):
             return None
 
         # return details from a local entity
-        def extract_entities(entity_item, as_str=True):
+        def extract_entities(entity_item):
             details_obj = {}
             tag_name = "unknown"
             if "entity" in entity_item:
@@ -68,39 +66,37 @@ class Parser(Flatten):
                 for cat_entity in entity_item["categoryEntities"]:
                     if "description" in cat_entity:   # some categories don't have descriptions (fixed 0.9.2)
                         details_obj["categories"][cat_entity["description"]] = cat_entity["entityId"]
-            if as_str:
-                return tag_name, json.dumps(details_obj)
             return tag_name, details_obj
 
         re_time_clean = re.compile(r"s$")
-        list_items = []
+        events = EventBuilder()
         for annotation_obj in dict_data["annotationResults"]:  # traverse items
             # "segments": [{ "segment": { "startTimeOffset": "0s", "endTimeOffset": "13189.109266s" }, 
             #               "confidence": 0.5998325347900391 }
             if "segmentLabelAnnotations" in annotation_obj:  # validate object
                 for segment_item in annotation_obj["segmentLabelAnnotations"]:   # segments
-                    tag_name, str_json = extract_entities(segment_item, True)
+                    tag_name, details_obj = extract_entities(segment_item)
                     if "segments" in segment_item:   # parsing segments
                         for local_seg in segment_item["segments"]:
-                            list_items.append({"source_event": "video", "score": float(local_seg["confidence"]),
-                                "time_begin": float(re_time_clean.sub('', local_seg["segment"]["startTimeOffset"])),
-                                "time_end": float(re_time_clean.sub('', local_seg["segment"]["endTimeOffset"])),
-                                "time_event": float(re_time_clean.sub('', local_seg["segment"]["startTimeOffset"])),
-                                "details": str_json, "extractor": self.EXTRACTOR, "tag_type": "tag",
-                                "tag": tag_name})
+                            events.append(source_event="video", score=float(local_seg["confidence"]),
+                                time_begin=float(re_time_clean.sub('', local_seg["segment"]["startTimeOffset"])),
+                                time_end=float(re_time_clean.sub('', local_seg["segment"]["endTimeOffset"])),
+                                time_event=float(re_time_clean.sub('', local_seg["segment"]["startTimeOffset"])),
+                                details=details_obj, extractor=self.EXTRACTOR, tag_type="tag",
+                                tag=tag_name)
             if "shotLabelAnnotations" in annotation_obj:  # validate object
                 for segment_item in annotation_obj["shotLabelAnnotations"]:  # shots
-                    tag_name, str_json = extract_entities(segment_item, True)
+                    tag_name, details_obj = extract_entities(segment_item)
                     if "segments" in segment_item:  # parsing segments
                         for local_seg in segment_item["segments"]:
-                            list_items.append({"source_event": "image", "score": float(local_seg["confidence"]),
-                                "time_begin": float(re_time_clean.sub('', local_seg["segment"]["startTimeOffset"])),
-                                "time_end": float(re_time_clean.sub('', local_seg["segment"]["endTimeOffset"])),
-                                "time_event": float(re_time_clean.sub('', local_seg["segment"]["startTimeOffset"])),
-                                "details": str_json, "extractor": self.EXTRACTOR, "tag_type": "tag",
-                                "tag": tag_name})
+                            events.append(source_event="image", score=float(local_seg["confidence"]),
+                                time_begin=float(re_time_clean.sub('', local_seg["segment"]["startTimeOffset"])),
+                                time_end=float(re_time_clean.sub('', local_seg["segment"]["endTimeOffset"])),
+                                time_event=float(re_time_clean.sub('', local_seg["segment"]["startTimeOffset"])),
+                                details=details_obj, extractor=self.EXTRACTOR, tag_type="tag",
+                                tag=tag_name)
             # convert list to a dataframe
-            return DataFrame(list_items)
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested knowns 'segmentLabelAnnotations' and 'shotLabelAnnotations' from source 'gcp_videointelligence_label'")
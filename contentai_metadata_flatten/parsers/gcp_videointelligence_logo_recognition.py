@@ -20,11 +20,11 @@
 
 from os import path
 import re
-import json
 import math
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+import numpy as np
+
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -59,7 +59,8 @@ class Parser(Flatten):
         re_time_clean = re.compile(r"s$")
         for annotation_obj in dict_data["annotationResults"]:  # traverse items
             if "logoRecognitionAnnotations" in annotation_obj:  # validate object
-                list_items = []
+                events = EventBuilder()
+                list_frames, list_frame_boxes = [], []   # raw box of each frame and the box list it goes to
                 for logo_item in annotation_obj["logoRecognitionAnnotations"]:
                     details_obj = {}
                     if "entity" not in logo_item:
@@ -77,21 +78,23 @@ class Parser(Flatten):
                                 if "normalizedBoundingBox" in timestamped_item and \
                                         'left' in timestamped_item['normalizedBoundingBox'] and \
                                         'top' in timestamped_item['normalizedBoundingBox']:   # pull box for one item
-                                    local_box = {'w': round(timestamped_item['normalizedBoundingBox']['right'], self.ROUND_DIGITS), 
-                                        'h': round(timestamped_item['normalizedBoundingBox']['bottom'], self.ROUND_DIGITS),
-                                        'l': round(timestamped_item['normalizedBoundingBox']['left'], self.ROUND_DIGITS), 
-                                        't': round(timestamped_item['normalizedBoundingBox']['top'], self.ROUND_DIGITS) }
-                                    local_box['w'] -= local_box['l']
-                                    local_box['h'] -= local_box['t']
-                                    details_obj['box'].append(local_box)
+                                    box_obj = timestamped_item['normalizedBoundingBox']
+                                    list_frames.append((box_obj['left'], box_obj['top'], box_obj['right'], box_obj['bottom']))
+                                    list_frame_boxes.append(details_obj['box'])
                             if "confidence" in track_item:
-                                list_items.append( {"time_begin": float(re_time_clean.sub('', track_item["segment"]["startTimeOffset"])), 
-                                    "time_end": float(re_time_clean.sub('', track_item["segment"]["endTimeOffset"])), 
-                                    "time_event": float(re_time_clean.sub('', timestamped_item["timeOffset"])), 
-                                    "source_event": "video", "tag": logo_item["entity"]["description"], "tag_type": "brand",
-                                    "score": round(track_item["confidence"], self.ROUND_DIGITS), "details": json.dumps(details_obj), 
-                                    "extractor": self.EXTRACTOR})
-                return DataFrame(list_items)
+                                events.append(time_begin=float(re_time_clean.sub('', track_item["segment"]["startTimeOffset"])), 
+                                    time_end=float(re_time_clean.sub('', track_item["segment"]["endTimeOffset"])), 
+                                    time_event=float(re_time_clean.sub('', timestamped_item["timeOffset"])), 
+                                    source_event="video", tag=logo_item["entity"]["description"], tag_type="brand",
+                                    score=round(track_item["confidence"], self.ROUND_DIGITS), details=details_obj, 
+                                    extractor=self.EXTRACTOR)
+
+                if list_frames:   # normalize the boxes of all frames at once (modified v1.7.1), filling each track's list
+                    arr_frames = np.array(list_frames, dtype=float)
+                    dict_box = self.box_columns(arr_frames[:, 0], arr_frames[:, 1], right=arr_frames[:, 2], bottom=arr_frames[:, 3])
+                    for list_box, w, h, l, t in zip(list_frame_boxes, *[dict_box[col].tolist() for col in ["box_w", "box_h", "box_l", "box_t"]]):
+                        list_box.append({'w': w, 'h': h, 'l': l, 't': t})
+                return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'logoRecognitionAnnotations' from source 'gcp_videointelligence_logo_recognition'")
@@ -20,11 +20,11 @@
 
 from os import path
 import re
-import json
 import math
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+import numpy as np
+
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -58,46 +58,50 @@ class Parser(Flatten):
         #       } ]
         #       ... }
 
-        dict_data = self.get_extractor_results(self.EXTRACTOR, "data.json")
-        if "annotationResults" not in dict_data:
+        # items are streamed one object at a time with 'streaming'=True (added v1.5.0)
+        list_objects = self.get_extractor_items(self.EXTRACTOR, "data.json", 
+                                                "annotationResults.item.objectAnnotations.item", run_options)
+        if list_objects is None:
             if run_options["verbose"]:
                 self.logger.critical(f"Missing nested 'annotationResults' from source '{self.EXTRACTOR}'")
             return None
 
-        list_items = []
+        events = EventBuilder()
         re_time_clean = re.compile(r"s$")
-        for annotation_obj in dict_data["annotationResults"]:  # traverse items
-            if "objectAnnotations" in annotation_obj:  # validate object
-                for object_item in annotation_obj["objectAnnotations"]:
-                    details_obj = {}
-                    if "entity" not in object_item:
-                        self.logger.critical(f"Missing nested 'entity' in object chunk '{object_item}'")
-                        return None
-                    details_obj["entity"] = object_item["entity"]["entityId"]
-                    if "frames" in object_item:   # validate data 
-                        details_obj['box'] = []
-                        for frame_item in object_item["frames"]:
-                            if "normalizedBoundingBox" in frame_item and \
-                                    'left' in frame_item['normalizedBoundingBox'] and \
-                                    'top' in frame_item['normalizedBoundingBox']:   # pull box for one item
-                                local_box = {'w': round(frame_item['normalizedBoundingBox']['right'], self.ROUND_DIGITS), 
-                                    'h': round(frame_item['normalizedBoundingBox']['bottom'], self.ROUND_DIGITS),
-                                    'l': round(frame_item['normalizedBoundingBox']['left'], self.ROUND_DIGITS), 
-                                    't': round(frame_item['normalizedBoundingBox']['top'], self.ROUND_DIGITS) }
-                                local_box['w'] -= local_box['l']
-                                local_box['h'] -= local_box['t']
-                                local_box["o"] = round(float(re_time_clean.sub('', frame_item["timeOffset"])), self.ROUND_DIGITS)
-                                details_obj['box'].append(local_box)
-                    if "confidence" in object_item:
-                        time_begin = round(float(re_time_clean.sub('', object_item["segment"]["startTimeOffset"])), self.ROUND_DIGITS)
-                        list_items.append( {
-                            "time_begin": time_begin, "time_event": time_begin,
-                            "time_end": round(float(re_time_clean.sub('', object_item["segment"]["endTimeOffset"])), self.ROUND_DIGITS), 
-                            "source_event": "video", "tag": object_item["entity"]["description"], "tag_type": "tag",
-                            "score": round(object_item["confidence"], self.ROUND_DIGITS), "details": json.dumps(details_obj), 
-                            "extractor": self.EXTRACTOR})
-        if list_items:
-            return DataFrame(list_items)
+        list_frames, list_frame_boxes = [], []   # raw box and offset of each frame, and the box list it goes to
+        for object_item in list_objects:  # traverse items
+            details_obj = {}
+            if "entity" not in object_item:
+                self.logger.critical(f"Missing nested 'entity' in object chunk '{object_item}'")
+                return None
+            details_obj["entity"] = object_item["entity"]["entityId"]
+            if "frames" in object_item:   # validate data 
+                details_obj['box'] = []
+                for frame_item in object_item["frames"]:
+                    if "normalizedBoundingBox" in frame_item and \
+                            'left' in frame_item['normalizedBoundingBox'] and \
+                            'top' in frame_item['normalizedBoundingBox']:   # pull box for one item
+                        box_obj = frame_item['normalizedBoundingBox']
+                        list_frames.append((box_obj['left'], box_obj['top'], box_obj['right'], box_obj['bottom'], 
+                                            float(re_time_clean.sub('', frame_item["timeOffset"]))))
+                        list_frame_boxes.append(details_obj['box'])
+            if "confidence" in object_item:
+                time_begin = round(float(re_time_clean.sub('', object_item["segment"]["startTimeOffset"])), self.ROUND_DIGITS)
+                events.append(
+                    time_begin=time_begin, time_event=time_begin,
+                    time_end=round(float(re_time_clean.sub('', object_item["segment"]["endTimeOffset"])), self.ROUND_DIGITS), 
+                    source_event="video", tag=object_item["entity"]["description"], tag_type="tag",
+                    score=round(object_item["confidence"], self.ROUND_DIGITS), details=details_obj, 
+                    extractor=self.EXTRACTOR)
+
+        if list_frames:   # normalize the boxes of all frames at once (modified v1.7.1), filling each object's list
+            arr_frames = np.array(list_frames, dtype=float)
+            dict_box = self.box_columns(arr_frames[:, 0], arr_frames[:, 1], right=arr_frames[:, 2], bottom=arr_frames[:, 3])
+            for list_box, w, h, l, t, o in zip(list_frame_boxes, *[dict_box[col].tolist() for col in ["box_w", "box_h", "box_l", "box_t"]], 
+                                               self.round_array(arr_frames[:, 4]).tolist()):
+                list_box.append({'w': w, 'h': h, 'l': l, 't': t, 'o': o})
+        if events:
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'objectAnnotations' from source '{self.EXTRACTOR}'")
@@ -20,12 +20,10 @@
 
 from os import path
 import re
-import json
 import math
-from pandas import DataFrame
 import numpy as np
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -63,7 +61,7 @@ class Parser(Flatten):
                 self.logger.critical(f"Missing nested 'annotationResults' from source '{self.EXTRACTOR}'")
             return None
 
-        list_items = []
+        events = EventBuilder()
         re_time_clean = re.compile(r"s$")
         for annotation_obj in dict_data["annotationResults"]:  # traverse items
             if "personDetectionAnnotations" in annotation_obj:  # validate object
@@ -78,25 +76,21 @@ class Parser(Flatten):
                                 if "normalizedBoundingBox" in timed_item and \
                                         'left' in timed_item['normalizedBoundingBox'] and \
                                         'top' in timed_item['normalizedBoundingBox']:   # pull box for one item
-                                    local_box = {'w': round(timed_item['normalizedBoundingBox']['right'], self.ROUND_DIGITS), 
-                                        'h': round(timed_item['normalizedBoundingBox']['bottom'], self.ROUND_DIGITS),
-                                        'l': round(timed_item['normalizedBoundingBox']['left'], self.ROUND_DIGITS), 
-                                        't': round(timed_item['normalizedBoundingBox']['top'], self.ROUND_DIGITS)}
-                                    local_box['w'] -= local_box['l']
-                                    local_box['h'] -= local_box['t']
+                                    box_obj = timed_item['normalizedBoundingBox']
+                                    local_box = (box_obj['left'], box_obj['top'], box_obj['right'] - box_obj['left'], box_obj['bottom'] - box_obj['top'])
                                     time_event = round(float(re_time_clean.sub('', timed_item["timeOffset"])), self.ROUND_DIGITS)
 
                                     # extract attributes as regular tag, but person-sourced
                                     if "attributes" in timed_item:
                                         for attr_item in timed_item["attributes"]:
                                             details_obj = {'box':local_box, 'category': attr_item['name']}
-                                            list_items.append({
-                                                "time_begin": time_begin, "time_event": time_event, "time_end": time_end,
-                                                "source_event": "video", "tag_type": "tag",
-                                                "tag": attr_item["value"], 
-                                                "score": round(attr_item["confidence"], self.ROUND_DIGITS), 
-                                                "details": json.dumps(details_obj), 
-                                                "extractor": self.EXTRACTOR})
+                                            events.append(
+                                                time_begin=time_begin, time_event=time_event, time_end=time_end,
+                                                source_event="video", tag_type="tag",
+                                                tag=attr_item["value"], 
+                                                score=round(attr_item["confidence"], self.ROUND_DIGITS), 
+                                                details=details_obj, 
+                                                extractor=self.EXTRACTOR)
                                     # end attributes
 
                                     # extract skeleton information for people
@@ -111,20 +105,20 @@ class Parser(Flatten):
                                         if avg_score:
                                             avg_score = round(np.average(avg_score), self.ROUND_DIGITS)
                                             details_obj = {'box':local_box, 'category': attr_item['name']}
-                                            list_items.append({
-                                                "time_begin": time_begin, "time_event": time_event, "time_end": time_end,
-                                                "source_event": "image", "tag_type": "person",
-                                                "tag": "Skeleton", 
-                                                "score": round(attr_item["confidence"], self.ROUND_DIGITS), 
-                                                "details": json.dumps(local_skeleton), 
-                                                "extractor": self.EXTRACTOR})
+                                            events.append(
+                                                time_begin=time_begin, time_event=time_event, time_end=time_end,
+                                                source_event="image", tag_type="person",
+                                                tag="Skeleton", 
+                                                score=round(attr_item["confidence"], self.ROUND_DIGITS), 
+                                                details=local_skeleton, 
+                                                extractor=self.EXTRACTOR)
                                     # end landmark parse
                             # end "timestampedObjects" parsing
                 # end "personDetectionAnnotations" parsing
         # end "annotationResults" parsing                    
 
-        if list_items:
-            return DataFrame(list_items)
+        if events:
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'personDetectionAnnotations' from source '{self.EXTRACTOR}'")
@@ -20,9 +20,8 @@
 
 from os import path
 import re
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 
 class Parser(Flatten):
@@ -58,17 +57,17 @@ class Parser(Flatten):
         re_time_clean = re.compile(r"s$")
         for annotation_obj in dict_data["annotationResults"]:  # traverse items
             if "shotAnnotations" in annotation_obj:  # validate object
-                list_items = []
+                events = EventBuilder()
                 for shot_item in annotation_obj["shotAnnotations"]:
                     if "startTimeOffset" not in shot_item:
                         self.logger.critical(f"Missing nested 'startTimeOffset' in shot chunk '{shot_item}'")
                         return None
-                    list_items.append( {"time_begin": float(re_time_clean.sub('', shot_item["startTimeOffset"])), 
-                        "time_end": float(re_time_clean.sub('', shot_item["endTimeOffset"])), 
-                        "time_event": float(re_time_clean.sub('', shot_item["startTimeOffset"])), 
-                        "source_event": "video", "tag": "shot", "score": self.SCORE_DEFAULT, "details": "", "tag_type": "shot",
-                        "extractor": self.EXTRACTOR})
-                return DataFrame(list_items)
+                    events.append(time_begin=float(re_time_clean.sub('', shot_item["startTimeOffset"])), 
+                        time_end=float(re_time_clean.sub('', shot_item["endTimeOffset"])), 
+                        time_event=float(re_time_clean.sub('', shot_item["startTimeOffset"])), 
+                        source_event="video", tag="shot", score=self.SCORE_DEFAULT, details="", tag_type="shot",
+                        extractor=self.EXTRACTOR)
+                return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'shotAnnotations' from source 'gcp_videointelligence_shot_change'")
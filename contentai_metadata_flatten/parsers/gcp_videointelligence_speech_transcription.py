@@ -20,10 +20,8 @@
 
 from os import path
 import re
-import json
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder, drop_duplicate_events
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -54,7 +52,7 @@ class Parser(Flatten):
                 self.logger.critical(f"Missing nested 'annotationResults' from source 'gcp_videointelligence_speech_transcription'")
             return None
 
-        list_items = []
+        events = EventBuilder()
         re_time_clean = re.compile(r"s$")
         for annotation_obj in dict_data["annotationResults"]:  # traverse items
             if "speechTranscriptions" not in annotation_obj:  # validate object
@@ -82,10 +80,10 @@ class Parser(Flatten):
                             time_begin = min(time_begin, time_begin_clean)
                             time_end = max(time_end, time_end_clean)
                             # add new item for this word
-                            list_items.append( {"time_begin": time_begin_clean, "source_event": "speech", "tag_type": "word",
-                                "time_end": time_end_clean, "time_event": time_begin_clean, "tag": word_obj["word"],
-                                "score": float(word_obj["confidence"]), "details": "",
-                                "extractor": self.EXTRACTOR})
+                            events.append(time_begin=time_begin_clean, source_event="speech", tag_type="word",
+                                time_end=time_end_clean, time_event=time_begin_clean, tag=word_obj["word"],
+                                score=float(word_obj["confidence"]), details="",
+                                extractor=self.EXTRACTOR)
                             num_words += 1
 
                             # { ... "confidence": 0.9128385782241821,  "speakerTag": 3 } ...  (added 0.8.6)
@@ -99,10 +97,10 @@ class Parser(Flatten):
                                         reset_speaker = False
                                 if reset_speaker:   # speaker mismatch or restart
                                     if speaker_begin is not None:   # close last speaker segment
-                                        list_items.append( {"time_begin": speaker_begin, "source_event": "speech", "tag_type": "identity",
-                                            "time_end": speaker_end, "time_event": speaker_begin, "tag": f"speaker_{speaker_last}",
-                                            "score": round(speaker_score / speaker_segments, self.ROUND_DIGITS), "details": "",
-                                            "extractor": self.EXTRACTOR})
+                                        events.append(time_begin=speaker_begin, source_event="speech", tag_type="identity",
+                                            time_end=speaker_end, time_event=speaker_begin, tag=f"speaker_{speaker_last}",
+                                            score=round(speaker_score / speaker_segments, self.ROUND_DIGITS), details="",
+                                            extractor=self.EXTRACTOR)
                                     speaker_last = word_obj["speakerTag"]
                                     speaker_begin = time_begin_clean   # reset timing information
                                     speaker_end = time_end_clean
@@ -110,23 +108,23 @@ class Parser(Flatten):
                                     speaker_score = float(word_obj["confidence"])
 
                         if speaker_begin is not None:   # close last speaker segment
-                            list_items.append( {"time_begin": speaker_begin, "source_event": "speech", "tag_type": "identity",
-                                "time_end": speaker_end, "time_event": speaker_begin, "tag": f"speaker_{speaker_last}",
-                                "score": round(speaker_score / speaker_segments, self.ROUND_DIGITS), "details": "",
-                                "extractor": self.EXTRACTOR})
+                            events.append(time_begin=speaker_begin, source_event="speech", tag_type="identity",
+                                time_end=speaker_end, time_event=speaker_begin, tag=f"speaker_{speaker_last}",
+                                score=round(speaker_score / speaker_segments, self.ROUND_DIGITS), details="",
+                                extractor=self.EXTRACTOR)
 
                         if "transcript" in alt_obj:  # generate top-level transcript item, after going through all words
-                            list_items.append( {"time_begin": time_begin, "source_event": "speech", "tag_type": "transcript",
-                                "time_end": time_end, "time_event": time_begin, "tag": Flatten.TAG_TRANSCRIPT,
-                                "score": float(alt_obj["confidence"]), 
-                                "details": json.dumps({"words": num_words, "transcript": alt_obj["transcript"]}),
-                                "extractor": self.EXTRACTOR})
+                            events.append(time_begin=time_begin, source_event="speech", tag_type="transcript",
+                                time_end=time_end, time_event=time_begin, tag=Flatten.TAG_TRANSCRIPT,
+                                score=float(alt_obj["confidence"]), 
+                                details={"words": num_words, "transcript": alt_obj["transcript"]},
+                                extractor=self.EXTRACTOR)
 
 
 
         # added duplicate drop 0.4.1 for some reason this extractor has this bad tendency
-        if len(list_items) > 0:
-            return DataFrame(list_items).drop_duplicates()
+        if len(events) > 0:
+            return drop_duplicate_events(events.build())
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'alternatives' in speechTranscriptions chunks from source 'gcp_videointelligence_speech_transcription'")
         return None
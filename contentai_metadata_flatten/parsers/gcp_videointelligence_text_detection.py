@@ -20,10 +20,8 @@
 
 from os import path
 import re
-import json
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -61,7 +59,7 @@ class Parser(Flatten):
                 self.logger.critical(f"Missing nested 'annotationResults' from source 'gcp_videointelligence_text_detection'")
             return None
 
-        list_items = []
+        events = EventBuilder()
         re_time_clean = re.compile(r"s$")
         for annotation_obj in dict_data["annotationResults"]:  # traverse items
             for local_obj in annotation_obj['textAnnotations']:
@@ -82,15 +80,13 @@ class Parser(Flatten):
                                         x_min = min(x_min, vertex_obj["x"])
                                         y_max = max(y_max, vertex_obj["y"])
                                         y_min = min(y_min, vertex_obj["y"])
-                        details_obj['box'] = {'w': round(x_max - x_min, self.ROUND_DIGITS), 
-                            'h': round(y_max - y_min, self.ROUND_DIGITS),
-                            'l': round(x_min, self.ROUND_DIGITS), 't': round(y_min, self.ROUND_DIGITS) }
-                    list_items.append( {"time_begin": time_begin_clean, "source_event": "ocr", "tag_type": "transcript", 
-                        "time_end": time_end_clean, "time_event": time_begin_clean, "tag": local_obj['text'],
-                        "score": score_detect, "details": json.dumps(details_obj), "extractor": self.EXTRACTOR})
+                        details_obj['box'] = (x_min, y_min, x_max - x_min, y_max - y_min)
+                    events.append(time_begin=time_begin_clean, source_event="ocr", tag_type="transcript", 
+                        time_end=time_end_clean, time_event=time_begin_clean, tag=local_obj['text'],
+                        score=score_detect, details=details_obj, extractor=self.EXTRACTOR)
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested 'textAnnotations' in annotationResults chunks from source '{self.EXTRACTOR}'")
@@ -19,12 +19,11 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame
-import json
+import numpy as np
 
 from pytimeparse import parse as pt_parse
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -55,34 +54,40 @@ class Parser(Flatten):
 
         base_obj = {"source_event": "audio", "tag_type": "tag", "extractor": self.EXTRACTOR}
 
-        list_items = []
-        idx_begin_last = 0
-        time_begin_last = 0
+        # first pass: time of each code (one per second) and the labels under it
+        list_time, list_count = [], []
+        list_tag, list_score, list_details = [], [], []
         for time_code in dict_data:  # step through each second in asset
-            # from this snippit -- https://stackoverflow.com/a/6402859
-            time_begin = sum(int(x) * 60 ** i for i, x in enumerate(reversed(time_code.split(':'))))
-
-            # update prior items to have a good start time
-            if len(list_items):
-                for idx_update in range(idx_begin_last, len(list_items)):
-                    list_items[idx_update]["time_end"] = time_begin
-                time_begin_last = list_items[idx_begin_last]["time_begin"]
-            # interpolate end time las time
-            time_end = (time_begin - time_begin_last) + time_begin
-            idx_begin_last = len(list_items)
-
+            time_begin = 0
+            for time_part in time_code.split(':'):   # base-60 digits, e.g. "01:02:03"
+                time_begin = time_begin * 60 + int(time_part)
+            list_time.append(time_begin)
+            num_items = 0
             if type(dict_data[time_code]) == list:   # not timing, is list
                 for local_obj in dict_data[time_code]:   # iterate through all objects
                     if 'label' in local_obj and 'probability' in local_obj:  # validate the object input
-                        new_obj = {"tag": local_obj['label'],
-                            "time_begin": time_begin, "time_end": time_end,
-                            "time_event": time_begin, "score": round(local_obj['probability'], self.ROUND_DIGITS),
-                            "details": json.dumps({"model": local_obj['label_id']})}
-                        new_obj.update(base_obj)
-                        list_items.append(new_obj)
+                        list_tag.append(local_obj['label'])
+                        list_score.append(round(local_obj['probability'], self.ROUND_DIGITS))
+                        list_details.append({"model": local_obj['label_id']})
+                        num_items += 1
+            list_count.append(num_items)
+
+        # second pass: labels last until the next time code; the final ones as long as the code before 
+        #   (or from zero if nothing came before them)
+        events = EventBuilder(capacity=len(list_tag))
+        if list_tag:
+            time_code_begin = np.array(list_time, dtype=np.int64)   # integer seconds, as the codes
+            num_code = np.array(list_count)
+            time_prior = np.zeros(len(time_code_begin), dtype=np.int64)
+            has_prior = (np.cumsum(num_code) - num_code) > 0   # labels before this code
+            time_prior[1:] = np.where(has_prior[1:], time_code_begin[:-1], 0)
+            time_code_end = np.append(time_code_begin[1:], 2 * time_code_begin[-1] - time_prior[-1])
+            time_begin = np.repeat(time_code_begin, num_code)
+            events.extend(time_begin=time_begin, time_end=np.repeat(time_code_end, num_code), time_event=time_begin, 
+                          tag=list_tag, score=list_score, details=list_details, **base_obj)
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"Missing nested sections from source '{self.EXTRACTOR}'")
@@ -19,16 +19,18 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-from pandas import DataFrame, read_csv
+import numpy as np
+from pandas import read_csv, DataFrame
 from io import StringIO
-import json
 
 from pytimeparse import parse as pt_parse
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 
 class Parser(Flatten):
+    COLUMNS_STATS = ["content_val", "delta_hue", "delta_lum", "delta_sat"]   # frame features summarized per scene
+
     def __init__(self, path_content, logger=None):
         super().__init__(path_content, logger=logger)
         self.EXTRACTOR = "pyscenedetect"
@@ -74,26 +76,33 @@ class Parser(Flatten):
 
         base_obj = {"source_event": "video", "tag_type": "shot", "extractor": self.EXTRACTOR, "score": self.SCORE_DEFAULT}
 
-        list_items = []
-        for row_idx, row_data in df_scenes.iterrows():
-            item_new = {"time_begin": round(row_data["Start Time (seconds)"], self.ROUND_DIGITS),
-                        "time_end": round(row_data["End Time (seconds)"], self.ROUND_DIGITS),
-                        "time_event": round(row_data["Start Time (seconds)"], self.ROUND_DIGITS), "details": ""}
-            item_new.update(base_obj)
-
-            # https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.agg.html
-            df_frame_sub = df_frames[(df_frames["Frame Number"] >= int(row_data["Start Frame"])) & \
-                                     (df_frames["Frame Number"] < int(row_data["End Frame"]))]
-            df_frame_agg = df_frame_sub[["content_val","delta_hue","delta_lum","delta_sat"]].agg(["mean", "min", "max"]).unstack()
-            flat_index = ['_'.join(x) for x in list(df_frame_agg.index.to_flat_index())]
-            df_frame_agg.index = flat_index
-
-            # include features from frames, perhaps as an average, min, and max?
-            item_new["details"] = json.dumps(df_frame_agg.round(self.ROUND_DIGITS).to_dict())
-            list_items.append(item_new)
-
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        # one pass over frames: scenes are contiguous cuts, so the scene of a frame is the last one starting at 
+        #   or before it (if the frame is also before its end); then aggregate every scene at once
+        scene_begin = df_scenes["Start Frame"].to_numpy(dtype=int)
+        scene_end = df_scenes["End Frame"].to_numpy(dtype=int)
+        order = np.argsort(scene_begin, kind="stable")
+        frame_number = df_frames["Frame Number"].to_numpy()
+        idx_found = np.searchsorted(scene_begin[order], frame_number, side="right") - 1
+        scene_id = order[np.maximum(idx_found, 0)]
+        mask_valid = (idx_found >= 0) & (frame_number < scene_end[scene_id])
+        # https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.agg.html
+        df_frame_agg = df_frames.loc[mask_valid, self.COLUMNS_STATS].groupby(scene_id[mask_valid]) \
+            .agg(["mean", "min", "max"]).reindex(range(len(df_scenes)))   # empty scenes as NaN
+        df_frame_agg.columns = ['_'.join(x) for x in df_frame_agg.columns.to_flat_index()]
+
+        # include features from frames, perhaps as an average, min, and max?
+        df_frame_agg = DataFrame(self.round_array(df_frame_agg.to_numpy(dtype=float)), columns=df_frame_agg.columns)
+        list_details = df_frame_agg.to_dict(orient="records")
+        list_begin = self.round_array(df_scenes["Start Time (seconds)"].to_numpy(dtype=float))
+        list_end = self.round_array(df_scenes["End Time (seconds)"].to_numpy(dtype=float))
+
+        events = EventBuilder(capacity=len(df_scenes))
+        for idx_scene in range(len(df_scenes)):
+            events.append(time_begin=list_begin[idx_scene], time_end=list_end[idx_scene], time_event=list_begin[idx_scene], 
+                          details=list_details[idx_scene], **base_obj)
+
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"No valid events detected for '{self.EXTRACTOR}'")
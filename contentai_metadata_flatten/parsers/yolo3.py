@@ -19,10 +19,8 @@
 # -*- coding: utf-8 -*-
 
 from os import path
-import json
-from pandas import DataFrame
 
-from contentai_metadata_flatten.parsers import Flatten
+from contentai_metadata_flatten.parsers import Flatten, EventBuilder
 
 class Parser(Flatten):
     def __init__(self, path_content, logger=None):
@@ -43,7 +41,7 @@ class Parser(Flatten):
         :param: run_options (dict): specific runtime information
         :returns: (DataFrame): DataFrame on successful decoding and export, None (or exception) otherwise
         """
-        list_items = []
+        events = EventBuilder()
 
         dict_data = self.get_extractor_results(self.EXTRACTOR, "data.json")
 
@@ -63,18 +61,16 @@ class Parser(Flatten):
                 for obj_result in local_obj["results"]:   # iterate through result sets
                     if "objects" in obj_result:
                         for instance_obj in obj_result["objects"]:   # iterate through objects
-                            details_obj = { 'box': {'w': round(instance_obj['boundingBox']['width'], self.ROUND_DIGITS), 
-                                'h': round(instance_obj['boundingBox']['height'], self.ROUND_DIGITS),
-                                'l': round(instance_obj['boundingBox']['left'], self.ROUND_DIGITS), 
-                                't': round(instance_obj['boundingBox']['top'], self.ROUND_DIGITS) } }
+                            box_obj = instance_obj['boundingBox']
+                            details_obj = { 'box': (box_obj['left'], box_obj['top'], box_obj['width'], box_obj['height']) }
                             score_frame = round(float(instance_obj["confidence"]), self.ROUND_DIGITS)
                             obj_insert = { "tag": instance_obj["name"], "score": score_frame, 
-                                "details": json.dumps(details_obj) }
+                                "details": details_obj }
                             obj_insert.update(base_obj)
-                            list_items.append(obj_insert)
+                            events.append(**obj_insert)
 
-        if len(list_items) > 0:   # return the whole thing as dataframe
-            return DataFrame(list_items)
+        if len(events) > 0:   # return the whole thing as dataframe
+            return events.build()
 
         if run_options["verbose"]:
             self.logger.critical(f"No tag entries found in source '{self.EXTRACTOR}'")
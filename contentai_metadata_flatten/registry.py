@@ -0,0 +1,138 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+
+import pkgutil
+import importlib
+import threading
+from os import path
+
+from . import json_backend
+
+PATH_MANIFEST = path.join(path.dirname(__file__), 'data', 'registry.json')
+
+
+class Registry():
+    """Lazy index of the parser or generator modules of a package.
+
+    Names and output types are read from a static manifest (see `build_manifest`) so that listing or 
+    filtering imports nothing; a module is imported only when its class is handed out.  Modules found 
+    in the package but missing from the manifest are imported once to read their types.  Modules that 
+    export `None` instead of a class (e.g. an optional dependency is missing) are skipped when resolved.
+    """
+    def __init__(self, package, path_package, class_name, path_manifest=PATH_MANIFEST):
+        """Constructor for registry
+
+        :param package: (str): Package holding the modules (e.g. `contentai_metadata_flatten.parsers`)
+        :param path_package: (list): Search path of that package (its `__path__`)
+        :param class_name: (str): Name of the class exported by each module (e.g. `Parser`)
+        :param path_manifest: (str): Manifest with the entries of each package, keyed on `package`
+        """
+        self.package = package
+        self.path_package = path_package
+        self.class_name = class_name
+        self.path_manifest = path_manifest
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def entries(self):
+        """List modules as dicts of `name`, `types` and `module` (path), without importing them"""
+        with self._lock:
+            if self._entries is None:
+                list_entries = []
+                if path.exists(self.path_manifest):
+                    list_entries = json_backend.load_file(self.path_manifest).get(self.package, [])
+                set_names = set(local_entry['name'] for local_entry in list_entries)
+                for _, module_name, _ in pkgutil.iter_modules(self.path_package):
+                    if module_name not in set_names:   # added after the manifest was built
+                        module_path = f"{self.package}.{module_name}"
+                        module_obj = self.load(module_path)
+                        if module_obj is not None:
+                            list_entries.append({'name': module_name, 'module': module_path, 
+                                                 'types': module_obj.known_types()})
+                self._entries = list_entries
+            return self._entries
+
+    def load(self, module_path):
+        """Import a module and return its exported class"""
+        return getattr(importlib.import_module(module_path), self.class_name)   # get class template
+
+    def resolve(self, list_entries):
+        """Import the modules of entries, returning dicts of `obj` (class), `types` and `name` for available classes"""
+        list_resolved = []
+        for local_entry in list_entries:
+            module_obj = self.load(local_entry['module'])
+            if module_obj is not None:   # skip modules disabled by a missing optional dependency
+                list_resolved.append({'obj': module_obj, 'types': local_entry['types'], 'name': local_entry['name']})
+        return list_resolved
+
+    def get_by_type(self, type_list=None):
+        """Get classes with a specific filter for type.
+
+        :param type_list: (list) list of types required in output (default=None or all available)
+        :return list: list of dicts with raw classes (`obj`), their `types`, and `name`
+        """
+        if type_list is None:
+            return self.resolve(self.entries())
+        if type(type_list) != list:
+            type_list = [type_list]
+        type_list = set(type_list)  # convert to set
+        return self.resolve([local_entry for local_entry in self.entries() 
+                             if local_entry['types'] is None or len(type_list.intersection(set(local_entry['types']))) > 0])
+
+    def get_by_name(self, name_limit=None):
+        """Get classes with a specific filter for name.
+
+        :param name_limit: (str) exact name of the module (default=None or all available)
+        :return list: list of dicts with raw classes (`obj`), their `types`, and `name`
+        """
+        if name_limit is None:
+            return self.resolve(self.entries())
+        # exact match (since v1.2.2) to avoid partial match (e.g. metadata -> dsai_metadata)
+        return self.resolve([local_entry for local_entry in self.entries() if name_limit == local_entry['name']])
+
+
+def build_manifest(list_registry):
+    """Import every module of each registry and collect its manifest entries (build with all optional 
+    dependencies installed; modules exporting `None` are left out)
+
+    :param list_registry: (list): `Registry` instances to scan
+    :return: dict.  Entries (list of dict) keyed on package, as read by `Registry`
+    """
+    dict_manifest = {}
+    for registry in list_registry:
+        list_entries = []
+        for _, module_name, _ in pkgutil.iter_modules(registry.path_package):
+            module_path = f"{registry.package}.{module_name}"
+            module_obj = registry.load(module_path)
+            if module_obj is not None:
+                list_entries.append({'name': module_name, 'module': module_path, 'types': module_obj.known_types()})
+        dict_manifest[registry.package] = list_entries
+    return dict_manifest
+
+
+def main():
+    """Regenerate the manifest after adding or changing parsers and generators (run before packaging)"""
+    from . import parsers, generators
+    json_backend.save_file(PATH_MANIFEST, build_manifest([parsers.REGISTRY, generators.REGISTRY]), pretty_print=True)
+    print(f"Wrote manifest '{PATH_MANIFEST}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -66,7 +66,7 @@ setup(
     [console_scripts]
     contentai-metadata-flatten=contentai_metadata_flatten.main:main
     """,
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     install_requires=requirement_list,
     tests_require=test_requirement_list,
     # cmdclass={'install': new_install},
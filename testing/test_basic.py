@@ -70,9 +70,6 @@ def test_packages():
     assert path.exists(instance_gen.schema_path)   # need to have the template/schema path
 
 
-
-
-
 # validate against input and basic parsing?
 # drop rows if negative index in time
 # drop/merge repeat rows
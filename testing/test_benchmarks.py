@@ -0,0 +1,61 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+benchmark suite tests
+"""
+
+import sys
+import logging
+from os import path
+
+sys.path.insert(0, path.join(path.dirname(path.dirname(path.abspath(__file__))), 'benchmarks'))
+import bench_suite
+import synthetic
+
+
+def test_compare():
+    list_baseline = [{"kind": "parser", "name": "a", "scale": 1, "wall_s": 1.0},
+                     {"kind": "parser", "name": "b", "scale": 1, "wall_s": 0.01},
+                     {"kind": "generator", "name": "a", "scale": 1, "wall_s": 1.0},
+                     {"kind": "parser", "name": "a", "scale": 10, "wall_s": 2.0}]   # not measured again
+    list_records = [{"kind": "parser", "name": "a", "scale": 1, "wall_s": 1.2},   # within tolerance
+                    {"kind": "parser", "name": "b", "scale": 1, "wall_s": 0.04},   # slower, but by less than min_seconds
+                    {"kind": "generator", "name": "a", "scale": 1, "wall_s": 1.5},
+                    {"kind": "parser", "name": "c", "scale": 1, "wall_s": 9.0}]   # no baseline
+    list_rows, list_regressed = bench_suite.compare(list_records, list_baseline, tolerance=0.25, min_seconds=0.05)
+    assert [(row["kind"], row["name"], row["scale"]) for row in list_rows] == [("parser", "a", 1), ("parser", "b", 1), ("generator", "a", 1)]
+    assert [row["base_s"] for row in list_rows] == [1.0, 0.01, 1.0] and round(list_rows[1]["ratio"], 6) == 4
+    assert list_regressed == [list_rows[2]]
+
+    list_rows, list_regressed = bench_suite.compare(list_records, list_baseline, tolerance=0.1, min_seconds=0)
+    assert [row["name"] for row in list_regressed] == ["a", "b", "a"]
+    assert bench_suite.compare(list_records, [], tolerance=0.25) == ([], [])
+
+
+def test_synthetic(tmp_path):
+    from contentai_metadata_flatten import parsers
+
+    assert synthetic.generate(tmp_path, scale=0.01) == tmp_path
+    logger = logging.getLogger(__name__)
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    list_records, dict_frames = bench_suite.bench_parsers(tmp_path, 0.01, repeat=1, logger=logger)
+    assert sorted(dict_frames) == sorted(x['name'] for x in parsers.get_by_name())   # every parser finds its inputs
+    assert all(record["rows"] > 0 and record["wall_s"] > 0 for record in list_records)
@@ -0,0 +1,167 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+generator tests
+"""
+
+import os
+import gzip
+import shutil
+import pytest
+from os import path
+
+
+def test_json_backend(tmp_path):
+    from contentai_metadata_flatten import json_backend
+    import json
+    import numpy as np
+
+    dict_test = {"a": [1, 2.5, None], "b": "caf\u00e9", "c": {"d": True}}
+    assert json_backend.loads(json_backend.dumps(dict_test)) == dict_test
+    assert json_backend.loads('{"x": NaN}')["x"] != json_backend.loads('{"x": NaN}')["x"]   # stdlib literals
+    assert json_backend.dumps({"x": float("nan")}) == '{"x": NaN}'   # same text as stdlib for non-finite
+    assert json_backend.dumps(dict_test) == json.dumps(dict_test)   # persisted `details` match prior releases
+    assert json_backend.dumps({"x": np.float32(0.5), "y": np.arange(2)}) == '{"x": 0.5, "y": [0, 1]}'
+    assert json.loads(json_backend.dumps({"x": 1e-05})) == {"x": 1e-05}
+
+    # iterators are streamed in chunks and written the same as lists
+    dir_temp = str(tmp_path)
+    path_list, path_stream = path.join(dir_temp, "list.json.gz"), path.join(dir_temp, "stream.json.gz")
+    dict_list = {"head": 1, "items": {"a": [{"i": i} for i in range(25)], "b": []}}
+    json_backend.save_file(path_list, dict_list)
+    json_backend.CHUNK_ITEMS, chunk_prior = 10, json_backend.CHUNK_ITEMS
+    json_backend.save_file(path_stream, {"head": 1, "items": {"a": ({"i": i} for i in range(25)), "b": iter([])}})
+    json_backend.CHUNK_ITEMS = chunk_prior
+    with gzip.open(path_list, 'rb') as f_list, gzip.open(path_stream, 'rb') as f_stream:
+        assert f_list.read() == f_stream.read()
+    assert json_backend.load_file(path_stream) == dict_list
+
+
+def test_wb_dedupe(tmp_path):
+    from contentai_metadata_flatten import parsers
+    from contentai_metadata_flatten.generators.wbTimeTaggedMetadata import Generator
+    import json
+
+    events = parsers.EventBuilder("extractor_test")
+    for idx_repeat in range(2):   # every event twice, only first should survive
+        events.append(time_begin=1, time_end=1, time_event=1, source_event="image", tag="face", tag_type="identity", score=0.5,
+                      details={"box": {"w": 0.1, "h": 0.2, "l": 0.3, "t": 0.4}})
+        events.append(time_begin=1, time_end=1, time_event=1, source_event="image", tag="face", tag_type="identity", score=0.5,
+                      details={"box": {"w": 0.2, "h": 0.2, "l": 0.3, "t": 0.4}})
+        events.append(time_begin=0, time_end=5, time_event=0, source_event="speech", tag="words", tag_type="transcript", score=1.0,
+                      details={"transcript": "hello there"})
+        events.append(time_begin=0, time_end=5, time_event=0, source_event="video", tag="scene", tag_type="shot", score=1.0)
+    dir_temp = str(tmp_path)
+    path_output = path.join(dir_temp, "wbTimeTaggedMetadata.json")
+    assert Generator(dir_temp).generate(path_output, {}, events.build()) == 4
+    with open(path_output, 'rt') as f:
+        obj_out = json.load(f)
+    assert [obj["wbtcd:frameData"]["box"]["w"] for obj in obj_out["wbtcd:frames"]] == [0.1, 0.2]
+    assert obj_out["wbtcd:frames"][0]["wbtcd:frameData"]["dataTypeId"] == "timedObject"
+    assert [obj["dataTypeId"] for obj in obj_out["wbtcd:timespans"]["concreteTimespans"]] == ["timedText"]
+    assert [obj["dataObject"]["name"] for obj in obj_out["wbtcd:timespans"]["descriptiveTimespans"]] == ["scene"]
+
+
+def test_incremental_csv(tmp_path):
+    from contentai_metadata_flatten import parsers
+    from contentai_metadata_flatten.generators.flattened_csv import Generator
+    import pandas as pd
+
+    events = parsers.EventBuilder("extractor_test")
+    for idx in range(40):
+        events.append(time_begin=idx, time_end=idx + 1, source_event="image", tag=f"tag,{idx % 3}", tag_type="tag",
+                      score=0.5, details={"n": idx} if idx % 2 else "")
+    df = events.build()
+    dir_temp = str(tmp_path)
+    path_output = path.join(dir_temp, "csv_flatten_test.csv.gz")
+    generator = Generator(dir_temp)
+    assert generator.generate(path_output, {"incremental": True}, df.iloc[:20]) == 20
+    assert generator.generate(path_output, {"incremental": True}, df.iloc[15:30]) == 30   # append after prior
+    assert generator.generate(path_output, {"incremental": True}, df.iloc[::2]) == 35   # merge within prior
+    assert generator.generate(path_output, {"incremental": True}, df) == 40
+    assert generator.index_load(path_output)["num_rows"] == 40
+    df_out = pd.read_csv(path_output)
+    assert list(df_out["time_begin"]) == list(range(40))
+
+    generator.generate(path_output, {}, df.iloc[:5])   # full rewrite invalidates the index
+    assert generator.index_load(path_output) is None
+
+
+def test_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from contentai_metadata_flatten import parsers, generators
+    from contentai_metadata_flatten.generators.flattened_parquet_universal import Generator
+    import pandas as pd
+
+    assert not generators.get_by_name("flattened_parquet")[0]['obj'](".").is_compressible
+    dir_temp = str(tmp_path)
+    generator = Generator(dir_temp)
+    path_output = generator.get_output_path("unused")
+    for extractor_name in ["extractor_b", "extractor_a", "extractor_b"]:   # repeat merges without duplicates
+        events = parsers.EventBuilder(extractor_name)
+        for idx in range(30):
+            events.append(time_begin=30 - idx, tag=f"tag{idx % 3}", tag_type="tag", source_event="image", score=0.5,
+                          details={"box": {"w": 0.1, "h": 0.2, "l": 0.3, "t": 0.4}} if idx % 2 else {"n": idx})
+        num_items = generator.generate(path_output, {}, parsers.categorize(events.build()))
+    assert num_items == 60
+
+    assert sorted(os.listdir(path_output)) == ["extractor_a.parquet", "extractor_b.parquet"]   # one part per extractor
+    file_parquet = pq.ParquetFile(path.join(path_output, "extractor_b.parquet"))
+    assert file_parquet.num_row_groups == 1
+    stats = file_parquet.metadata.row_group(0).column(0).statistics
+    assert stats.min == 1 and stats.max == 30
+    df = pd.read_parquet(path_output, columns=["time_begin", "extractor", "box_w", "details"],
+                         filters=[("extractor", "==", "extractor_b"), ("time_begin", "<", 5)])
+    assert list(df["time_begin"]) == [1, 2, 3, 4] and list(df["extractor"].unique()) == ["extractor_b"]
+    assert df["box_w"].isna().sum() == 2 and df["details"].notna().sum() == 2
+
+    # a single file from a prior version is converted to parts
+    shutil.rmtree(path_output)
+    pq.write_table(generator.to_table(generator.flat_events(parsers.categorize(events.build()))), path_output)
+    events = parsers.EventBuilder("extractor_a")
+    events.append(time_begin=1, tag="new", tag_type="tag", source_event="image")
+    assert generator.generate(path_output, {}, parsers.categorize(events.build())) == 31
+    assert sorted(os.listdir(path_output)) == ["extractor_a.parquet", "extractor_b.parquet"]
+
+
+def test_sqlite_events(tmp_path):
+    from contentai_metadata_flatten import parsers
+    from contentai_metadata_flatten.generators.sqlite_events import Generator
+    import sqlite3
+
+    events = parsers.EventBuilder("extractor_test")
+    for idx in range(20):
+        events.append(time_begin=idx, time_end=idx + 2, tag=f"tag{idx % 2}", tag_type="tag", source_event="image",
+                      score=float("nan") if idx % 5 == 0 else 0.5, details={"box": {"w": 0.1, "h": 0.2, "l": 0.3, "t": 0.4}})
+    df = parsers.categorize(events.build())
+    dir_temp = str(tmp_path)
+    generator = Generator(dir_temp)
+    path_output = generator.get_output_path("unused")
+    assert generator.generate(path_output, {}, df) == 20
+    assert generator.generate(path_output, {}, df) == 20   # same batch, skipped by digest
+    assert generator.generate(path_output, {}, df.iloc[5:10]) == 5   # new batch, rows ignored by unique index
+
+    conn = sqlite3.connect(path_output)
+    assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 20
+    assert conn.execute("SELECT COUNT(*) FROM events WHERE tag_type = 'tag' AND tag = 'tag1'").fetchone()[0] == 10
+    list_tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    if "events_time" in list_tables:   # R-tree interval query
+        assert conn.execute("SELECT COUNT(*) FROM events_time WHERE time_min <= 5.5 AND time_max >= 5.5").fetchone()[0] == 2
+    conn.close()
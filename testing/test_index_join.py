@@ -0,0 +1,90 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+time index and temporal join tests
+"""
+
+
+def test_time_index():
+    from contentai_metadata_flatten.index import TimeIndex
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(42)
+    time_begin = np.round(rng.uniform(0, 100, 1000), 1)
+    time_end = time_begin + np.where(rng.random(1000) < 0.3, 0, np.round(rng.exponential(5, 1000), 1))
+    time_begin[3] = np.nan   # never matches
+    time_end[4] = np.nan   # instantaneous
+    index = TimeIndex.from_frame(pd.DataFrame({"time_begin": time_begin, "time_end": time_end}))
+    time_end = np.where(np.isnan(time_end), time_begin, time_end)
+    assert len(index) == 1000
+
+    query_begin = np.round(rng.uniform(-5, 105, 100), 1)
+    query_end = query_begin + np.round(rng.exponential(3, 100), 1)
+    for idx in range(len(query_begin)):   # scalar queries against brute force
+        qb, qe = query_begin[idx], query_end[idx]
+        assert list(index.stab(qb)) == list(np.flatnonzero((time_begin <= qb) & (time_end >= qb)))
+        assert list(index.overlap(qb, qe)) == list(np.flatnonzero((time_begin <= qe) & (time_end >= qb)))
+        assert list(index.within(qb, qe)) == list(np.flatnonzero((time_begin >= qb) & (time_end <= qe)))
+    idx_query, idx_row = index.overlap(query_begin, query_end)   # batched queries, same matches
+    for idx in range(len(query_begin)):
+        assert list(idx_row[idx_query == idx]) == list(index.overlap(query_begin[idx], query_end[idx]))
+
+    assert len(index.stab(np.nan)) == len(index.overlap(np.nan, 50)) == len(index.within(10, np.nan)) == 0   # NaN never matches
+    query_begin[[0, 5]], query_end[7] = np.nan, np.nan
+    for func in [index.overlap, index.within]:
+        idx_query, idx_row = func(query_begin, query_end)
+        assert not np.isin(idx_query, [0, 5, 7]).any()
+        assert list(idx_row[idx_query == 1]) == list(func(query_begin[1], query_end[1]))
+    assert not np.isin(index.stab(query_begin)[0], [0, 5]).any()
+
+
+def test_temporal_join():
+    from contentai_metadata_flatten import parsers, join
+    import numpy as np
+
+    events = parsers.EventBuilder("extractor_a")
+    for idx in range(0, 100, 10):
+        events.append(time_begin=idx, time_end=idx + 10, tag="shot", tag_type="shot", source_event="video")
+    for idx in range(100):
+        events.append(time_begin=idx * 0.97, time_end=idx * 0.97 + 1.5, tag=f"tag{idx % 3}", tag_type="tag",
+                      score=idx / 100, source_event="image")
+    events_b = parsers.EventBuilder("extractor_b")   # fewer shots, not picked as segments
+    events_b.append(time_begin=0, time_end=50, tag="shot", tag_type="shot", source_event="video")
+    df = parsers.concat_events([parsers.categorize(events.build()), parsers.categorize(events_b.build())])
+
+    df_segments = join.segment_events(df, "shot")
+    assert len(df_segments) == 10 and list(df_segments["extractor"].unique()) == ["extractor_a"]
+    df_events = df[df["tag_type"] == "tag"].reset_index(drop=True)
+    segment_begin, segment_end = df_segments["time_begin"].to_numpy(), df_segments["time_end"].to_numpy()
+    event_begin, event_end = df_events["time_begin"].to_numpy(), df_events["time_end"].to_numpy()
+    mask = {"overlap": (event_begin <= segment_end[:, None]) & (event_end >= segment_begin[:, None]),
+            "within": (event_begin >= segment_begin[:, None]) & (event_end <= segment_end[:, None])}
+    for how in mask:   # same pairs as a cross join
+        idx_segment, idx_event = join.join_indices(df_segments, df_events, how=how)
+        assert list(zip(idx_segment, idx_event)) == list(zip(*np.nonzero(mask[how])))
+    idx_segment, idx_event = join.join_indices(df_segments, df_events, how="preceding")
+    assert len(idx_event) == len(df_events) and all(idx_segment == (event_begin[idx_event] // 10).astype(int))
+    df_joined = join.temporal_join(df_segments, df_events, how="within")
+    assert len(df_joined) == mask["within"].sum() and "time_begin_segment" in df_joined.columns
+
+    df_summary = join.segment_summary(df, "shot")
+    assert df_summary["count"].sum() == mask["overlap"].sum()
+    assert set(df_summary["tag"]) == {"tag0", "tag1", "tag2"} and df_summary["segment"].max() == 9
@@ -31,6 +31,7 @@ from pathlib import Path
 PATH_TEST = Path(__file__).parent.joinpath('data', 'results-hbomax')
 
 from contentai_metadata_flatten.main import flatten
+from contentai_metadata_flatten import generators
 
 
 def test_programmatic():
@@ -64,7 +65,7 @@ def test_generator():
     dict_result = flatten(args=["--path_content", str(PATH_TEST.resolve()), "--extractor", "azure_videoindexer",
                                 "--verbose", "--path_result", str(path_temp)])
     assert "generated" in dict_result
-    assert 2 == len(dict_result['generated'])
+    assert len(generators.get_by_name()) == len(dict_result['generated'])   # one universal or extractor output each
     shutil.rmtree(str(path_temp))   # cleanup
 
     # with no output (v1.3.0+)
@@ -118,6 +119,24 @@ def test_generator():
     shutil.rmtree(str(path_temp))   # cleanup
 
 
+def test_workers():
+    path_temp = Path(tempfile.mkdtemp()).resolve()
+
+    # sequential parse as reference
+    dict_single = flatten({"path_content": str(PATH_TEST.resolve()), "generator": "", 
+                           "path_result": str(path_temp)}, args=[])
+    assert "data" in dict_single
+
+    # parallel parse (v1.5.0+) must return the same events in the same order
+    dict_pool = flatten({"path_content": str(PATH_TEST.resolve()), "generator": "", "workers": 2,
+                         "path_result": str(path_temp)}, args=[])
+    assert "data" in dict_pool
+    df_single = pd.DataFrame(dict_single['data'])
+    df_pool = pd.DataFrame(dict_pool['data'])
+    pd.testing.assert_frame_equal(df_single, df_pool)
+    shutil.rmtree(str(path_temp))   # cleanup
+
+
 def test_cli():
     import os
 
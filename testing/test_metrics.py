@@ -0,0 +1,57 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+metrics tests
+"""
+
+import os
+from os import path
+
+
+def test_metrics(tmp_path):
+    from contentai_metadata_flatten import metrics
+    from contentai_metadata_flatten.main import flatten
+    import json
+
+    profiler = metrics.Profiler(trace_memory=True).start()
+    with profiler.stage("build", extractor="test") as record:
+        list_build = [str(x) for x in range(10000)]
+        record["rows_out"] = len(list_build)
+    profiler.add("load", extractor="test", bytes_in=10)
+    profiler.stop()
+    assert [(x["stage"], x["rows_out"], x["bytes_in"]) for x in profiler.records] == [("build", 10000, None), ("load", None, 10)]
+    assert profiler.records[0]["wall_s"] > 0 and profiler.records[0]["mem_peak_bytes"] > 10000
+    assert list(profiler.records[0].keys()) == metrics.FIELDS
+
+    dir_temp = str(tmp_path)
+    os.makedirs(path.join(dir_temp, "ibm_max_audio_classifier"))
+    with open(path.join(dir_temp, "ibm_max_audio_classifier", "data.json"), "wt") as f:
+        json.dump({"00:00:01": [{"label": "Music", "probability": 0.5, "label_id": "/m/04rlf"}], "00:00:02": []}, f)
+    path_metrics = path.join(dir_temp, "metrics.json")
+    dict_result = flatten({"path_content": dir_temp, "path_result": path.join(dir_temp, "out"), "extractor": "ibm_max_audio_classifier",
+                           "generator": "flattened_csv", "metrics_path": path_metrics}, args=[])
+    dict_stages = {(x["stage"], x["generator"]): x for x in dict_result["metrics"]}
+    assert set(dict_stages) == {("discover", None), ("parse", None), ("load", None), ("time_offset", None),
+                                ("generate", "flattened_csv"), ("to_dict", None)}
+    assert dict_stages[("parse", None)]["rows_out"] == len(dict_result["data"]) == 1
+    assert dict_stages[("load", None)]["bytes_in"] == path.getsize(path.join(dir_temp, "ibm_max_audio_classifier", "data.json"))
+    with open(path_metrics, "rt") as f:
+        assert json.load(f) == dict_result["metrics"]
+    assert "metrics" not in flatten({"path_content": dir_temp, "path_result": path.join(dir_temp, "out"), "generator": ""}, args=[])
@@ -0,0 +1,300 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+parser tests
+"""
+
+import os
+from os import path
+
+
+def test_directory_index(tmp_path):
+    from contentai_metadata_flatten import parsers
+    from pathlib import Path
+
+    dir_temp = str(tmp_path)
+    Path(dir_temp, "job", "aws_rekognition_video_faces").mkdir(parents=True)
+    Path(dir_temp, "job", "aws_rekognition_video_faces", "result0.json").write_text('{"a": 1}')
+    Path(dir_temp, "job", "aws_rekognition_video_faces", "result1.json.gz").write_text('')
+    index = parsers.DirectoryIndex.get(dir_temp, refresh=True)
+    assert parsers.DirectoryIndex.get(dir_temp) is index   # shared by path
+    list_dirs = index.find_dirs("aws_rekognition_video_faces")
+    assert len(list_dirs) == 1
+    assert len(index.find_files(list_dirs[0], "result0.json")) == 1
+    assert index.find_files(list_dirs[0], "result1.json")[0].endswith(".gz")
+    assert len(index.find_files(list_dirs[0], "result2.json")) == 0
+    assert len(index.find_dirs("missing")) == 0
+
+    parser = parsers.get_by_name("aws_rekognition_video_faces")[0]['obj'](dir_temp)
+    assert parser.get_extractor_results("aws_rekognition_video_faces", "result0.json") == {"a": 1}
+
+    Path(dir_temp, "dsai_places").mkdir()   # root changed, walked again
+    os.utime(dir_temp, ns=(0, 0))
+    assert parsers.DirectoryIndex.get(dir_temp).find_dirs("dsai_places")
+    for idx in range(parsers.DirectoryIndex.MAX_ROOTS):   # least recently used roots are dropped
+        parsers.DirectoryIndex.get(Path(dir_temp, "job", f"missing{idx}"))
+    assert len(parsers.DirectoryIndex._cache) == parsers.DirectoryIndex.MAX_ROOTS
+    assert path.abspath(dir_temp) not in parsers.DirectoryIndex._cache
+
+
+def test_extractor_items(tmp_path):
+    from contentai_metadata_flatten import parsers
+    from pathlib import Path
+
+    dir_temp = str(tmp_path)
+    Path(dir_temp, "gcp_videointelligence_object_tracking").mkdir()
+    Path(dir_temp, "gcp_videointelligence_object_tracking", "data.json").write_text(
+        '{"annotationResults": [{"objectAnnotations": [{"a": 1}, {"a": 2.5}]}, {}, {"objectAnnotations": [{"a": 3}]}]}')
+    parsers.DirectoryIndex.get(dir_temp, refresh=True)
+    parser = parsers.get_by_name("gcp_videointelligence_object_tracking")[0]['obj'](dir_temp)
+    prefix = "annotationResults.item.objectAnnotations.item"
+    list_memory = list(parser.get_extractor_items(parser.EXTRACTOR, "data.json", prefix, {"streaming": False}))
+    assert list_memory == [{"a": 1}, {"a": 2.5}, {"a": 3}]
+    list_stream = list(parser.get_extractor_items(parser.EXTRACTOR, "data.json", prefix, {"streaming": True}))
+    assert list_stream == list_memory
+    assert parser.get_extractor_items(parser.EXTRACTOR, "missing.json", prefix, {"streaming": True}) is None
+
+
+def test_extractor_pages(tmp_path):
+    from contentai_metadata_flatten.parsers.aws_rekognition_video_faces import Parser
+    import logging
+    import json
+
+    dir_temp = str(tmp_path)
+    os.makedirs(path.join(dir_temp, "aws_rekognition_video_faces"))
+    for idx_page in [0, 1, 2, 4]:   # pages decode ahead, but stop at the first gap
+        with open(path.join(dir_temp, "aws_rekognition_video_faces", f"result{idx_page}.json"), "wt") as f:
+            json.dump({"Faces": [{"Timestamp": 1000 * idx_page + x, "Face": {"Confidence": 90.0,
+                                  "BoundingBox": {"Width": 0.1, "Height": 0.2, "Left": 0.3, "Top": 0.4}}} for x in range(2)]}, f)
+    parser = Parser(dir_temp, logger=logging.getLogger())
+    parser.PAGE_WORKERS = 2
+    assert parser.find_extractor_pages("aws_rekognition_video_faces") == ["result0.json", "result1.json", "result2.json"]
+    list_pages = list(parser.get_extractor_pages("aws_rekognition_video_faces", prefix="Faces.item"))
+    assert [name_file for name_file, _ in list_pages] == ["result0.json", "result1.json", "result2.json"]
+    assert [face_obj["Timestamp"] for _, list_faces in list_pages for face_obj in list_faces] == [0, 1, 1000, 1001, 2000, 2001]
+    for run_options in [{"verbose": False}, {"verbose": False, "streaming": True}]:
+        df = parser.parse(run_options)
+        assert list(df["time_begin"]) == [0, 0.001, 1, 1.001, 2, 2.001]
+
+    with open(path.join(dir_temp, "aws_rekognition_video_faces", "result1.json"), "wt") as f:   # empty page also stops
+        json.dump({}, f)
+    assert [name_file for name_file, _ in parser.get_extractor_pages("aws_rekognition_video_faces")] == ["result0.json"]
+
+
+def test_event_builder():
+    from contentai_metadata_flatten import parsers
+
+    events = parsers.EventBuilder("extractor_test", capacity=2)
+    assert events.build() is None
+    for idx in range(5):   # grows beyond initial capacity
+        events.append(time_begin=idx, time_end=idx + 1, source_event="video", tag_type="tag", tag=f"tag{idx}", score=0.5)
+    events["time_end"][-1] = 10   # writable views of columns
+    df = events.build()
+    assert len(events) == 5 and len(df) == 5
+    assert list(df.columns) == ["time_begin", "time_end", "time_event", "source_event", "tag", "tag_type", "score", "extractor"]
+    assert list(df["time_event"]) == [0, 1, 2, 3, 4]   # defaults to time_begin
+    assert df["time_end"].iloc[-1] == 10
+    assert (df["extractor"] == "extractor_test").all()
+
+
+def test_event_builder_extend():
+    from contentai_metadata_flatten import parsers
+
+    events = parsers.EventBuilder("extractor_test", capacity=2)
+    events.append(time_begin=0, tag="first", tag_type="tag", details={"a": 1})
+    rows = events.extend(time_begin=[1, 2, 3], time_end=[2, 3, 4], tag=["x", "y", "z"], tag_type="tag", score=[0.5, None, 1],
+                         details=[{"box": {"w": 0.1, "h": 0.2, "l": 0.3, "t": 0.4}}, "", '{"transcript": "hi"}'])
+    assert list(rows) == [1, 2, 3] and len(events) == 4
+    df = events.build()
+    assert list(df["time_event"]) == [0, 1, 2, 3] and list(df["time_end"]) == [0, 2, 3, 4]
+    assert list(df["tag"]) == ["first", "x", "y", "z"] and df["score"].isna().sum() == 2
+    assert df["box_w"][1] == 0.1 and df["details"][1] == {} and df["details"][2] == "" and df["transcript"][3] == "hi"
+    assert df["details"][3] == {} and parsers.details_legacy(df)["details"][3] == '{"transcript": "hi"}'
+    assert list(df["extractor"].unique()) == ["extractor_test"]
+
+
+def test_categorical_events():
+    from contentai_metadata_flatten import parsers
+    import pandas as pd
+
+    events_a = parsers.EventBuilder("extractor_a")
+    events_a.append(time_begin=0, tag="car", tag_type="tag", source_event="video", score=0.5)
+    events_b = parsers.EventBuilder("extractor_b")
+    events_b.append(time_begin=1, tag="dog", tag_type="tag", source_event="image", score=0.7)
+    df_a, df_b = events_a.build(), events_b.build()
+    assert isinstance(df_a["tag"].dtype, pd.CategoricalDtype)
+
+    df_all = parsers.concat_events([df_a, df_b])   # categories are merged, not dropped to object
+    for col in parsers.CATEGORY_COLUMNS:
+        assert isinstance(df_all[col].dtype, pd.CategoricalDtype)
+    assert list(df_all["tag"]) == ["car", "dog"]
+    assert parsers.to_records(df_all) == df_all.astype({col: object for col in parsers.CATEGORY_COLUMNS}).to_dict(orient="records")
+
+
+def test_structured_details():
+    from contentai_metadata_flatten import parsers
+    import json
+
+    events = parsers.EventBuilder("extractor_test")
+    details_obj = {"box": {"w": 0.1, "h": 0.2, "l": 0.3, "t": 0.4}}
+    events.append(time_begin=0, tag="face", details=details_obj)
+    details_obj["pose"] = {"roll": 1.5}   # builder keeps its own copy
+    events.append(time_begin=1, tag="face", details=details_obj)
+    events.append(time_begin=2, tag="text", details={"words": 2, "transcript": "hello there", "url": "http://x"})
+    events.append(time_begin=3, tag="word", details="")
+    events.append(time_begin=4, tag="face", details={"urls": "http://y", "box": {"w": 0.1, "h": 0.2, "l": 0.3, "t": 0.4}, "n": 1})
+    df = events.build()
+    assert list(df["box_w"].iloc[:2]) == [0.1, 0.1] and df["box_w"].isna().iloc[2]
+    assert df["details"].iloc[0] == {} and df["details"].iloc[1] == {"pose": {"roll": 1.5}}
+    assert df["transcript"].iloc[2] == "hello there" and df["uri"].iloc[2] == "http://x"
+    assert df["details"].iloc[2] == {"words": 2} and df["details"].iloc[4] == {"n": 1}   # moved, not copied
+
+    df_legacy = parsers.details_legacy(df)
+    assert "box_w" not in df_legacy.columns and "transcript" not in df_legacy.columns
+    assert json.loads(df_legacy["details"].iloc[1]) == {"box": {"w": 0.1, "h": 0.2, "l": 0.3, "t": 0.4}, "pose": {"roll": 1.5}}
+    assert df_legacy["details"].iloc[2] == json.dumps({"words": 2, "transcript": "hello there", "url": "http://x"})   # key order kept
+    assert df_legacy["details"].iloc[4] == json.dumps({"urls": "http://y", "box": {"w": 0.1, "h": 0.2, "l": 0.3, "t": 0.4}, "n": 1})
+    df_concat = parsers.details_legacy(parsers.concat_events([df.iloc[[0]], df.iloc[[2]]]))
+    assert list(df_concat["details"]) == [df_legacy["details"].iloc[0], df_legacy["details"].iloc[2]]
+    assert df_legacy["details"].iloc[3] == ""
+    assert len(parsers.drop_duplicate_events(df.iloc[[0, 0, 1]])) == 2
+
+
+def test_box_columns():
+    from contentai_metadata_flatten.parsers import Flatten, EventBuilder, details_legacy
+    import numpy as np
+
+    list_values = [0.559375, 0.123455, -0.000004, 0.285, 2.675, 1/3, 7/1280, float("nan")]   # halves in decimal, not binary
+    arr_round = Flatten.round_array(list_values)
+    assert [round(x, 5) for x in list_values[:-1]] == arr_round[:-1].tolist() and np.isnan(arr_round[-1])
+    assert Flatten.round_array([2.5, 3.5, 0.125], 0).tolist() == [2.0, 4.0, 0.0]
+
+    dict_box = Flatten.box_columns([0.1, 0.25], [0.2, 0.5], right=[0.4, 0.75], bottom=[0.3, 1.0])
+    assert dict_box["box_w"].tolist() == [0.3, 0.5] and dict_box["box_h"].tolist() == [0.1, 0.5]
+    assert dict_box["box_l"].tolist() == [0.1, 0.25] and dict_box["box_t"].tolist() == [0.2, 0.5]
+
+    events = EventBuilder(extractor="test")
+    events.append(time_begin=0, tag="raw", details={"box": (0.123456789, 0.5, 0.2, 0.559375), "pose": 1})
+    events.append(time_begin=1, tag="dict", details={"box": {"w": 0.1, "h": 0.2, "l": 0.3, "t": 0.4}})
+    events.append(time_begin=2, tag="none", details={})
+    df = events.build()
+    assert df["box_l"].tolist()[:2] == [0.12346, 0.3] and df["box_h"].tolist()[:2] == [0.55937, 0.2]
+    assert np.isnan(df["box_w"][2]) and df["details"][0] == {"pose": 1}
+    assert details_legacy(df)["details"][0] == '{"box": {"w": 0.2, "h": 0.55937, "l": 0.12346, "t": 0.5}, "pose": 1}'
+
+
+def test_keyword_matcher():
+    from contentai_metadata_flatten.parsers import KeywordMatcher
+    import random
+
+    rnd = random.Random(7)
+    list_keywords = ["he", "she", "his", "hers", "Her", "he", "", "sh", "ΟΔΟΣ", "straße"] + \
+        ["".join(rnd.choices("abhesr ", k=rnd.randint(1, 4))) for _ in range(200)]
+    list_text = ["ushers", "", "Hershey SHE said", "ΟΔΟΣ οδος", "STRASSE straße", "hhhhhe"] + \
+        ["".join(rnd.choices("abhesrx ", k=rnd.randint(0, 40))) for _ in range(200)]
+    matcher = KeywordMatcher(list_keywords)
+    for text in list_text:   # same as one substring test per keyword
+        assert matcher.search(text) == [idx for idx, keyword in enumerate(list_keywords) if keyword.lower() in text.lower()]
+    assert KeywordMatcher(["Her"], ignore_case=False).search("hers Her") == [0]
+    assert KeywordMatcher([]).search("anything") == []
+
+
+def test_parse_timecode():
+    from contentai_metadata_flatten.parsers import parse_timecode
+    from pytimeparse import parse as pt_parse
+
+    list_timecode = ["0:00:05.4", "0:00:05", "1:02:03.1234567", "10:59:59.9999999", "100:00:00.5", "00:00:00.0000001",
+                     "0:60:00", "0:5:03", "0:05:03.", "0:00:5.4", "0:05", "-0:00:05.4", "1:00:00:05.4", " 0:00:05.4",
+                     "0:00:05.4e3", "1m24s", "", "\u0660:\u0660\u0660:\u0660\u0665"]
+    for timecode in list_timecode:   # same value and type as pytimeparse
+        time_parsed, time_expected = parse_timecode(timecode), pt_parse(timecode)
+        assert time_parsed == time_expected and type(time_parsed) == type(time_expected)
+
+
+def test_pyscenedetect_scenes(tmp_path):
+    from contentai_metadata_flatten.parsers.pyscenedetect import Parser
+    import logging
+    import math
+
+    dir_temp = str(tmp_path)
+    os.makedirs(path.join(dir_temp, "pyscenedetect"))
+    with open(path.join(dir_temp, "pyscenedetect", "stats.csv"), "wt") as f:
+        f.write("Video Path,test.mp4\nFrame Number,Timecode,content_val,delta_hue,delta_lum,delta_sat\n")
+        for idx in range(1, 31):
+            f.write(f"{idx},00:00:00.000,{idx},{idx % 3},0.5,1.0\n")
+    with open(path.join(dir_temp, "pyscenedetect", "scenes.csv"), "wt") as f:   # last scene has no frames
+        f.write("Timecode List:,00:00:00.000\nScene Number,Start Frame,Start Timecode,Start Time (seconds),End Frame,"
+                "End Timecode,End Time (seconds),Length (frames),Length (timecode),Length (seconds)\n")
+        for idx, (frame_begin, frame_end) in enumerate([(0, 10), (10, 25), (25, 31), (40, 50)]):
+            f.write(f"{idx + 1},{frame_begin},,{frame_begin / 10},{frame_end},,{frame_end / 10},,,\n")
+    df = Parser(dir_temp, logger=logging.getLogger()).parse({"verbose": False})
+    assert list(df["time_begin"]) == [0, 1, 2.5, 4] and list(df["tag_type"]) == ["shot"] * 4
+    dict_details = list(df["details"])
+    assert dict_details[0]["content_val_mean"] == 5 and dict_details[0]["content_val_max"] == 9
+    assert dict_details[1]["content_val_min"] == 10 and dict_details[1]["content_val_mean"] == 17
+    assert dict_details[2]["delta_hue_max"] == 2 and dict_details[2]["delta_sat_mean"] == 1
+    assert math.isnan(dict_details[3]["content_val_mean"])
+
+
+def test_ibm_max_windows(tmp_path):
+    from contentai_metadata_flatten.parsers.ibm_max_audio_classifier import Parser
+    import logging
+    import json
+    import numpy as np
+
+    dict_data = {"00:00:00": [], "00:00:01": [{"label": "Music", "probability": 0.123456789, "label_id": "/m/04rlf"},
+                                              {"label": "Clock", "probability": 0.5, "label_id": "/m/01x3z"}],
+                 "00:00:02": [{"label": "Music", "probability": 0.25, "label_id": "/m/04rlf"}, {"label": "invalid"}],
+                 "00:00:04": [], "00:01:05": [{"label": "Alarm", "probability": 1.0, "label_id": "/m/07pp_mv"}]}
+    dir_temp = str(tmp_path)
+    os.makedirs(path.join(dir_temp, "ibm_max_audio_classifier"))
+    with open(path.join(dir_temp, "ibm_max_audio_classifier", "data.json"), "wt") as f:
+        json.dump(dict_data, f)
+    df = Parser(dir_temp, logger=logging.getLogger()).parse({"verbose": False})
+    assert list(df["tag"]) == ["Music", "Clock", "Music", "Alarm"] and list(df["score"]) == [0.12346, 0.5, 0.25, 1.0]
+    assert list(df["time_begin"]) == [1, 1, 2, 65] and list(df["time_end"]) == [2, 2, 4, 126]   # last as long as the prior code
+    assert df["time_begin"].dtype == df["time_end"].dtype == df["time_event"].dtype == np.int64   # integer seconds as before
+    assert df[["time_begin", "time_end"]].to_csv(index=False) == "time_begin,time_end\n1,2\n1,2\n2,4\n65,126\n"
+    assert df["details"][3] == {"model": "/m/07pp_mv"}
+
+
+def test_wide_to_long(tmp_path):
+    from contentai_metadata_flatten.parsers.dsai_activity_slowfast import Parser
+    from contentai_metadata_flatten.parsers.dsai_places import ParserLegacy
+    import logging
+
+    dir_temp = str(tmp_path)
+    os.makedirs(path.join(dir_temp, "dsai_activity_slowfast"))
+    with open(path.join(dir_temp, "dsai_activity_slowfast", "results.csv"), "wt") as f:   # second clip has one label
+        f.write("video_clip,Time_begin,Time_end,Time_event,category0,score0,category1,score1,category3,score3\n"
+                "clip_0.mp4,0.00,10.88,0.00,beatboxing,0.06,answering questions,0.04,archery,0.01\n"
+                "clip_1.mp4,10.88,20.5,10.88,archery,0.5,,,,\n")
+    df = Parser(dir_temp, logger=logging.getLogger()).parse({"verbose": False})
+    assert list(df["tag"]) == ["beatboxing", "answering questions", "archery"]   # pairs stop at the first gap
+    assert list(df["score"]) == [0.06, 0.04, 0.5] and list(df["time_end"]) == [10.88, 10.88, 20.5]
+    assert list(df["source_event"].unique()) == ["video"] and list(df["extractor"].unique()) == ["dsai_activity_slowfast"]
+
+    dir_temp = str(tmp_path / "places")   # new directory, indexed on first use
+    os.makedirs(path.join(dir_temp, "dsai_places"))
+    with open(path.join(dir_temp, "dsai_places", "results.csv"), "wt") as f:
+        f.write("file,Time_begin,Time_end,Time_event,label_id0,label0,probability0,label_id1,label1,probability1\n"
+                "output000001.png,2,2,2,231,motel,0.158193097,122,discotheque,0.070194781\n")
+    df = ParserLegacy(dir_temp, logger=logging.getLogger()).parse({"verbose": False})
+    assert list(df["tag"]) == ["motel", "discotheque"] and list(df["source_event"].unique()) == ["image"]
@@ -0,0 +1,58 @@
+#! python
+# ===============LICENSE_START=======================================================
+# metadata-flatten-extractor Apache-2.0
+# ===================================================================================
+# Copyright (C) 2017-2020 AT&T Intellectual Property. All rights reserved.
+# ===================================================================================
+# This software file is distributed by AT&T 
+# under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# This file is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============LICENSE_END=========================================================
+# -*- coding: utf-8 -*-
+"""
+registry tests
+"""
+
+import os
+from os import path
+
+
+def test_registry(tmp_path):
+    import subprocess
+    import sys
+    from contentai_metadata_flatten import generators, parsers, registry, json_backend
+
+    # shipped manifest must match the modules and their types (rebuild with `python -m contentai_metadata_flatten.registry`)
+    assert json_backend.load_file(registry.PATH_MANIFEST) == registry.build_manifest([parsers.REGISTRY, generators.REGISTRY])
+    assert parsers.get_by_name("dsai_places")[0]['obj'].__module__ == "contentai_metadata_flatten.parsers.dsai_places"
+
+    # only requested modules are imported
+    code = "import sys; from contentai_metadata_flatten import parsers, generators; " \
+        "parsers.get_by_name('yolo3'); generators.get_by_type('csv'); " \
+        "print(sorted(x.split('.')[-1] for x in sys.modules if x.startswith(('contentai_metadata_flatten.parsers.', 'contentai_metadata_flatten.generators.'))))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == str(sorted(["yolo3"] + [x['name'] for x in generators.REGISTRY.entries() if 'csv' in x['types']]))
+
+    # modules missing from the manifest are still found
+    registry_empty = registry.Registry(parsers.__name__, parsers.__path__, "Parser", path_manifest="missing.json")
+    assert [x['name'] for x in registry_empty.get_by_type('moderation')] == [x['name'] for x in parsers.get_by_type('moderation')]
+
+    # default generators without optional pyarrow skip the parquet outputs (blocked from import)
+    dir_temp = str(tmp_path)
+    os.makedirs(path.join(dir_temp, "ibm_max_audio_classifier"))
+    with open(path.join(dir_temp, "ibm_max_audio_classifier", "data.json"), "wt") as f:
+        f.write('{"00:00:01": [{"label": "Music", "probability": 0.5, "label_id": "/m/04rlf"}]}')
+    code = "import sys; sys.modules['pyarrow'] = None; from contentai_metadata_flatten.main import flatten; " \
+        "from contentai_metadata_flatten import generators; " \
+        f"result = flatten({{'path_content': {dir_temp!r}, 'path_result': {path.join(dir_temp, 'out')!r}}}, args=[]); " \
+        "print(len(result['data']), sorted(x['name'] for x in generators.get_by_name()))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip().split("\n")[-1] == "1 " + str(sorted(x['name'] for x in generators.get_by_name() if 'parquet' not in x['name']))